@@ -34,7 +34,7 @@ SYNOPSIS
  from nameutils import (
      namecase, gnamecase, fnamecase, namecase_exception,
      namesplit, nameparts, namesplit_exception, namejoin,
-     nametrim, normalize
+     nametrim, normalize, NameUtils
  )
 
  # Case functions
@@ -56,17 +56,79 @@ SYNOPSIS
 
  namesplit_exception("Bryant Smith, Denise") # Multi-name family names
 
+ # Exceptions added all at once (the rejected ones are returned)
+
+ rejected = namecase_exception_many(exceptions) # From any iterable
+ rejected = namecase_exception_many('case_exceptions.csv') # Or from a file
+ rejected = namesplit_exception_many('split_exceptions.txt')
+
+ # Individual and split exceptions kept in a file rather than in memory
+
+ exception_store('exceptions.db')
+
+ # Exceptions from files that are reloaded whenever the files change
+
+ reloader = exception_reloader(['case_exceptions.txt'], ['split_exceptions.txt'])
+ stats = reloader.stats()
+
+ # The data and exceptions saved for fast loading in other processes
+
+ snapshot_save('nameutils.snapshot')
+ snapshot_load('nameutils.snapshot') # Returns 0 if missing or stale
+
+ # Results kept for the most recently used names
+
+ result_cache(10000)
+ result_cache(10000, 'results.db') # Kept for other processes and later runs
+ stats = result_cache_stats()
+
+ # Warming up (before the first names), with results from a previous run
+
+ result_cache_save('results.tsv')
+ warmup('results.tsv', 10) # Or a list of names, most frequent first
+ warmup(freeze=True) # Before forking workers (so they share the data)
+
+ # Invalidations (for application caches of results)
+
+ invalidation_listen(lambda keys: print(keys)) # None means everything
+ keys = invalidation_keys(name, result)
+
  full_name = namejoin(family_name, given_names)
 
+ # Batch functions (repeated names are only processed once)
+
+ full_names = namecase_many(full_names)
+ full_names = namesplit_many(full_names)
+ parts = nameparts_many(full_names)
+ full_names = namesplit_many(full_names, processes=0) # One process per CPU
+
  # Trim function
 
  name = nametrim(name)
 
+ # Exception lookup keys
+
+ keys = kc_many(names)
+
  # Unicode normalization of internal data (default is NFC)
 
+ normalize('NFD')
  import unicodedata
  normalize(lambda s: unicodedata.normalize('NFD', s)))
 
+ # Engines with their own exceptions and normalization (the functions
+ # above use a default engine)
+
+ engine = NameUtils()
+ engine.namecase_exception("MacTenant")
+ full_name = engine.namesplit(full_name)
+ tenant = engine.overlay() # Shares the engine's data and exceptions
+ tenant.namecase_exception("MacOther")
+
+ # Regular expression compilation statistics
+
+ stats = nameutils_re_stats()
+
 DESCRIPTION
 ===========
 
@@ -180,6 +242,17 @@ FUNCTIONS
 
    namecase_exception("DiBona, John")
 
+  Family-wide exceptions are looked up word by word (and can contain more
+  than one word), so having tens of thousands of them doesn't slow things
+  down, and adding more of them is cheap. Like individual exceptions, they
+  match names containing any apostrophe-like or hyphen-like characters.
+
+  Exceptions can be added (by this function or *namesplit_exception()*)
+  while other threads are using the other functions. The new exceptions are
+  built separately, and replace the old ones all at once, so each call uses
+  either the old exceptions or the new ones (never a partial update) without
+  having to wait for a lock.
+
   Returns 1 if the exception was successfully added. Returns 0 otherwise. The
   only reason for a failure is if the supplied exception is undefined or
   empty.
@@ -253,6 +326,205 @@ FUNCTIONS
   only reason for a failure is if the supplied exception does not contain a
   comma.
 
+**rejected = namecase_exception_many(exceptions)**
+  Like *namecase_exception()* but adds any number of exceptions at once
+  (which is much faster than adding them one at a time). The ``exceptions``
+  argument is either an iterable of exceptions, or the name of a UTF-8 file
+  containing them. A file contains one exception per line, or, if its name
+  ends in ``.csv`` or ``.tsv``, one per row, either in one column, or with
+  the family name and the given names in two columns. Empty lines and rows,
+  and lines and rows starting with ``#``, are skipped.
+
+  All of the exceptions are checked before any of them are added, and any
+  that can't be added (e.g., empty ones, or ones with more than one comma)
+  are skipped. Returns a list of the skipped exceptions as
+  ``(number, exception)`` tuples, where ``number`` is the exception's line
+  number in the file (or its position in the iterable, counting from 1). The
+  list is empty if all of the exceptions were added.
+
+**rejected = namesplit_exception_many(exceptions)**
+  Like *namesplit_exception()* but adds any number of exceptions at once,
+  from an iterable or a file, in the same way as
+  *namecase_exception_many()*. Exceptions without exactly one comma are
+  skipped.
+
+**exception_store(filename)**
+  Keeps the individual case exceptions and the split exceptions in the SQLite
+  database file with the supplied name (which is created if necessary),
+  rather than in memory. Any that were already added are added to the file,
+  and any that are added later are added to it as well, so the file keeps
+  them for next time. This is useful when there are millions of them. Only a
+  small summary of them (a Bloom filter, about 10 bits each) is kept in
+  memory, so names without any such exceptions (i.e., most names) are
+  handled without reading the file. The file is read once when the store is
+  first used, to build the summary. Family-wide case exceptions are still
+  kept in memory.
+
+  Returns 1, or 0 if this is an overlay engine (see *overlay()*). An overlay
+  engine uses its engine's store, but its own exceptions are kept in memory.
+  Normalizing an engine (see *normalize()*) after this copies the exceptions
+  in the file back into memory, so normalize first. Like the exceptions in
+  memory, each function call sees the store as it was when the call started
+  (see *NameUtils()*). Several engines or processes can use the same file,
+  but exceptions that one of them adds or removes aren't seen by the others
+  until they call *exception_store()* again, or until their reloader (see
+  *exception_reloader()*, which can have no files) next checks its files.
+  Exceptions that are replaced or removed are kept in the file (but not
+  used), because other processes can still be seeing them.
+
+**reloader = exception_reloader([case_files][, split_files][, interval])**
+  Adds the case exceptions in the files named in the ``case_files`` list, and
+  the split exceptions in the files named in the ``split_files`` list (in the
+  formats accepted by *namecase_exception_many()*), and then checks the files
+  every ``interval`` seconds (default 1), in a background thread. When any of
+  the files change (i.e., their modification time, inode, or size), they are
+  all read again, and their exceptions replace the ones that were added from
+  them before (exceptions that were added in other ways, before or after the
+  reloader was started, are kept). This is useful for exceptions that are maintained
+  in files (e.g., in version control), because there's no need to restart
+  anything when they change. Each check also lets the engine's store (if any,
+  see *exception_store()*) see the exceptions that other engines or processes
+  have added to its file, or removed from it.
+
+  The files are read without making any other threads wait, and the new
+  exceptions are then put in place all at once (see *NameUtils()*). If a file
+  can't be read, the exceptions are left as they were. When a line is
+  removed from a file, its exception is removed (including from an
+  *exception_store()*), and if it replaced an exception that was added in
+  some other way, that exception is put back. An exception that was added
+  in some other way on top of one from a file is kept until the file next
+  changes it. Cached results (see *result_cache()*) that depend on the
+  exceptions that change are evicted.
+
+  Returns a reloader object. Its ``stats()`` method returns a dict containing
+  the number of times the files have been loaded (``loads``), when they were
+  last loaded (``loaded``, as returned by ``time.time()``), how many seconds
+  that took (``seconds``), a dict of the number of exceptions in each file
+  (``counts``), a dict of the rejected exceptions in each file (``rejected``,
+  see *namecase_exception_many()*), and why the files couldn't be read the
+  last time that they changed (``error``, or ``None``). Its ``check()`` method
+  checks the files straight away (and returns 1 if they were reloaded, or 0
+  otherwise). Its ``stop()`` method stops checking the files. If
+  ``interval`` is ``None``, the files are only checked when ``check()`` is
+  called. Calling *exception_reloader()* again stops the previous reloader,
+  and its files are replaced by the new files.
+
+**snapshot_save(filename)**
+  Saves all of the data (the builtin data, and the data that's derived from
+  it, which is built first if necessary) and all of the exceptions to the
+  file with the supplied name, so that other processes can load it instead
+  of building it again. The file is replaced all at once, so processes that
+  load it at the same time see either the old file or the new file. Returns
+  1 (or raises an exception if the file can't be written).
+
+**snapshot_load(filename)**
+  Replaces the data and the exceptions with those in the file with the
+  supplied name (saved by *snapshot_save()*), which takes a few
+  milliseconds. For engines normalized with NFC (the default) or NFD, the
+  data that's derived from the builtin data is generated when the module is
+  built, so loading a snapshot isn't any quicker than building the data, but
+  it's still quicker than adding many exceptions again. For engines
+  normalized with a function, it's also quicker than building the data when
+  it's first needed. Returns 1 if the file was loaded, or 0 if it doesn't
+  exist, or it's damaged, or it was saved by another version of this module,
+  or with a different normalization (see *normalize()*), in which case
+  nothing changes (so it can be saved again). Normalize first, if necessary.
+  Only load files that you trust (they contain pickled Python objects).
+
+**result_cache([size][, filename])**
+  Keeps the results of *namecase()*, *gnamecase()*, *fnamecase()*,
+  *namesplit()*, and *nameparts()* (and of the batch functions) for the
+  ``size`` (default 10000) most recently used names, so that names that are
+  seen again don't need to be processed again. This is worthwhile when a
+  relatively small number of names make up most of the names. Names are
+  looked up after trimming and ignoring case (except for names starting
+  with a Chinese or Korean family name in *namesplit()*), as the results
+  don't depend on them. When exceptions are added (or removed by
+  *exception_reloader()*), only the results that they could affect are
+  removed from the cache (see *invalidation_keys()*). The cache is emptied
+  whenever anything else changes (e.g., when the data is normalized). Calling
+  *result_cache()* again replaces the cache with an empty one, and a
+  ``size`` of 0 removes it. There is no result cache by default.
+
+  If the ``filename`` argument is supplied, the results are also kept in the
+  SQLite database file with that name, so that other processes (including
+  the workers of the batch functions' process pool), and later runs, can use
+  them. Each result in the file is kept with a digest of everything that it
+  depends on (this module's code and data, the normalization, and all of the
+  exceptions), so a result is only used by an engine with the same code,
+  data, normalization, and exceptions. New results are written to the file
+  at the end of each call to the batch functions, after every 1000 new
+  results otherwise, and at exit. Any number of processes can use the file
+  at the same time. Only the results for the 16 newest digests are kept
+  (the older ones are deleted when a new digest is added to the file).
+
+**stats = result_cache_stats()**
+  Returns a dict containing the number of times that a result was found in
+  the result cache (``hits``) or not (``misses``), the number of results
+  that were removed to make room for others (``evictions``), the number of
+  results that were removed because of new exceptions (``invalidations``),
+  the number of results currently cached (``cached``), and the ``size`` of
+  the cache (see *result_cache()*). With a file, it also contains the number
+  of times that a result was found in the file (``file_hits``), the number
+  of results written to the file (``stored``), and the number waiting to be
+  written (``pending``). Returns ``None`` if there is no result cache.
+
+**result_cache_save(filename)**
+  Writes the results in the result cache (most recently used first) to the
+  file with the supplied name, with a digest of everything that they depend
+  on (see *result_cache()*), for *warmup()* in later runs. The file is
+  replaced all at once. Returns the number of results written (0 if there is
+  no result cache).
+
+**warmup([filename][, seconds][, freeze=False])**
+  Loads or builds all of the data that's otherwise loaded or built when
+  first needed (the family name tables, and the data derived from them and
+  from the exceptions), and compiles the regexes that are otherwise compiled
+  when first needed, so that the first names aren't slower than the rest
+  (e.g., before a server starts accepting requests).
+
+  If the ``freeze`` argument is true (it's false by default), all objects
+  are then moved into the garbage collector's permanent generation (see
+  *gc.freeze()*, Python 3.7+), so that the collector doesn't write to them in
+  processes forked from this one. Call it in the parent process of a
+  pre-forking server before the workers are forked, so that the workers
+  share the data (copy-on-write) rather than each building and keeping their
+  own copy.
+
+  If the ``filename`` argument is supplied, the result cache is also filled
+  with the results for the names in that file (starting a result cache with
+  the default size if there isn't one, see *result_cache()*). The file can
+  be a list of names, most frequent first (in the same formats as
+  *namecase_exception_many()* files), whose results are worked out. Or it
+  can be a file of results saved by *result_cache_save()*, which are used as
+  they are if they were saved with the same code, data, normalization, and
+  exceptions, or worked out again otherwise. If the ``seconds`` argument is
+  supplied, no more results are worked out after that many seconds. Returns
+  the number of results that were loaded or worked out.
+
+**invalidation_listen(func)**
+  Calls the supplied function whenever exceptions are added or removed, or
+  the data otherwise changes, so that applications can keep their own
+  caches of results. The function is called with the set of keys of the
+  exceptions that were added or removed (results with any of those keys
+  could have changed, see *invalidation_keys()*), or with ``None`` if any
+  result could have changed (e.g., when the data is normalized). It's
+  called while the data is locked, so it should only update the cache.
+
+**invalidation_unlisten(func)**
+  Stops calling the supplied function (see *invalidation_listen()*).
+
+**keys = invalidation_keys(name[, result[, given_names]])**
+  Returns the set of keys of the result of *namecase()*, *namesplit()*,
+  *nameparts()* etc. for the supplied name (and the supplied result, which
+  must be included if it's a different name, as it is for *namesplit()*, and
+  the given names for *fnamecase()*). These are the *kc_many()* keys of
+  each word, and of the whole name in the "Family_name, Given_names" and
+  "Given_names Family_name" forms. Exceptions only affect the results that
+  have their keys. Family-wide case exceptions have the key of their first
+  word. Individual case exceptions and split exceptions have the keys of
+  the whole name in both forms.
+
 **full_name = namejoin(family_name, given_names)**
   Returns the full name composed of the supplied family name and given names.
 
@@ -263,6 +535,54 @@ FUNCTIONS
   given names and the family name. Note that romanized Chinese, Japanese, and
   Korean names, and Vietnamese names, are always joined in Western name order.
 
+**full_names = namecase_many(full_names[, part[, given_names]][, processes=n][, threads=n])**
+  Like *namecase()* but for any number of names. The ``full_names`` argument
+  can be a list or any other iterable. Returns a list containing the result
+  for each name, in the same order. If ``part`` is ``'family'``, the
+  ``given_names`` argument can be an iterable of the corresponding given
+  names (for individual case exceptions).
+
+  Each distinct name is only processed once, however often it appears, and
+  in whichever letter case or with whatever spacing, so processing large
+  amounts of repetitive data takes time proportional to the number of
+  distinct names rather than the number of names. The results are the same
+  as calling *namecase()* for each name.
+
+  If the ``processes`` argument is supplied, the distinct names are divided
+  into chunks and processed by a pool of that many worker processes (or one
+  per CPU if it's 0), so as to use multiple CPUs. The pool is started when
+  first needed, and each worker process receives a copy of this module's
+  data (including all exceptions, and any normalization) once. The pool is
+  kept for subsequent calls, unless the exceptions or normalization have
+  changed in the meantime, in which case the pool is replaced so that the
+  workers receive the new data. If the processes are started by spawning
+  rather than forking (i.e., not on Linux), the main module of the
+  application must be importable without side effects (see the
+  *multiprocessing* documentation).
+
+  If the ``threads`` argument is supplied instead, the chunks are processed
+  by a pool of that many threads (or one per CPU if it's 0). The threads
+  share this module's data, so there is nothing to copy or start per call.
+  However, most of the work is done by Python code that holds the global
+  interpreter lock (names are too short for the pattern matching to be worth
+  doing without it), so threads are no quicker than no pool unless the
+  interpreter is free-threaded. Use ``processes`` to use more CPUs. Data that
+  is loaded when first needed is loaded safely by whichever thread gets
+  there first (this also applies to application threads calling the other
+  functions), and exceptions can be added while other threads are using the
+  functions (see *namecase_exception()*), but normalizing while other
+  threads are using the functions is not supported.
+
+**full_names = namesplit_many(full_names[, processes=n][, threads=n])**
+  Like *namesplit()* but for any number of names, with the same handling of
+  repeated names, ``processes``, and ``threads`` as *namecase_many()*.
+  Returns a list.
+
+**parts = nameparts_many(full_names[, processes=n][, threads=n])**
+  Like *nameparts()* but for any number of names, with the same handling of
+  repeated names, ``processes``, and ``threads`` as *namecase_many()*.
+  Returns a list of lists.
+
 **name = nametrim(name)**
   Returns the supplied name (given, family, or full name), with any leading
   and trailing spaces removed, any run of multiple spaces replaced with a
@@ -270,6 +590,13 @@ FUNCTIONS
   removed, and with a space added after any comma, if one is not already
   present there.
 
+**keys = kc_many(names)**
+  Returns a list of the keys that the supplied names (given, family, or full
+  names) are looked up by in the case and split exceptions. A key is the
+  casefolded name with any apostrophe-like characters replaced with an ASCII
+  apostrophe, and any hyphen-like characters replaced with an ASCII hyphen.
+  Names with the same key match the same exceptions.
+
 **normalize(func)**
   Normalize this module's internal data using the supplied Unicode
   normalization function reference so as to match your application's choice of
@@ -280,6 +607,52 @@ FUNCTIONS
   code (i.e., NFC). A difference in normalization can lead to false negatives
   and incorrect results when matching names against internal data.
 
+  Instead of a function, the name of a Unicode normalization form can be
+  supplied (e.g., ``'NFD'``). For NFC and NFD, the data that's derived from
+  the builtin data (e.g., the hashes of family names) was generated when the
+  module was built (see ``make derived``), and is loaded rather than being
+  built at runtime, which makes the first call in each process faster. With
+  a function, that data is built at runtime instead.
+
+**engine = NameUtils([normalization])**
+  Returns a new engine. Each engine has its own case and split exceptions,
+  its own normalization, and its own copy of the data that's derived from
+  the builtin data (e.g., compiled regular expressions), which it builds when
+  first needed, and keeps. An engine has all of the above functions as
+  methods (e.g., ``engine.namecase(name)``), and they only use that engine's
+  data. The functions above use a default engine. If the ``normalization``
+  argument is supplied, the engine is normalized with it (see
+  *normalize()*).
+
+  This is useful when different sets of exceptions or different
+  normalizations are needed in the same process (e.g., for each of several
+  customers, or for each of several datasets). Adding exceptions to one
+  engine, or normalizing it, doesn't affect any other engine, so there's no
+  need to replace the exceptions (and rebuild the data) for each customer.
+
+**tenant = engine.overlay()**
+  Returns a new engine that is an overlay of the engine. The overlay uses the
+  engine's data and exceptions without copying them (they're loaded first if
+  necessary). Exceptions that are added to the overlay only apply to the
+  overlay, and only they are stored in it. Exceptions that are added to the
+  engine later apply to the overlay as well. So any number of overlays (e.g.,
+  one per customer) can be made cheaply, each with its own exceptions,
+  without loading or compiling anything again, and without using more memory
+  than its own exceptions need. Overlays are a little slower than other
+  engines, because some exceptions are looked up in two places.
+
+  An overlay uses the engine's normalization (as it was when the overlay was
+  made). If the overlay is normalized, it gets its own copy of the data and
+  exceptions (including the engine's exceptions at the time).
+
+**stats = nameutils_re_stats()**
+  Returns a dict containing the number of regular expressions compiled so
+  far (``compiles``), the number of times that an already compiled regular
+  expression was reused (``hits``), and the number of compiled regular
+  expressions currently cached (``cached``). Regular expressions are
+  compiled once, and only compiled again when *normalize()* or the exception
+  functions change the data that they are constructed from.
+
 EXAMPLES
 ========
 
@@ -477,6 +850,11 @@ has already been done. If necessary, you can normalize this module's
 internal data (with *normalize()*) to match your application's choice of
 normalization.
 
+Names that are entirely ASCII are handled with simpler string operations and
+regular expressions than other names (and without looking for Chinese,
+Japanese, or Korean names), because that's faster. The results are the same
+as they would be otherwise. That's tested.
+
 BUGS
 ====
 
@@ -532,15 +910,23 @@ the Free Software Foundation; either version 3 of the License, or
 
 __docformat__ = 'reStructuredText'
 
-# This is just a module, not a package with submodules
+# This is just a module, not a package with submodules (apart from the big
+# data tables, which it imports when they're first needed)
 
 from .nameutils import \
 (
 	namecase, gnamecase, fnamecase, namecase_exception,
 	namesplit, nameparts, namesplit_exception, namejoin,
-	nametrim, normalize,
-
-	nameutils_reset_data # Undocumented, for test coverage purposes only
+	namecase_exception_many, namesplit_exception_many, exception_store,
+	exception_reloader, snapshot_save, snapshot_load,
+	result_cache, result_cache_stats, result_cache_save, warmup,
+	invalidation_listen, invalidation_unlisten, invalidation_keys,
+	namecase_many, namesplit_many, nameparts_many,
+	nametrim, kc_many, normalize, nameutils_re_stats, NameUtils,
+
+	nameutils_reset_data, # Undocumented, for test coverage purposes only
+	nameutils_ascii_fast_path, # Undocumented, for testing purposes only
+	nameutils_word_cache # Undocumented, for testing purposes only
 )
 
 # vi:set ts=4 sw=4:
@@ -0,0 +1,247 @@
+# nameutils - Identify given/family names and capitalize correctly
+# https://raf.org/nameutils
+# https://github.com/rafmod/nameutils
+# https://codeberg.org/rafmod/nameutils
+#
+# Copyright (C) 2023-2025 raf <raf@raf.org>
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+# 20250708 raf <raf@raf.org>
+
+# The data derived from the builtin data for engines normalized with NFC.
+# Generated by make derived (see derived_write()). Do not edit.
+
+split_starter = dict.fromkeys(
+(
+	'de', "de'", 'del', 'dels', 'dela', 'della', 'delle', 'dal', 'dalla', 'degli', 'di', 'da',
+	'du', 'do', 'dos', 'das', 'le', 'la', 'li', 'lo', 'y', 'i', 'van', 'von',
+	'zu', 'der', 'ter', 'den', 'af', 'av', 'til', 'el', 'al', 'ibn', 'bin', 'ben',
+	'bat', 'bint', 'binti', 'binte', 'mibeit', 'mimishpachat', 'of', 'o', 'ó', 'ni', 'ní', 'mac',
+	'nic', 'ua', 'bean', 'ui', 'uí', 'mhic', 'ap', 'ab', 'ferch', 'verch', 'san', 'santa',
+	'santos', 'st', 'st.', 'ste', 'ste.', 'ka', 'te',
+), 1)
+
+split_starter_re = \
+	"(?:de|de'|del|dels|dela|della|delle|dal|dalla|degli|di|da|du|do|dos|das|le|la|li|lo|y|i|van|von|zu|der|ter|den|af|av|til|el|al|ibn|bin|ben|bat|bint|binti|binte|mibeit|mimishpachat|of|o|ó|ni|ní|mac|nic|ua|bean|ui|uí|mhic|ap|ab|ferch|verch|san|santa|santos|st|st.|ste|ste.|ka|te)"
+
+family_names_ck_roman = dict.fromkeys(
+(
+	'wáng', 'wang', 'wong', 'vang', 'ông', 'bong', 'heng', 'vòng', 'uōng', 'waon', 'whang', 'vương',
+	'ong', 'ō', 'lǐ', 'lei', 'lee', 'ly', 'lí', 'lî', 'lý', 'ri', 'yi', 'rhee',
+	'dy', 'dee', 'sy', 'zhāng', 'chang', 'zoeng', 'cheung', 'cheong', 'chong', 'tiuⁿ', 'tioⁿ', 'teo',
+	'teoh', 'tio', 'chông', 'tong', 'thong', 'tsan', 'tzan', 'zan', 'trương', 'jang', 'chō', 'tiu',
+	'tiong', 'sutiono', 'tjong', 'liú', 'liu', 'lau', 'lao', 'lou', 'lưu', 'lâu', 'low', 'liù',
+	'liew', 'lew', 'lieu', 'lio', 'yu', 'yoo', 'ryū', 'chén', "ch'en", 'can', 'chan', 'chun',
+	'chean', 'chin', 'tân', 'tan', 'tang', 'ting', 'chhìn', 'thín', 'thin', 'zen', 'tchen', 'trần',
+	'jin', 'tantoco', 'tanteksi', 'yáng', 'yang', 'joeng', 'yeung', 'yeong', 'ieong', 'young', 'iûⁿ', 'iôⁿ',
+	'yeoh', 'yeo', 'yo', 'nyo', 'yòng', 'yong', 'iōng', 'yan', 'ian', 'dương', 'yung', 'yana',
+	'yongco', 'yuchengco', 'yō', 'huáng', 'huang', 'vong', 'n̂g', 'ûiⁿ', 'ng', 'ung', 'ooi', 'uy',
+	'wee', 'fong', 'hoàng', 'huỳnh', 'hwang', 'kō', 'zhào', 'chao', 'ziu', 'chiu', 'chu', 'chio',
+	'jiu', 'tiō', 'tiǒ', 'chhau', 'chau', 'thèu', 'cheu', 'chew', 'zau', 'zo', 'triệu', 'jo',
+	'wú', 'wu', 'eng', 'gô͘', 'ngô͘', 'goh', 'ǹg', 'woo', 'ngô', 'oh', 'go', 'kure',
+	'ngo', 'gozon', 'gozum', 'cinco', 'gochian', 'gokongwei', 'gosiengfiao', 'zhōu', 'chou', 'chow', 'jao', 'jew',
+	'chiû', 'chiew', 'tseu', 'tzo', 'châu', 'ju', 'shū', 'joe', 'xú', 'hsü', 'ceoi', 'tsui',
+	'choi', 'chui', 'tsua', 'chhî', 'sîr', 'chee', 'cher', 'swee', 'ji', 'jee', 'chhì', 'chi',
+	'chhié', 'zhi', 'zee', 'zi', 'từ', 'seo', 'sho', 'dharmadjie', 'christiadjie', 'sūn', 'sun', 'syun',
+	'suen', 'sng', 'suiⁿ', 'soon', 'sûn', 'sen', 'tôn', 'son', 'suan', 'mǎ', 'ma', 'maa',
+	'mah', 'mar', 'má', 'bé', 'bey', 'beh', 'baey', 'mâ', 'mo', 'mu', 'mã', 'mapua',
+	'ba', 'zhū', 'zyu', 'chue', 'choo', 'chû', 'tu', 'tsy', 'tsyu', 'tzu', 'shu', 'gee',
+	'hú', 'hu', 'vu', 'ô͘', 'ow', 'aw', 'fù', 'foo', 'ū', 'hồ', 'ho', 'ko',
+	'guō', 'kuo', 'gwok', 'kwok', 'kuok', 'koeh', 'keh', 'kerh', 'kueh', 'koay', 'quay', 'kwek',
+	'quek', 'kwik', 'kok', 'koh', 'koq', 'quách', 'gwak', 'kaku', 'que', 'cue', 'quezon', 'quison',
+	'ker', 'kho', 'kue', 'hé', 'hê', 'hoe', 'hô', 'hor', 'hou', 'hò', 'hó', 'hà',
+	'ha', 'lín', 'lin', 'lam', 'lum', 'lîm', 'lim', 'lìm', 'līm', 'ling', 'lâm', 'im',
+	'rim', 'rin', 'hayashi', 'gāo', 'kao', 'gou', 'kou', 'ko͘', 'kor', 'kô', 'kau', 'koo',
+	'gau', 'cao', 'caw', 'co', 'gao', 'luó', 'law', 'loh', 'lowe', 'lor', 'lô', 'lò',
+	'lō', 'lu', 'loo', 'na', 'ra', 'zhèng', 'cheng', 'zeng', 'cheang', 'chiang', 'tēⁿ', 'tīⁿ',
+	'tìⁿ', 'tēeⁿ', 'tay', 'teh', 'chhang', 'thàng', 'zung', 'trịnh', 'jeong', 'tei', 'ty', 'tee',
+	'liáng', 'liang', 'loeng', 'leung', 'leong', 'lang', 'leng', 'niû', 'niô͘', 'neo', 'liòng', 'liōng',
+	'lian', 'lương', 'ryang', 'liong', 'niu', 'ryō', 'xiè', 'hsieh', 'ze', 'tse', 'che', 'chiā',
+	'siā', 'sià', 'chia', 'cheah', 'seah', 'tshia', 'chhià', 'zhia', 'zia', 'tạ', 'sa', 'sha',
+	'tsia', 'sia', 'saa', 'sese', 'shie', 'sòng', 'sung', 'sàng', 'song', 'soong', 'sūng', 'tống',
+	'sō', 'songco', 'táng', "t'ang", 'tn̂g', 'tông', 'tng', 'thòng', 'thóng', 'daon', 'daan', 'đường',
+	'dang', 'teng', 'tō', 'xǔ', 'heoi', 'hui', 'hoi', 'khó͘', 'khoh', 'hí', 'hee', 'siu',
+	'syu', 'shiu', 'hái', 'hứa', 'heo', 'kyo', 'kaw', 'cojuangco', 'dèng', 'theng', 'tēng', 'tèng',
+	'then', 'ten', 'thèn', 'đặng', 'deung', 'deang', 'tengco', 'tangco', 'hán', 'han', 'hon', 'hân',
+	'hang', 'hòn', 'hón', 'ghoe', 'reu', 'hàn', 'kan', 'féng', 'feng', 'fung', 'pâng', 'pang',
+	'fùng', 'phùng', 'foong', 'fūng', 'pung', 'hō', 'pangco', 'cáo', "ts'ao", 'cou', 'cho', 'tso',
+	'chaw', 'chô', 'chô͘', 'tshò', 'tshàu', 'chhóu', 'tào', 'péng', "p'eng", 'banh', 'phêⁿ', 'phîⁿ',
+	'phêeⁿ', 'peh', 'phe', 'phàng', 'phang', 'pháng', 'ban', 'bành', 'paeng', 'beng', 'pay', 'zēng',
+	'tseng', 'zang', 'tsang', 'dong', 'tsên', 'chen', 'tsen', 'tzen', 'tsung', 'tăng', 'jeung', 'tjan',
+	'tzeng', 'xiāo', 'hsiao', 'sio', 'siau', 'seow', 'siow', 'siâu', 'siew', 'siaw', 'sieu', 'shio',
+	'tiêu', 'so', 'siao', 'syaw', 'shau', 'shao', 'shaw', 'shō', 'tián', "t'ien", 'tin', 'tiân',
+	'thièn', 'thien', 'thién', 'điền', 'jeon', 'tian', 'tien', 'dǒng', 'tung', 'dung', 'tóng', 'túng',
+	'tûng', 'ton', 'toong', 'đổng', 'pān', "p'an", 'pun', 'poon', 'phoaⁿ', 'phua', 'phân', 'pan',
+	'phan', 'phon', 'phoe', 'poe', 'pua', 'yuán', 'yüan', 'jyun', 'yuen', 'wan', 'oân', 'yèn',
+	'yen', 'iōn', 'yoe', 'yeu', 'viên', 'won', 'en', 'cài', "ts'ai", 'coi', 'choy', 'tsoi',
+	'toy', 'chhoà', 'chua', 'chhai', 'chai', 'chhói', 'tsa', 'thái', 'sái', 'chae', 'sai', 'chuah',
+	'cua', 'choa', 'tsai', 'tsay', 'jiǎng', 'tseung', 'chiúⁿ', 'chióⁿ', 'cheoh', 'chioh', 'tsiòng', 'chiông',
+	'cian', 'jian', 'tưởng', 'chung', 'yú', 'yü', 'jyu', 'yue', 'u', 'yee', 'î', 'û',
+	'îr', 'ee', 'eu', 'yì', 'uī', 'dư', 'ie', 'iman', 'oe', 'sū', 'su', 'sou',
+	'so͘', 'soh', 'sû', 'soo', 'tô', 'solon', 'lǚ', 'lü', 'leoi', 'lui', 'loi', 'lū',
+	'lī', 'lǐr', 'leu', 'ler', 'liê', 'lữ', 'lã', 'ryeo', 'ryo', 'luy', 'dīng', 'ding',
+	'tén', 'tiang', 'đinh', 'rén', 'jen', 'jam', 'yam', 'iam', 'yum', 'jîm', 'jim', 'ngim',
+	'yim', 'nìm', 'nin', 'nying', 'nhiệm', 'nhậm', 'lú', 'lô͘', 'lù', 'lư', 'no', 'ro',
+	'yáo', 'yao', 'yiu', 'yeow', 'io', 'iu', 'iâu', 'yào', 'yow', 'iēu', 'yau', 'diêu',
+	'shěn', 'shen', 'sam', 'shum', 'sum', 'sham', 'sím', 'sim', 'shím', 'thẩm', 'trầm', 'shim',
+	'shin', 'zhōng', 'chiong', 'chûng', 'tson', 'tzon', 'jong', 'jiāng', 'goeng', 'keung', 'geung', 'keong',
+	'khiang', 'khiong', 'khiuⁿ', 'kiang', 'kiông', 'kiong', 'khương', 'kang', 'kyō', 'cuī', "ts'ui", 'chhui',
+	'chwee', 'tshûi', 'chooi', 'chhoi', 'tsoe', 'thôi', 'tseui', 'tán', "t'an", 'taam', 'tam', 'tom',
+	'ham', 'hom', 'thâm', 'tham', 'thàm', 'thóm', 'dae', 'đàm', 'dam', 'luk', 'lok', 'lio̍k',
+	'loke', 'lek', 'liu̍k', 'liuk', 'loq', 'lục', 'yuk', 'ryuk', 'riku', 'diokno', 'fàn', 'fan',
+	'faan', 'hoān', 'hoǎn', 'hwan', 'hoan', 'fam', 've', 'vae', 'phạm', 'beom', 'juan', 'wāng',
+	'óng', 'uong', 'uông', 'ang', 'liào', 'liao', 'leow', 'liāu', 'liàu', 'liau', 'liow', 'lièu',
+	'liêu', 'liệu', 'shí', 'shih', 'sek', 'shek', 'seac', 'seak', 'chio̍h', 'sha̍k', 'sak', 'shak',
+	'zah', 'zaq', 'thạch', 'seok', 'seki', 'jīn', 'gam', 'kam', 'gum', 'kim', 'kîm', 'cin',
+	'kin', 'wéi', 'wei', 'wai', 'vai', 'ûi', 'úi', 'vúi', 'vì', 'wooi', 'we', 'vi',
+	'wi', 'jiǎ', 'gaa', 'ga', 'ká', 'kée', 'kia', 'kâ', 'cia', 'jia', 'giả', 'xià',
+	'hsia', 'haa', 'hē', 'hā', 'hēe', 'hah', 'hay', 'gho', 'ya', 'wo', 'hạ', 'fu',
+	'pò͘', 'poh', 'phó', 'bu', 'po', 'fāng', 'fang', 'hong', 'png', 'puiⁿ', 'fông', 'faon',
+	'phương', 'bang', 'zōu', 'tsou', 'cho͘', 'choh', 'tsêu', 'tzeu', 'xióng', 'hsiung', 'hung', 'hîm',
+	'him', 'yùng', 'yoong', 'hiūng', 'yon', 'hùng', 'yū', 'bái', 'pai', 'baak', 'pak', 'bahk',
+	'pe̍h', 'pe̍k', 'pha̍k', 'phak', 'bah', 'baq', 'bạch', 'baek', 'haku', 'bo', 'mèng', 'meng',
+	'maang', 'mang', 'bēng', 'bèng', 'men', 'màng', 'man', 'mạnh', 'maeng', 'mō', 'qín', "ch'in",
+	'ceon', 'tseun', 'tseon', 'chon', 'chîn', 'ching', 'tshìn', 'chhín', 'zhin', 'zin', 'tần', 'qiū',
+	"ch'iu", 'jau', 'iao', 'iau', 'khu', 'khoo', 'khiû', 'hiû', 'hew', 'khew', 'khiu', 'chieu',
+	'khâu', 'gu', 'kyū', 'hiew', 'coo', 'chiou', 'hóu', 'hau', 'hao', 'hô͘', 'hâu', 'kâu',
+	'hoh', 'hèu', 'héu', 'gheu', 'roe', 'hầu', 'gong', 'kong', 'kông', 'kaon', 'giang', 'gang',
+	'yǐn', 'yin', 'ún', 'ín', 'un', 'eun', 'eung', 'yún', 'yoon', 'doãn', 'yun', 'in',
+	'unson', 'xuē', 'hsüeh', 'sit', 'sih', 'siet', 'set', 'siot', 'siq', 'tiết', 'seol', 'setsu',
+	'yán', 'giâm', 'ngiam', 'ngiàm', 'iēm', 'gni', 'nyi', 'diêm', 'yeom', 'duàn', 'tuan', 'dyun',
+	'tuen', 'tun', 'toān', 'toàn', 'teung', 'thon', 'thòn', 'doe', 'deu', 'đoàn', 'dan', 'léi',
+	'lûi', 'lùi', 'looi', 'lōi', 'lae', 'lôi', 'noe', 'rai', 'hoisan', 'lóng', 'lung', 'loong',
+	'long', 'lêng', 'liông', 'liùng', 'liūng', 'lon', 'ryong', 'lai', 'lê', 'loy', 'lì', 'lài',
+	'rei', 'shǐ', 'si', 'sze', 'sú', 'sír', 'ser', 'seu', 'sṳ́', 'sî', 'sử', 'shi',
+	'táo', "t'ao", 'tou', 'to', 'tao', 'tow', 'tô͘', 'thô', 'thàu', 'thò', 'thóu', 'dau',
+	'đào', 'hè', 'fo', 'máo', 'mao', 'mou', 'mô͘', 'mor', 'mô', 'mâu', 'mōu', 'mau',
+	'bō', 'hǎo', 'hok', 'hak', 'khok', 'heh', 'heq', 'hác', 'gù', 'ku', 'goo', 'kò͘',
+	'kū', 'cố', 'gōng', 'kung', 'gung', 'kwong', 'kéng', 'kiûng', 'kiung', 'cion', 'jiong', 'jun',
+	'cung', 'shào', 'siō', 'siāu', 'siàu', 'sioh', 'sau', 'sèu', 'thiệu', 'wàn', 'maan', 'bān',
+	'bàn', 'buang', 'màn', 'mae', 'me', 'vạn', 'wǔ', 'bú', 'boo', 'vú', 'moo', 'mú',
+	'ghu', 'vũ', 'võ', 'qián', "ch'ien", 'chîⁿ', 'tshièn', 'chhién', 'tiền', 'dài', 'tai', 'daai',
+	'tè', 'tèr', 'thài', 'ta', 'đái', 'đới', 'ngiēm', 'nghiêm', 'eom', 'gen', 'gan', 'ōu',
+	'ou', 'au', 'mò', 'mok', 'bo̍h', 'bo̍k', 'mo̍k', 'moh', 'moq', 'mạc', 'baku', 'kǒng',
+	"k'ung", 'khóng', 'khong', 'khúng', 'koong', 'khoong', 'khon', 'khổng', 'consunji', 'xiàng', 'hsiang', 'hoeng',
+	'heung', 'hiòng', 'hiàng', 'hiang', 'hióng', 'shian', 'hian', 'hưởng', 'hyang', '향', 'cháng', "ch'ang",
+	'soeng', 'sheung', 'siông', 'siâng', 'seoh', 'sōng', 'thường', 'sang', 'thōng', 'tāng', 'thng', 'thông',
+	'thaon', 'thaan', 'thang', 'kāng', 'khng', 'khang', 'không', 'khaon', 'khaan', 'yik', 'e̍k', 'ia̍k',
+	'ek', 'yit', 'iak', 'yih', 'yiq', 'dịch', 'eki', 'qiáo', "ch'iao", 'kiu', 'kiâu', 'keow',
+	'kiao', 'khiàu', 'kiew', 'khiew', 'khiéu', 'jiau', 'djio', 'jioh', 'kiều', 'kē', "k'o", 'koa',
+	'quah', 'kwa', 'khô', 'ko´', 'kha', 'kua', 'coson', 'laai', 'lay', 'lōa', 'lòa', 'nai',
+	'lại', '뢰', 'wén', 'wen', 'bûn', 'boon', 'vùn', 'voon', 'mūn', 'ven', 'vung', 'văn',
+	'moon', 'bun', 'shī', 'xi', 'soa', 'sua', 'sṳ̂', 'sii´', 'thí', 'see', 'hóng', 'huhng',
+	'âng', 'hông', 'ghon', 'hồng', 'hòng', 'xīn', 'hsin', 'sîn', 'sin', 'xin´', 'sîng', 'sing',
+	'singson', 'zhuāng', 'chuang', 'zong', 'tsong', 'chng', 'zong´', 'tsaon', 'tsaan', 'tzaon', 'trang', 'đồ',
+	'dưa', 'an', 'ao', 'au_yeung', 'bai', 'bao', 'bau', 'bi', 'cai', 'cha', 'cham', 'chern',
+	'chiao', 'chien', 'chim', 'cong', 'cui', 'dai', 'dea', 'deng', 'doo', 'duan', 'fei', 'fok',
+	'ge', 'geng', 'guan', 'guo', 'hai', 'he', 'hoo', 'hsi', 'hsu', 'hsueh', 'hua', 'huie',
+	'hum', 'huo', 'hy', 'ing', 'ip', 'jan', 'jeng', 'jiang', 'jiao', 'jing', 'joo', 'jou',
+	'jow', 'jue', 'jung', 'ke', 'keng', 'king', 'kook', 'kuan', 'kuang', 'kuk', 'kwan', 'kwock',
+	'kwon', 'lan', 'liaw', 'lien', 'liou', 'lua', 'luo', 'mai', 'mak', 'mei', 'miao', 'min',
+	'ming', 'miu', 'mon', 'moy', 'mui', 'ngai', 'ngan', 'nie', 'ning', 'on', 'ou_yang', 'owyang',
+	'pao', 'pau', 'pei', 'peng', 'pi', 'ping', 'pon', 'pong', 'pu', 'qi', 'qian', 'qiao',
+	'qin', 'qiu', 'qu', 'quan', 'rao', 'ren', 'rong', 'ruan', 'seto', 'shan', 'shang', 'sheng',
+	'sheu', 'shiau', 'shieh', 'shing', 'shy', 'shyu', 'sieh', 'situ', 'soo_hoo', 'sui', 'szeto', 'toh',
+	'tsao', 'tsu', 'wah', 'weng', 'wing', 'woon', 'xia', 'xiang', 'xiao', 'xie', 'xin', 'xing',
+	'xiong', 'xu', 'xue', 'yap', 'yaw', 'ye', 'yeh', 'yep', 'ying', 'yip', 'you', 'yuan',
+	'zha', 'zhan', 'zhang', 'zhao', 'zhen', 'zheng', 'zhong', 'zhou', 'zhu', 'zhuang', 'zhuo', 'zou',
+	'kar', 'gar', 'kah', 'gah', 'ca', 'cah', 'car', 'gahn', 'kahn', 'gal', 'kal', 'karl',
+	'garl', 'gahl', 'kahl', 'cahl', 'carl', 'cal', 'kahm', 'gahm', 'cam', 'kahng', 'gyeon', 'kyŏn',
+	'kyun', 'kyeon', 'kyoun', 'kyon', 'gyeong', 'kyŏng', 'kyung', 'kyoung', 'kyeong', 'kyong', 'gye', 'kye',
+	'kyeh', 'kay', 'kie', 'kae', 'gae', 'gok', 'kog', 'gog', 'cock', 'gogh', 'cough', 'kohng',
+	'koung', 'goung', 'kwak', 'kwag', 'kwack', 'gwag', 'koak', 'kuark', 'quack', 'quark', 'gwan', 'gyo',
+	'kyoh', 'gyoh', 'kuh', 'guk', 'gook', 'kug', 'gug', 'cook', 'kwoong', 'kwŏk', 'kwog', 'gwog',
+	'quock', 'gwon', 'kwŏn', 'kweon', 'kwun', 'geun', 'kŭn', 'keun', 'kuen', 'guen', 'geum', 'kŭm',
+	'keum', 'kum', 'guem', 'kuem', 'gi', 'ki', 'kee', 'key', 'ky', 'khee', 'gil', 'kil',
+	'gill', 'khil', 'keel', 'kihl', 'kiehl', 'kill', 'gim', 'ghim', 'kym', 'keem', 'gym', 'nah',
+	'rha', 'rah', 'nan', 'ran', 'nahn', 'rahn', 'nhan', 'rhan', 'lahn', 'nam', 'nahm', 'nham',
+	'narm', 'namgung', 'namkung', 'namgoong', 'namkoong', 'namkuhng', 'namguhng', 'nang', 'rang', 'nahng', 'nae', 'nay',
+	'nea', 'noh', 'roh', 'nau', 'rau', 'roi', 'noi', 'dahn', 'than', 'dham', 'dahm', 'tahm',
+	'dhang', 'tae', 'day', 'tea', 'dho', 'doh', 'toe', 'dokgo', 'tokko', 'dokko', 'toko', 'doko',
+	'dockko', 'dogko', 'togko', 'tokgo', 'don', 'dohn', 'tohn', 'dhong', 'dongbang', 'tongbang', 'tongpang', 'dongpang',
+	'dou', 'too', 'deungjeong', 'ryuh', 'ryu', 'ryou', 'rou', 'ryoo', 'yuh', 'ree', 'leem', 'mann',
+	'mahn', 'mangjeol', 'mangjŏl', 'mangjul', 'mangjuhl', 'mangjoul', 'may', 'mea', 'maing', 'meang', 'myeong', 'myŏng',
+	'myung', 'myoung', 'myong', 'moe', 'mock', 'mog', 'mork', 'myo', 'myoh', 'mio', 'mubon', 'muk',
+	'mook', 'mun', 'muhn', 'mi', 'mee', 'mih', 'meeh', 'minn', 'mihn', 'mean', 'bak', 'park',
+	'back', 'pahk', 'bahn', 'pahn', 'bhan', 'bhang', 'bahng', 'pahng', 'bae', 'pae', 'bea', 'bay',
+	'paek', 'baik', 'paik', 'pack', 'beak', 'beon', 'burn', 'pŏm', 'bum', 'bom', 'peom', 'pum',
+	'puhm', 'buhm', 'byeon', 'pyŏn', 'byun', 'byon', 'pyun', 'byoun', 'pyon', 'pyoun', 'pyeon', 'boh',
+	'bok', 'pok', 'pock', 'bog', 'pog', 'bock', 'bokho', 'pokho', 'pockhoh', 'boghoh', 'poghoh', 'bockhoh',
+	'bhong', 'bohng', 'pohng', 'bou', 'poo', 'booh', 'buh', 'pou', 'pooh', 'bee', 'pee', 'bih',
+	'bhi', 'pih', 'phi', 'pin', 'been', 'pihn', 'phin', 'bihn', 'pean', 'bing', 'buyeo', 'puyŏ',
+	'sah', 'sar', 'sagong', 'sakong', 'sagoung', 'sakoung', 'sahn', 'sarn', 'sahm', 'sarm', 'sahng', 'sŏ',
+	'suh', 'surh', 'sur', 'seomun', 'sŏmun', 'suhmun', 'suhmoon', 'seomoon', 'somoon', 'sŏk', 'suk', 'sok',
+	'suck', 'such', 'seon', 'sŏn', 'suhn', 'seonu', 'sŏnu', 'sunwoo', 'seonwoo', 'sonu', 'sunoo', 'sunwou',
+	'seonwu', 'sonwu', 'sŏl', 'sul', 'seul', 'sol', 'sull', 'seob', 'sub', 'subb', 'sup', 'seop',
+	'seong', 'sŏng', 'soung', 'shèng', 'sow', 'sohn', 'soun', 'sooh', 'seung', 'sŭng', 'shee', 'sie',
+	'sea', 'shinn', 'sheen', 'seen', 'sinn', 'cynn', 'seem', 'sheem', 'sihm', 'a', 'ah', 'ar',
+	'ahn', 'arn', 'aan', 'ae', 'ay', 'ai', 'ea', 'yah', 'yar', 'lyang', 'eo', 'ŏ',
+	'uh', 'urh', 'eoh', 'eogeum', 'ŏgŭm', 'eokeum', 'okeum', 'okum', 'ukeum', 'ugeum', 'ukum', 'uhgeum',
+	'uhkuem', 'ŏm', 'um', 'uhm', 'oum', 'ohm', 'yŏ', 'ryŏ', 'yoh', 'yeon', 'ryeon', 'yŏn',
+	'ryŏn', 'youn', 'yeun', 'yeoun', 'yuhn', 'ryeom', 'yŏm', 'ryŏm', 'youm', 'yeum', 'yom', 'yeoum',
+	'yeop', 'yŏp', 'yeob', 'youb', 'yub', 'yup', 'yob', 'yŏng', 'awh', 'ok', 'ock', 'ohk',
+	'oak', 'og', 'ohg', 'oag', 'ogh', 'ohn', 'ohnn', 'ohng', 'oung', 'warn', 'lyong', 'wun',
+	'whun', 'wuhn', 'wŏn', 'weon', 'woen', 'wone', 'one', 'worn', 'wie', 'yook', 'youk', 'yug',
+	'yuck', 'yune', 'ŭn', 'ehn', 'enn', 'unn', 'eum', 'ŭm', 'em', 'uem', 'reeh', 'rie',
+	'rhie', 'ihn', 'inn', 'ean', 'rhim', 'eam', 'ja', 'jar', 'jahng', 'jhang', 'chŏn', 'cheon',
+	'jeom', 'chŏm', 'jum', 'chŏng', 'joung', 'choung', 'je', 'jae', 'jea', 'jei', 'jhe', 'jegal',
+	'chegal', 'jaegal', 'jekal', 'jeagal', 'jikal', 'chekal', 'joh', 'jwa', 'chwa', 'joa', 'zoo', 'chŭng',
+	'jhi', 'jeen', 'gin', "ch'a", 'char', 'chah', 'chahng', "ch'ae", 'chea', 'chay', "ch'ŏn", 'choun',
+	"ch'o", 'choe', "ch'oe", 'chwe', 'chey', "ch'u", 'chyu', 'tak', "t'ak", 'tark', 'tag', 'tack',
+	'tahk', 'tahn', 'tann', "t'ae", 'thae', 'parn', 'pann', "p'aeng", 'paing', 'peang', "p'yŏn", 'pyen',
+	'pyeong', "p'yŏng", 'pyung', 'pyong', 'pyoung', 'pyeng', "p'o", 'pho', 'paul', 'for', 'four', 'pyo',
+	"p'yo", 'phyo', 'pio', 'peo', 'pyoh', 'pyou', "p'ung", 'poong', 'puhng', 'poohng', "p'i", 'phee',
+	'phy', 'fee', 'pil', "p'il", 'phil', 'peel', 'fill', 'feel', 'har', 'hag', 'hahk', 'hahg',
+	'hack', 'hahn', 'hann', 'hanh', 'hahm', 'hamm', 'haam', 'harm', 'hae', 'hea', 'hŏ', 'hur',
+	'huh', 'her', 'heoh', 'hyeon', 'hyŏn', 'hyun', 'hyon', 'hyoun', 'hyeong', 'hyŏng', 'hyung', 'hyoung',
+	'hyong', 'hyeung', 'houng', 'hoong', 'hwa', 'howa', 'hoa', 'wha', 'whong', 'hwangmok', 'whangmock', 'wangmok',
+	'hwangbo', 'hwangpo', 'whangpoh', 'hooh',
+), 1)
+
+family_names_v_roman = dict.fromkeys(
+(
+	'nguyễn', 'nguyen', 'trần', 'tran', 'lê', 'le', 'phạm', 'hoàng', 'hoang', 'huỳnh', 'huynh', 'vũ',
+	'võ', 'vu', 'vo', 'phan', 'trương', 'truong', 'bùi', 'bui', 'đặng', 'dang', 'đỗ', 'do',
+	'ngô', 'ngo', 'hồ', 'dương', 'duong', 'đinh', 'dinh', 'ái', 'an', 'ân', 'bạch', 'bành',
+	'bao', 'biên', 'biện', 'cam', 'cảnh', 'cao', 'cái', 'cát', 'chân', 'châu', 'chiêm', 'chu',
+	'chung', 'chử', 'cổ', 'cù', 'cung', 'củng', 'cừu', 'dịch', 'diệp', 'doãn', 'dũ', 'dung',
+	'dư', 'dữu', 'đái', 'đàm', 'đào', 'đậu', 'điền', 'đoàn', 'đồ', 'đồng', 'đổng', 'đường',
+	'giả', 'giải', 'gia_cát', 'giản', 'giang', 'giáp', 'hà', 'hạ', 'hậ', 'hác', 'hàn', 'hầu',
+	'hình', 'hoa', 'hoắc', 'hoạn', 'hồng', 'hứa', 'hướng', 'hy', 'kha', 'khâu', 'khổng', 'khuất',
+	'kiều', 'kim', 'kỳ', 'kỷ', 'la', 'lạc', 'lại', 'lam', 'lăng', 'lãnh', 'lâm', 'lận',
+	'lệ', 'liên', 'liêu', 'liễu', 'long', 'lôi', 'lục', 'lư', 'lữ', 'lương', 'lưu', 'mã',
+	'mạc', 'mạch', 'mai', 'mạnh', 'mao', 'mẫn', 'miêu', 'minh', 'mông', 'ngân', 'nghê', 'nghiêm',
+	'ngư', 'ngưu', 'nhạc', 'nhan', 'nhâm', 'nhiếp', 'nhiều', 'nhung', 'ninh', 'nông', 'ôn', 'ổn',
+	'ông', 'phí', 'phó', 'phong', 'phòng', 'phù', 'phùng', 'phương', 'quách', 'quan', 'quản', 'quang',
+	'quảng', 'quế', 'quyền', 'sài', 'sầm', 'sử', 'tạ', 'tào', 'tăng', 'tân', 'tần', 'tất',
+	'tề', 'thạch', 'thai', 'thái', 'thang', 'thành', 'thảo', 'thân', 'thi', 'thích', 'thiện', 'thiệu',
+	'thôi', 'thủy', 'thư', 'thường', 'tiền', 'tiết', 'tiêu', 'tô', 'tôn', 'tôn_thất', 'tông', 'tống',
+	'trác', 'trạch', 'trại', 'trang', 'trầm', 'trâu', 'trì', 'triệu', 'trịnh', 'từ', 'tư_mã', 'tưởng',
+	'úc', 'ứng', 'vạn', 'văn', 'vân', 'vi', 'vĩnh', 'vũ_văn', 'vương', 'vưu', 'xà', 'xầm',
+	'xế', 'yên', 'yến',
+), 1)
+
+snapshot_key = \
+	bytes.fromhex('29642963461f802348ba998f44bbe6e9e156d912c5236aa72d93767615bc9cb2')
+
+kc_table = \
+{
+	0x0027: "'", 0x002d: '-', 0x02bb: "'", 0x02bc: "'", 0x058a: '-', 0x05be: '-', 0x1400: '-', 0x1806: '-',
+	0x2010: '-', 0x2011: '-', 0x2012: '-', 0x2013: '-', 0x2014: '-', 0x2015: '-', 0x2019: "'", 0x2e17: '-',
+	0x2e1a: '-', 0x2e3a: '-', 0x2e3b: '-', 0x2e40: '-', 0x2e5d: '-', 0x301c: '-', 0x3030: '-', 0x30a0: '-',
+	0xfe31: '-', 0xfe32: '-', 0xfe58: '-', 0xfe63: '-', 0xff0d: '-', 0x10d6e: '-', 0x10ead: '-',
+}
+
+# vim:set ts=4 sw=4 fenc=utf8:
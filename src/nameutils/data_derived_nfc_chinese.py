@@ -0,0 +1,71 @@
+# nameutils - Identify given/family names and capitalize correctly
+# https://raf.org/nameutils
+# https://github.com/rafmod/nameutils
+# https://codeberg.org/rafmod/nameutils
+#
+# Copyright (C) 2023-2025 raf <raf@raf.org>
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+# 20250708 raf <raf@raf.org>
+
+# The data derived from the builtin data for engines normalized with NFC (Chinese names).
+# Generated by make derived (see derived_write()). Do not edit.
+
+family_names_ck = dict.fromkeys(
+(
+	'王', '李', '張', '张', '劉', '刘', '陳', '陈', '楊', '杨', '黃', '黄',
+	'趙', '赵', '吳', '吴', '周', '徐', '孫', '孙', '馬', '马', '朱', '胡',
+	'郭', '何', '林', '高', '羅', '罗', '鄭', '郑', '梁', '謝', '谢', '宋',
+	'唐', '許', '许', '鄧', '邓', '韓', '韩', '馮', '冯', '曹', '彭', '曾',
+	'蕭', '萧', '田', '董', '潘', '袁', '蔡', '蔣', '蒋', '余', '于', '杜',
+	'葉', '程', '魏', '蘇', '呂', '丁', '任', '盧', '卢', '苏', '吕', '姚',
+	'沈', '鍾', '钟', '姜', '崔', '譚', '谭', '陸', '陆', '范', '汪', '廖',
+	'石', '金', '韋', '韦', '賈', '贾', '夏', '傅', '方', '鄒', '邹', '熊',
+	'白', '孟', '秦', '邱', '侯', '江', '尹', '薛', '閻', '阎', '段', '雷',
+	'龍', '龙', '黎', '史', '陶', '賀', '贺', '毛', '郝', '顧', '顾', '龔',
+	'龚', '邵', '萬', '万', '覃', '武', '錢', '钱', '戴', '嚴', '严', '歐',
+	'欧', '莫', '孔', '向', '常', '湯', '汤', '康', '易', '喬', '乔', '賴',
+	'赖', '文', '施', '洪', '辛', '柯', '莊', '庄', '温', '牛', '樊', '葛',
+	'邢', '安', '齐', '伍', '庞', '颜', '倪', '聂', '章', '鲁', '岳', '翟',
+	'殷', '詹', '申', '耿', '关', '兰', '焦', '俞', '左', '柳', '甘', '祝',
+	'包', '宁', '尚', '符', '舒', '阮', '纪', '梅', '童', '凌', '毕', '单',
+	'季', '裴', '霍', '涂', '成', '苗', '谷', '盛', '曲', '翁', '冉', '骆',
+	'蓝', '路', '游', '靳', '欧阳', '管', '柴', '蒙', '鲍', '华', '喻', '祁',
+	'蒲', '房', '滕', '屈', '饶', '解', '牟', '艾', '尤', '阳', '时', '穆',
+	'农', '司', '卓', '古', '吉', '缪', '简', '车', '项', '连', '芦', '麦',
+	'褚', '娄', '窦', '戚', '岑', '景', '党', '宫', '费', '卜', '冷', '晏',
+	'席', '卫', '米', '柏', '宗', '瞿', '桂', '全', '佟', '应', '臧', '闵',
+	'苟', '邬', '边', '卞', '姬', '师', '和', '仇', '栾', '隋', '商', '刁',
+	'沙', '荣', '巫', '寇', '桑', '郎', '甄', '丛', '仲', '虞', '敖', '巩',
+	'明', '佘', '池', '查', '麻', '苑', '迟', '邝', '官', '封', '谈', '匡',
+	'鞠', '惠', '荆', '乐', '冀', '郁', '胥', '南', '班', '储', '原', '栗',
+	'燕', '楚', '鄢', '劳', '谌', '奚', '皮', '粟', '冼', '蔺', '楼', '盘',
+	'满', '闻', '位', '厉', '伊', '仝', '区', '郜', '海', '阚', '花', '权',
+	'强', '帅', '屠', '豆', '朴', '盖', '练', '廉', '禹', '井', '祖', '漆',
+	'巴', '丰', '支', '卿', '国', '狄', '平', '计', '索', '宣', '晋', '相',
+	'初', '门', '雲', '容', '敬', '来', '扈', '晁', '芮', '都', '普', '阙',
+	'浦', '戈', '伏', '鹿', '薄', '邸', '雍', '辜', '羊', '阿', '乌', '母',
+	'裘', '亓', '修', '邰', '赫', '杭', '况', '那', '宿', '鲜', '印', '逯',
+	'隆', '茹', '诸', '战', '慕', '危', '玉', '银', '亢', '嵇', '公', '哈',
+	'湛', '宾', '戎', '勾', '茅', '利', '於', '呼', '居', '揭', '干', '但',
+	'尉', '冶', '斯', '元', '束', '檀', '衣', '信', '展', '阴', '昝', '智',
+	'幸', '奉', '植', '衡', '富', '尧', '闭', '由', '習', '习', '隰', '郤',
+	'郗',
+), 1)
+
+family_names_ck_re = \
+	'(?:王|李|張|张|劉|刘|陳|陈|楊|杨|黃|黄|趙|赵|吳|吴|周|徐|孫|孙|馬|马|朱|胡|郭|何|林|高|羅|罗|鄭|郑|梁|謝|谢|宋|唐|許|许|鄧|邓|韓|韩|馮|冯|曹|彭|曾|蕭|萧|田|董|潘|袁|蔡|蔣|蒋|余|于|杜|葉|程|魏|蘇|呂|丁|任|盧|卢|苏|吕|姚|沈|鍾|钟|姜|崔|譚|谭|陸|陆|范|汪|廖|石|金|韋|韦|賈|贾|夏|傅|方|鄒|邹|熊|白|孟|秦|邱|侯|江|尹|薛|閻|阎|段|雷|龍|龙|黎|史|陶|賀|贺|毛|郝|顧|顾|龔|龚|邵|萬|万|覃|武|錢|钱|戴|嚴|严|歐|欧|莫|孔|向|常|湯|汤|康|易|喬|乔|賴|赖|文|施|洪|辛|柯|莊|庄|温|牛|樊|葛|邢|安|齐|伍|庞|颜|倪|聂|章|鲁|岳|翟|殷|詹|申|耿|关|兰|焦|俞|左|柳|甘|祝|包|宁|尚|符|舒|阮|纪|梅|童|凌|毕|单|季|裴|霍|涂|成|苗|谷|盛|曲|翁|冉|骆|蓝|路|游|靳|欧阳|管|柴|蒙|鲍|华|喻|祁|蒲|房|滕|屈|饶|解|牟|艾|尤|阳|时|穆|农|司|卓|古|吉|缪|简|车|项|连|芦|麦|褚|娄|窦|戚|岑|景|党|宫|费|卜|冷|晏|席|卫|米|柏|宗|瞿|桂|全|佟|应|臧|闵|苟|邬|边|卞|姬|师|和|仇|栾|隋|商|刁|沙|荣|巫|寇|桑|郎|甄|丛|仲|虞|敖|巩|明|佘|池|查|麻|苑|迟|邝|官|封|谈|匡|鞠|惠|荆|乐|冀|郁|胥|南|班|储|原|栗|燕|楚|鄢|劳|谌|奚|皮|粟|冼|蔺|楼|盘|满|闻|位|厉|伊|仝|区|郜|海|阚|花|权|强|帅|屠|豆|朴|盖|练|廉|禹|井|祖|漆|巴|丰|支|卿|国|狄|平|计|索|宣|晋|相|初|门|雲|容|敬|来|扈|晁|芮|都|普|阙|浦|戈|伏|鹿|薄|邸|雍|辜|羊|阿|乌|母|裘|亓|修|邰|赫|杭|况|那|宿|鲜|印|逯|隆|茹|诸|战|慕|危|玉|银|亢|嵇|公|哈|湛|宾|戎|勾|茅|利|於|呼|居|揭|干|但|尉|冶|斯|元|束|檀|衣|信|展|阴|昝|智|幸|奉|植|衡|富|尧|闭|由|習|习|隰|郤|郗)'
+
+# vim:set ts=4 sw=4 fenc=utf8:
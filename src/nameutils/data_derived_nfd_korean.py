@@ -0,0 +1,50 @@
+# nameutils - Identify given/family names and capitalize correctly
+# https://raf.org/nameutils
+# https://github.com/rafmod/nameutils
+# https://codeberg.org/rafmod/nameutils
+#
+# Copyright (C) 2023-2025 raf <raf@raf.org>
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+# 20250708 raf <raf@raf.org>
+
+# The data derived from the builtin data for engines normalized with NFD (Korean names).
+# Generated by make derived (see derived_write()). Do not edit.
+
+family_names_hangul = dict.fromkeys(
+(
+	'가', '간', '갈', '감', '강', '견', '경', '계', '고', '곡', '공', '곽',
+	'관', '교', '구', '국', '궁', '궉', '권', '근', '금', '기', '길', '김',
+	'나', '라', '난', '란', '남', '남궁', '낭', '랑', '내', '노', '로', '뇌',
+	'뢰', '다', '단', '담', '당', '대', '도', '독고', '돈', '동', '동방', '두',
+	'등', '등정', '려', '류유', '리', '림', '마', '만', '망절', '매', '맹', '명',
+	'모', '목', '묘', '무', '무본', '묵', '문', '미', '민', '박', '반', '방',
+	'배', '백', '번', '범', '변', '보', '복', '복호', '봉', '부', '비', '빈',
+	'빙', '부여', '사', '사공', '산', '삼', '상', '서', '서문', '석', '선', '선우',
+	'설', '섭', '성', '소', '손', '송', '수', '순', '승', '시', '신', '심',
+	'아', '안', '애', '야', '양', '량', '어', '어금', '엄', '여', '연', '련',
+	'염', '렴', '엽', '영', '예', '오', '옥', '온', '옹', '완', '왕', '요',
+	'용', '룡', '우', '운', '원', '위', '유', '류', '육', '륙', '윤', '은',
+	'음', '이', '인', '임', '자', '장', '전', '점', '정', '제', '제갈', '조',
+	'종', '좌', '주', '증', '지', '진', '차', '창', '채', '천', '초', '최',
+	'추', '탁', '탄', '태', '판', '팽', '편', '평', '포', '표', '풍', '피',
+	'필', '하', '학', '한', '함', '해', '허', '현', '형', '호', '홍', '화',
+	'황', '황목', '황보', '후', '료', '웅',
+), 1)
+
+family_names_hangul_re = \
+	'(?:가|간|갈|감|강|견|경|계|고|곡|공|곽|관|교|구|국|궁|궉|권|근|금|기|길|김|나|라|난|란|남|남궁|낭|랑|내|노|로|뇌|뢰|다|단|담|당|대|도|독고|돈|동|동방|두|등|등정|려|류유|리|림|마|만|망절|매|맹|명|모|목|묘|무|무본|묵|문|미|민|박|반|방|배|백|번|범|변|보|복|복호|봉|부|비|빈|빙|부여|사|사공|산|삼|상|서|서문|석|선|선우|설|섭|성|소|손|송|수|순|승|시|신|심|아|안|애|야|양|량|어|어금|엄|여|연|련|염|렴|엽|영|예|오|옥|온|옹|완|왕|요|용|룡|우|운|원|위|유|류|육|륙|윤|은|음|이|인|임|자|장|전|점|정|제|제갈|조|종|좌|주|증|지|진|차|창|채|천|초|최|추|탁|탄|태|판|팽|편|평|포|표|풍|피|필|하|학|한|함|해|허|현|형|호|홍|화|황|황목|황보|후|료|웅)'
+
+# vim:set ts=4 sw=4 fenc=utf8:
@@ -0,0 +1,298 @@
+# nameutils - Identify given/family names and capitalize correctly
+# https://raf.org/nameutils
+# https://github.com/rafmod/nameutils
+# https://codeberg.org/rafmod/nameutils
+#
+# Copyright (C) 2023-2025 raf <raf@raf.org>
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+# 20250708 raf <raf@raf.org>
+
+# Japanese Kanji family name probabilities (Enamdict) used by namesplit_ja().
+# This is only imported when first needed (i.e., for Japanese names).
+
+family_name_japanese_probabilities = \
+{
+	'一': 0.1658, '丁': 0.7938, '七': 0.2536, '万': 0.2146, '丈': 0.1965, '三': 0.3021, '上': 0.9772,
+	'下': 0.9876, '不': 0.4061, '与': 0.2753, '丑': 0.6923, '且': 0.3750, '世': 0.1556, '丘': 0.5838,
+	'丙': 0.0385, '丞': 0.0061, '両': 0.8679, '並': 0.8824, '中': 0.9236, '串': 1.0000, '丸': 0.8272,
+	'丹': 0.6935, '主': 0.5837, '乃': 0.0767, '久': 0.4980, '之': 0.1936, '乕': 0.6296, '乗': 0.6857,
+	'乘': 0.9583, '乙': 0.3917, '九': 0.4545, '也': 0.0252, '乳': 0.6818, '乾': 0.4881, '亀': 0.6402,
+	'了': 0.1449, '予': 0.0905, '事': 0.5319, '二': 0.2442, '五': 0.4545, '井': 0.9549, '亘': 0.1158,
+	'亜': 0.0206, '亞': 0.0000, '交': 0.6061, '亥': 0.3368, '亦': 0.8226, '亨': 0.0309, '享': 0.0400,
+	'京': 0.5118, '亭': 0.5000, '亮': 0.0061, '人': 0.0839, '仁': 0.2734, '今': 0.7922, '介': 0.0157,
+	'仏': 0.9146, '仕': 0.8250, '他': 0.2500, '付': 0.9565, '仙': 0.4380, '代': 0.2340, '令': 0.0481,
+	'以': 0.0531, '仮': 0.9310, '仰': 0.2500, '仲': 0.8539, '任': 0.3540, '企': 0.1667, '伊': 0.5423,
+	'伍': 0.1417, '伎': 0.0513, '伏': 0.9634, '休': 0.6377, '会': 0.4764, '伝': 0.5445, '伯': 0.3187,
+	'伴': 0.4348, '伶': 0.0000, '伸': 0.0593, '似': 0.2211, '伽': 0.0456, '但': 0.9412, '位': 0.5843,
+	'住': 0.8587, '佐': 0.4643, '佑': 0.0049, '何': 0.5000, '余': 0.5268, '佛': 1.0000, '作': 0.3308,
+	'佳': 0.0191, '使': 0.6182, '侃': 0.0455, '來': 0.5030, '侍': 0.4211, '侑': 0.0023, '供': 0.8214,
+	'依': 0.0529, '俊': 0.0427, '保': 0.5632, '信': 0.2871, '俣': 0.9915, '修': 0.0890, '俵': 0.9722,
+	'俶': 0.0000, '倉': 0.9350, '倍': 0.7500, '倖': 0.0411, '倫': 0.0106, '倭': 0.1348, '倶': 0.2857,
+	'偉': 0.0260, '健': 0.0694, '偲': 0.0000, '側': 1.0000, '傍': 0.9565, '傑': 0.1818, '備': 0.6190,
+	'傳': 0.8254, '像': 0.7143, '僧': 0.7727, '儀': 0.4135, '億': 0.5000, '優': 0.0076, '允': 0.0189,
+	'元': 0.6627, '兄': 0.3158, '充': 0.0134, '兆': 0.0513, '先': 0.8802, '光': 0.3106, '克': 0.0229,
+	'免': 0.9474, '兎': 0.2105, '児': 0.4258, '兒': 0.7838, '兜': 0.8276, '入': 0.9395, '全': 0.2011,
+	'八': 0.5451, '公': 0.1103, '六': 0.4123, '共': 0.1351, '兵': 0.2637, '其': 0.5577, '具': 0.4929,
+	'典': 0.0193, '兼': 0.6098, '内': 0.9778, '円': 0.4808, '冠': 0.5111, '冨': 0.8081, '冬': 0.1176,
+	'冲': 0.8065, '冴': 0.0483, '冶': 0.4144, '冷': 0.5641, '凌': 0.1458, '凖': 0.0000, '凛': 0.0028,
+	'凜': 0.0000, '凡': 0.0395, '処': 0.6667, '凪': 0.0292, '凱': 0.0217, '出': 0.8735, '刀': 0.6973,
+	'刃': 0.2703, '分': 0.9895, '切': 0.9519, '刈': 0.9533, '初': 0.3094, '判': 0.7727, '別': 0.9711,
+	'利': 0.2102, '制': 0.0455, '刺': 0.9286, '則': 0.2444, '剋': 0.0000, '前': 0.9697, '剛': 0.1011,
+	'剣': 0.4557, '副': 0.8902, '剱': 1.0000, '割': 1.0000, '創': 0.0312, '力': 0.6284, '功': 0.0632,
+	'加': 0.3689, '助': 0.0866, '努': 0.0263, '励': 0.0833, '勅': 0.6875, '勇': 0.1873, '勉': 0.0312,
+	'動': 0.8485, '勘': 0.4552, '務': 0.4918, '勝': 0.3671, '勢': 0.6526, '勤': 0.1714, '勧': 0.5909,
+	'勲': 0.0000, '匂': 0.8936, '包': 0.5065, '化': 0.5862, '北': 0.9076, '匠': 0.3023, '匡': 0.0143,
+	'十': 0.4098, '千': 0.2144, '升': 0.7707, '午': 0.4079, '半': 0.6821, '卓': 0.0592, '協': 0.0741,
+	'南': 0.4035, '博': 0.0337, '卜': 0.7500, '占': 0.8846, '卯': 0.3624, '印': 0.9265, '卿': 0.0357,
+	'厚': 0.2563, '原': 0.9792, '厨': 0.8462, '厳': 0.2258, '去': 0.7500, '参': 0.4769, '又': 0.6948,
+	'叉': 0.1190, '及': 0.6600, '友': 0.2072, '双': 0.4510, '反': 0.9905, '収': 0.0476, '叔': 0.0278,
+	'取': 0.9700, '受': 0.7292, '叡': 0.1429, '口': 0.9860, '古': 0.8066, '句': 0.0879, '只': 0.6389,
+	'叫': 0.0294, '可': 0.1165, '台': 0.8133, '史': 0.0120, '右': 0.2033, '叶': 0.2295, '司': 0.2443,
+	'合': 0.6818, '吉': 0.4427, '同': 0.6923, '名': 0.5460, '后': 0.2642, '吏': 0.0000, '吐': 0.4000,
+	'向': 0.8933, '君': 0.4562, '吟': 0.0893, '吹': 0.6739, '吾': 0.1646, '呂': 0.4609, '呉': 0.8058,
+	'告': 0.8095, '呑': 0.8056, '周': 0.2638, '味': 0.6022, '呼': 0.0734, '命': 0.2716, '和': 0.3276,
+	'咲': 0.0575, '哀': 0.2800, '品': 0.8085, '哉': 0.0168, '員': 0.1600, '哲': 0.0204, '唄': 0.3103,
+	'唐': 0.9293, '唯': 0.0518, '唱': 0.0286, '問': 0.8462, '啓': 0.0163, '善': 0.2550, '喜': 0.2678,
+	'喬': 0.0513, '喰': 1.0000, '嗣': 0.0236, '嘉': 0.3016, '器': 0.3953, '四': 0.4178, '回': 0.8077,
+	'因': 0.6667, '団': 0.4808, '図': 0.6024, '固': 0.3514, '国': 0.6788, '囿': 1.0000, '圀': 0.0625,
+	'圃': 0.2826, '國': 0.8939, '園': 0.8175, '圓': 0.9365, '團': 0.7727, '土': 0.8482, '在': 0.6059,
+	'圭': 0.0148, '地': 0.9318, '坂': 0.9865, '均': 0.0141, '坊': 0.8866, '坐': 0.8684, '坡': 0.3182,
+	'坦': 0.1143, '坪': 0.9491, '垂': 0.7808, '垢': 0.0976, '垣': 0.9942, '垰': 1.0000, '城': 0.7956,
+	'埜': 0.9535, '埴': 0.9167, '執': 0.8065, '基': 0.0976, '埼': 0.9646, '堀': 0.9939, '堂': 0.7529,
+	'堅': 0.5440, '堤': 0.9062, '堰': 1.0000, '場': 0.9915, '堺': 1.0000, '塔': 0.7467, '塗': 0.9615,
+	'塘': 0.7719, '塙': 0.9697, '塚': 0.9957, '塩': 0.9764, '塲': 1.0000, '境': 0.9326, '増': 0.8227,
+	'墨': 0.7119, '壁': 0.9633, '士': 0.3738, '壬': 0.4000, '壮': 0.0463, '声': 0.0794, '壱': 0.0719,
+	'売': 0.7917, '壷': 0.6863, '壺': 0.9143, '壽': 0.3662, '夏': 0.0720, '夕': 0.0476, '外': 0.6524,
+	'夘': 0.7586, '多': 0.4494, '夛': 0.9194, '夜': 0.0698, '夢': 0.0244, '大': 0.7798, '天': 0.5101,
+	'太': 0.1522, '夫': 0.0358, '央': 0.0169, '夷': 0.6905, '奇': 0.4062, '奈': 0.0714, '奉': 0.1714,
+	'奎': 0.0204, '奏': 0.0203, '契': 0.1364, '奚': 0.0400, '奥': 0.9554, '奧': 1.0000, '奨': 0.0233,
+	'女': 0.1715, '奴': 0.4545, '好': 0.2197, '如': 0.1902, '妃': 0.0084, '妙': 0.3122, '妥': 0.0000,
+	'妹': 0.4906, '妻': 0.9623, '姉': 0.6250, '始': 0.1803, '姓': 0.9872, '委': 0.0220, '姥': 0.9714,
+	'姫': 0.0533, '姿': 0.0455, '威': 0.1092, '娘': 0.0541, '婁': 0.1071, '婦': 0.2549, '媛': 0.0159,
+	'嬉': 0.1039, '子': 0.0542, '孔': 0.1067, '字': 0.7263, '存': 0.0208, '孚': 0.0417, '孝': 0.0908,
+	'孟': 0.0727, '季': 0.0426, '孤': 0.3478, '学': 0.2044, '孫': 0.4771, '宅': 0.8545, '宇': 0.6215,
+	'守': 0.6033, '安': 0.3869, '完': 0.2019, '宍': 0.9429, '宏': 0.0181, '宗': 0.4094, '官': 0.8312,
+	'宙': 0.0143, '定': 0.4294, '宜': 0.2402, '宝': 0.6372, '実': 0.0529, '宣': 0.0673, '室': 0.9673,
+	'宥': 0.0247, '宮': 0.8776, '宰': 0.2679, '宵': 0.1579, '家': 0.8860, '容': 0.0172, '宿': 0.9371,
+	'寂': 0.0435, '寄': 0.9356, '寅': 0.3223, '密': 0.5000, '富': 0.5654, '寒': 0.6855, '寛': 0.0562,
+	'實': 0.7055, '寧': 0.0265, '寳': 1.0000, '寶': 1.0000, '寸': 0.5246, '寺': 0.9888, '対': 0.8727,
+	'寿': 0.1136, '専': 0.3714, '射': 0.9000, '将': 0.0717, '尉': 0.0400, '尊': 0.2061, '尋': 0.2308,
+	'對': 1.0000, '導': 0.2609, '小': 0.7936, '少': 0.7188, '尚': 0.0289, '尭': 0.0413, '就': 0.0698,
+	'尹': 0.2857, '尺': 0.8571, '尻': 0.9949, '尼': 0.8286, '尾': 0.9477, '居': 0.9316, '屋': 0.9881,
+	'展': 0.0086, '屡': 0.0000, '山': 0.8866, '岐': 0.5167, '岑': 0.4681, '岡': 0.9823, '岩': 0.9191,
+	'岬': 0.4444, '岱': 0.1786, '岳': 0.4806, '岸': 0.9338, '峠': 0.9765, '峡': 0.3824, '峨': 0.8250,
+	'峪': 1.0000, '峯': 0.8017, '峰': 0.4933, '島': 0.9774, '峻': 0.0328, '崇': 0.1180, '崎': 0.9864,
+	'嵐': 0.7349, '嵜': 1.0000, '嵩': 0.4757, '嵯': 0.3019, '嶋': 0.9893, '嶌': 1.0000, '嶺': 0.5867,
+	'嶽': 0.9943, '巌': 0.4538, '巖': 0.8056, '川': 0.9670, '州': 0.3702, '巣': 0.8351, '工': 0.7798,
+	'左': 0.2711, '巧': 0.0563, '巨': 0.2705, '巫': 0.3810, '差': 0.6607, '己': 0.0618, '已': 0.1538,
+	'巳': 0.0681, '巴': 0.0978, '巻': 0.8657, '巾': 0.3115, '市': 0.3678, '布': 0.5509, '帆': 0.0723,
+	'希': 0.0162, '帝': 0.2593, '師': 0.7918, '帯': 0.8438, '帰': 0.5349, '常': 0.5218, '幅': 1.0000,
+	'幡': 0.9612, '幣': 0.9667, '干': 0.7763, '平': 0.6338, '年': 0.2606, '幸': 0.1831, '幹': 0.0310,
+	'幽': 0.1136, '幾': 0.3158, '広': 0.4810, '庄': 0.6942, '床': 0.9839, '底': 0.8667, '店': 0.9524,
+	'庚': 0.1481, '府': 0.9128, '度': 0.7381, '座': 0.9211, '庫': 0.5286, '庭': 0.9125, '庵': 0.5475,
+	'康': 0.0722, '庸': 0.0065, '廉': 0.2178, '廣': 0.8132, '延': 0.4914, '廷': 0.4545, '建': 0.3944,
+	'廻': 0.9540, '廼': 0.8889, '廿': 0.8846, '弁': 0.4154, '弌': 0.0303, '式': 0.5698, '弐': 0.2727,
+	'弓': 0.3391, '引': 0.9697, '弘': 0.1763, '弥': 0.0942, '弦': 0.2328, '張': 0.8744, '強': 0.2500,
+	'弼': 0.0000, '弾': 0.6957, '彌': 0.3731, '当': 0.8424, '彗': 0.0179, '形': 0.9813, '彦': 0.0397,
+	'彩': 0.0155, '彪': 0.0000, '彬': 0.0080, '彰': 0.0063, '影': 0.5249, '役': 0.9268, '彼': 0.6250,
+	'往': 0.5000, '征': 0.0455, '径': 0.0476, '待': 0.7812, '律': 0.0227, '後': 0.9779, '徐': 0.8333,
+	'従': 0.2000, '得': 0.3557, '御': 0.8493, '復': 0.2121, '微': 0.0612, '徳': 0.4286, '徹': 0.0429,
+	'心': 0.0317, '忍': 0.4565, '志': 0.2891, '応': 0.4379, '忠': 0.1215, '快': 0.0581, '念': 0.6462,
+	'怒': 0.8696, '怜': 0.0000, '思': 0.0818, '怡': 0.1905, '性': 0.5918, '恋': 0.0388, '恒': 0.2397,
+	'恕': 0.0000, '恩': 0.4714, '恭': 0.0119, '息': 0.5238, '恵': 0.0650, '悌': 0.0000, '悟': 0.1053,
+	'悠': 0.0107, '悦': 0.1026, '悳': 0.1154, '情': 0.2667, '惇': 0.0000, '惟': 0.0698, '惠': 0.1977,
+	'惣': 0.5787, '想': 0.0597, '愁': 0.0000, '愉': 0.0000, '意': 0.0600, '愚': 0.1250, '愛': 0.0385,
+	'愼': 0.1333, '慈': 0.1366, '慎': 0.0932, '慧': 0.0062, '慶': 0.3150, '憂': 0.0342, '憲': 0.0050,
+	'應': 0.9412, '懐': 0.3043, '懸': 0.9259, '戎': 0.9574, '成': 0.3610, '我': 0.7072, '戒': 0.5161,
+	'戸': 0.9760, '房': 0.4586, '所': 0.9320, '扇': 0.5227, '手': 0.9628, '才': 0.6375, '打': 0.9606,
+	'扶': 0.0493, '承': 0.0145, '抄': 0.0000, '折': 0.8286, '抜': 0.9273, '抱': 0.3421, '押': 0.9787,
+	'拓': 0.0420, '拝': 0.9211, '拡': 0.0000, '拳': 0.0476, '拾': 0.4783, '持': 0.9061, '指': 0.9565,
+	'挙': 0.3200, '振': 0.7119, '挽': 0.8000, '捨': 0.2444, '捷': 0.0105, '捺': 0.0225, '掘': 1.0000,
+	'掛': 1.0000, '採': 0.1818, '提': 0.8182, '揖': 0.9688, '揚': 0.6220, '揮': 0.0400, '揺': 0.0256,
+	'摂': 0.2045, '摘': 0.0753, '摩': 0.3720, '摺': 1.0000, '撫': 0.6970, '播': 0.9661, '操': 0.2447,
+	'支': 0.2436, '改': 0.8367, '放': 0.4828, '政': 0.3346, '故': 0.7778, '敏': 0.0235, '教': 0.0873,
+	'敞': 0.1071, '敦': 0.1648, '敬': 0.0233, '数': 0.5363, '整': 0.0000, '敷': 0.9725, '數': 0.9667,
+	'文': 0.1368, '斉': 0.6160, '斌': 0.0000, '斎': 0.5015, '斐': 0.3737, '斗': 0.1788, '料': 0.9565,
+	'斤': 0.0000, '斧': 0.9062, '斯': 0.8182, '新': 0.8147, '方': 0.7347, '於': 0.2604, '施': 0.7778,
+	'旗': 0.7379, '日': 0.4771, '旦': 0.3611, '旧': 0.8095, '旨': 0.4412, '早': 0.2579, '旬': 0.0000,
+	'旭': 0.3118, '旺': 0.0449, '昂': 0.0303, '昆': 0.8966, '昇': 0.1238, '昊': 0.0909, '昌': 0.0689,
+	'明': 0.2639, '易': 0.5000, '星': 0.2372, '映': 0.0018, '春': 0.2088, '昭': 0.0946, '是': 0.5112,
+	'昴': 0.0000, '昼': 0.6400, '晁': 0.0833, '時': 0.4711, '晃': 0.0318, '晋': 0.0909, '晏': 0.0236,
+	'晟': 0.0000, '晧': 0.0000, '晨': 0.0441, '晩': 0.1667, '普': 0.4086, '景': 0.2292, '晴': 0.0762,
+	'晶': 0.0222, '智': 0.0969, '暁': 0.0397, '暉': 0.0394, '暎': 0.0000, '暖': 0.0083, '暢': 0.0055,
+	'暮': 0.6269, '曙': 0.0323, '曜': 0.0732, '曲': 0.8983, '曳': 0.9730, '更': 0.3800, '書': 0.4242,
+	'曹': 0.3125, '曽': 0.9298, '曾': 0.9861, '替': 1.0000, '最': 0.6064, '會': 0.9070, '月': 0.3472,
+	'有': 0.1865, '朋': 0.0355, '服': 0.9130, '朔': 0.1800, '朗': 0.0016, '望': 0.0664, '朝': 0.3933,
+	'期': 0.5909, '木': 0.8872, '未': 0.0176, '末': 0.7300, '本': 0.9669, '札': 0.9048, '朱': 0.2142,
+	'朴': 0.6892, '朽': 0.8684, '杉': 0.8851, '李': 0.0530, '杏': 0.0273, '材': 0.6667, '村': 0.9171,
+	'杖': 0.6111, '杜': 0.1833, '束': 0.6832, '条': 0.8556, '杢': 0.7949, '杣': 0.9600, '来': 0.3321,
+	'杭': 0.9250, '東': 0.7831, '杵': 0.9123, '松': 0.7548, '板': 0.9822, '林': 0.8200, '枚': 0.8095,
+	'果': 0.0051, '枝': 0.1921, '枡': 0.9773, '枦': 1.0000, '枩': 0.9000, '架': 0.0462, '柄': 0.8315,
+	'柊': 0.3878, '柏': 0.8629, '柑': 0.3429, '染': 0.6934, '柔': 0.0357, '柘': 0.9355, '柚': 0.1511,
+	'柱': 0.6897, '柳': 0.8225, '柴': 0.9182, '柵': 0.9310, '柾': 0.4146, '柿': 0.9119, '栂': 0.9697,
+	'栃': 0.9901, '栄': 0.2079, '栖': 0.7222, '栗': 0.8659, '栞': 0.0536, '栢': 0.9524, '株': 0.9444,
+	'根': 0.8448, '格': 0.3077, '桁': 0.9130, '桂': 0.2456, '桃': 0.1960, '案': 0.4615, '桐': 0.6818,
+	'桑': 0.8166, '桜': 0.1647, '桝': 0.9669, '桧': 0.8932, '桶': 1.0000, '梁': 0.8627, '梅': 0.6301,
+	'梓': 0.0744, '條': 0.8800, '梠': 0.9524, '梢': 0.0366, '梧': 0.2157, '梨': 0.0406, '梯': 0.7273,
+	'梶': 0.9381, '棒': 0.9630, '棚': 0.9895, '棟': 0.7474, '森': 0.9185, '椋': 0.8409, '植': 0.8660,
+	'椎': 0.6825, '椙': 0.9643, '椛': 0.8222, '椰': 0.1000, '椿': 0.7654, '楊': 0.5714, '楓': 0.0458,
+	'楚': 0.5405, '楠': 0.6517, '楢': 0.7215, '楫': 0.8148, '業': 0.3243, '楯': 0.7647, '楳': 0.8846,
+	'極': 0.6866, '楼': 0.2024, '楽': 0.4026, '榊': 0.9722, '榎': 0.9111, '榛': 0.6197, '榮': 0.5502,
+	'槁': 1.0000, '槇': 0.8507, '構': 0.9600, '槌': 0.7397, '槍': 1.0000, '槙': 0.7609, '槻': 0.5969,
+	'樂': 0.8182, '樋': 0.9874, '樗': 0.8485, '樟': 0.6400, '模': 0.4643, '権': 0.5584, '横': 0.9864,
+	'樫': 0.9781, '樵': 0.1739, '樹': 0.1117, '樺': 0.3131, '樽': 0.9737, '橋': 0.9257, '橘': 0.6667,
+	'橙': 0.2857, '機': 0.3125, '檀': 0.9429, '檜': 0.9818, '櫃': 1.0000, '櫛': 0.9841, '櫨': 0.9615,
+	'櫻': 0.7424, '欠': 0.9655, '次': 0.2047, '欣': 0.0141, '欧': 0.1774, '欽': 0.0112, '歌': 0.0912,
+	'歓': 0.1395, '止': 0.3833, '正': 0.2672, '此': 0.9412, '武': 0.5746, '歩': 0.0388, '歳': 0.5564,
+	'殉': 0.0000, '殊': 0.1786, '段': 0.9328, '殿': 0.9700, '毅': 0.0098, '母': 0.6197, '毎': 0.5000,
+	'比': 0.5360, '毛': 0.9685, '毬': 0.0694, '氏': 0.6890, '民': 0.2150, '気': 0.4516, '氣': 0.9487,
+	'水': 0.5230, '氷': 0.4609, '永': 0.5978, '汀': 0.0921, '求': 0.1552, '汎': 0.0000, '汐': 0.4027,
+	'江': 0.3658, '池': 0.9473, '汪': 0.2381, '汰': 0.0702, '汲': 0.6786, '沓': 0.9773, '沖': 0.8911,
+	'沙': 0.0225, '沢': 0.9652, '河': 0.9368, '油': 0.9579, '治': 0.2315, '沼': 0.9813, '泉': 0.5789,
+	'泊': 0.8548, '泓': 0.6818, '法': 0.5827, '泡': 0.3333, '波': 0.5880, '泥': 0.7333, '泰': 0.0921,
+	'泳': 0.0000, '洋': 0.0795, '洗': 0.7027, '洙': 0.0909, '洞': 0.7368, '津': 0.5458, '洪': 0.3333,
+	'洲': 0.6311, '洵': 0.0000, '洸': 0.0125, '活': 0.1143, '流': 0.2208, '浄': 0.3664, '浅': 0.7419,
+	'浜': 0.9421, '浦': 0.9310, '浩': 0.0103, '浪': 0.7859, '浮': 0.8288, '浴': 0.8750, '海': 0.3723,
+	'涌': 0.9020, '涙': 0.0000, '涛': 0.2766, '涯': 0.3333, '涼': 0.0563, '淀': 0.9412, '淑': 0.0101,
+	'淡': 0.5556, '深': 0.3750, '淳': 0.1821, '淵': 0.9467, '淺': 0.9091, '添': 0.9604, '清': 0.3677,
+	'済': 0.5114, '渉': 0.1250, '渋': 0.9375, '渓': 0.4057, '渕': 0.9825, '渚': 0.0225, '渡': 0.9003,
+	'渥': 0.3400, '渦': 0.8571, '温': 0.1182, '港': 0.8085, '湊': 0.8916, '湖': 0.1507, '湛': 0.2692,
+	'湧': 0.2967, '湯': 0.9289, '満': 0.3553, '源': 0.4828, '準': 0.0000, '溜': 0.9318, '溝': 1.0000,
+	'溪': 0.8085, '滉': 0.0000, '滋': 0.1344, '滑': 0.9756, '滝': 0.9118, '滿': 0.8571, '漁': 0.7742,
+	'漆': 0.9524, '演': 0.4000, '漢': 0.5833, '潔': 0.0000, '潟': 1.0000, '潤': 0.0625, '潮': 0.5057,
+	'澁': 0.9630, '澄': 0.1838, '澗': 0.8571, '澤': 0.9919, '澪': 0.0190, '濃': 0.8129, '濤': 0.5833,
+	'濱': 0.9908, '瀧': 0.9442, '瀬': 0.8266, '灘': 0.9420, '火': 0.3257, '灯': 0.0798, '灰': 0.8689,
+	'炎': 0.0625, '炭': 0.9394, '為': 0.3625, '烈': 0.0769, '烏': 0.4463, '無': 0.4950, '然': 0.0820,
+	'焼': 0.9250, '煌': 0.1071, '煕': 0.0000, '煙': 0.8125, '照': 0.2152, '熊': 0.8219, '熱': 0.5556,
+	'燈': 0.2593, '燎': 0.0000, '燕': 0.1842, '燦': 0.0000, '燿': 0.0333, '爪': 1.0000, '爲': 0.8909,
+	'父': 0.8974, '爽': 0.0000, '爾': 0.0813, '片': 0.9588, '牛': 0.7826, '牟': 0.9648, '牧': 0.7516,
+	'物': 0.9639, '犬': 0.8690, '狐': 0.7407, '狩': 0.9237, '独': 0.2222, '狭': 0.7903, '猛': 0.0500,
+	'猪': 0.7801, '猫': 0.6957, '猶': 0.6042, '猷': 0.0476, '猿': 0.7232, '獅': 0.7879, '玄': 0.2528,
+	'玉': 0.6882, '王': 0.6381, '玖': 0.0498, '玲': 0.0021, '珂': 0.1026, '珍': 0.4833, '珠': 0.0609,
+	'現': 0.4098, '球': 0.0625, '理': 0.0403, '琉': 0.0204, '琢': 0.0702, '琳': 0.0506, '琴': 0.2412,
+	'瑚': 0.0056, '瑛': 0.0054, '瑞': 0.1367, '瑠': 0.0130, '瑩': 0.0800, '瑳': 0.0211, '瑶': 0.0833,
+	'璃': 0.0754, '璋': 0.0426, '環': 0.0519, '瓜': 0.8816, '瓢': 0.3043, '瓦': 0.8611, '瓶': 0.5930,
+	'甘': 0.7535, '甚': 0.3398, '生': 0.4306, '産': 0.7586, '用': 0.7400, '甫': 0.1571, '田': 0.9789,
+	'由': 0.0875, '甲': 0.6819, '申': 0.3281, '男': 0.0456, '町': 0.9570, '界': 0.4872, '畑': 0.9933,
+	'畔': 0.8962, '留': 0.3915, '畝': 0.5442, '畠': 0.9968, '畦': 0.8116, '番': 0.9394, '異': 0.2609,
+	'當': 0.9496, '疋': 0.9600, '癒': 0.0000, '発': 0.5714, '登': 0.3192, '白': 0.6949, '百': 0.3998,
+	'的': 0.7872, '皆': 0.7791, '皇': 0.2188, '皐': 0.0513, '皓': 0.0081, '皮': 0.9615, '皿': 0.9714,
+	'盈': 0.0400, '益': 0.4809, '盛': 0.5663, '盟': 0.0385, '盤': 0.7826, '目': 0.9538, '直': 0.1493,
+	'相': 0.7758, '省': 0.0075, '眉': 0.1750, '県': 0.9667, '眞': 0.4473, '真': 0.2036, '眠': 0.1034,
+	'眸': 0.0385, '眼': 0.6071, '着': 0.9000, '督': 0.0870, '睦': 0.0922, '瞬': 0.0000, '瞭': 0.0000,
+	'瞳': 0.0183, '矢': 0.6916, '知': 0.2298, '矩': 0.0437, '石': 0.8433, '砂': 0.2735, '研': 0.1885,
+	'砥': 0.9024, '破': 0.7317, '硯': 0.4167, '硲': 1.0000, '碇': 0.9512, '碓': 0.9600, '碕': 0.9697,
+	'碧': 0.0638, '碩': 0.1067, '確': 0.1818, '磐': 0.5857, '磨': 0.2783, '磯': 0.8000, '礒': 0.9037,
+	'示': 0.2418, '礼': 0.1478, '社': 0.9405, '祇': 0.4800, '祈': 0.0254, '祐': 0.0605, '祖': 0.8286,
+	'祝': 0.4956, '神': 0.8916, '祢': 0.5690, '祥': 0.0268, '祭': 0.5312, '禄': 0.1250, '禅': 0.1818,
+	'禎': 0.0345, '福': 0.7758, '禧': 0.0500, '禮': 0.7344, '禰': 0.6667, '禾': 0.2500, '禿': 0.8261,
+	'秀': 0.0819, '秋': 0.3248, '科': 0.7640, '秦': 0.6145, '秩': 0.3226, '称': 0.4500, '移': 0.6250,
+	'稀': 0.0489, '程': 0.8085, '税': 0.8710, '稔': 0.0370, '稗': 1.0000, '稚': 0.0210, '稜': 0.0571,
+	'種': 0.5925, '稲': 0.8371, '穀': 0.6800, '穂': 0.1159, '穆': 0.1364, '積': 0.6790, '穎': 0.2727,
+	'穏': 0.0698, '穐': 0.9574, '穗': 0.4250, '穣': 0.0000, '穴': 0.9358, '空': 0.1463, '窓': 0.2429,
+	'窪': 0.9916, '立': 0.7903, '竜': 0.4636, '章': 0.0180, '童': 0.2895, '竪': 0.9167, '端': 0.8806,
+	'竹': 0.7785, '竿': 0.8205, '笑': 0.0249, '笙': 0.0435, '笛': 0.4912, '笠': 0.9321, '符': 0.6667,
+	'笹': 0.9026, '筆': 0.8627, '等': 0.3625, '筋': 0.9333, '筑': 0.9057, '筒': 0.9512, '策': 0.0227,
+	'箇': 0.9524, '箕': 0.9029, '管': 0.9375, '箭': 0.9600, '箱': 0.9828, '箸': 0.9512, '節': 0.1453,
+	'篁': 0.2400, '範': 0.0449, '築': 0.8964, '篠': 0.9522, '篤': 0.0591, '篭': 0.9560, '簑': 0.9286,
+	'簗': 0.9655, '簾': 0.9565, '籏': 0.9804, '籐': 0.9831, '籔': 1.0000, '籠': 0.9900, '米': 0.7864,
+	'籾': 0.9615, '粂': 0.6275, '粉': 0.8235, '粋': 0.0588, '粒': 0.8182, '粕': 0.9792, '粟': 0.9552,
+	'粥': 0.5556, '粧': 0.1786, '精': 0.0995, '糟': 1.0000, '糠': 1.0000, '糸': 0.5101, '系': 0.4783,
+	'紀': 0.0879, '紅': 0.2030, '紋': 0.1119, '納': 0.8105, '純': 0.0155, '紗': 0.0039, '紘': 0.0046,
+	'紙': 0.9130, '素': 0.1295, '紫': 0.1789, '紬': 0.0455, '細': 0.9489, '紳': 0.0196, '紹': 0.0541,
+	'紺': 0.8500, '絃': 0.0000, '組': 0.9180, '経': 0.3016, '結': 0.0728, '絢': 0.0388, '給': 0.9714,
+	'統': 0.0734, '絵': 0.0303, '絹': 0.3394, '継': 0.3275, '続': 0.7800, '綜': 0.0303, '維': 0.0277,
+	'綱': 0.5275, '網': 0.9783, '綸': 0.0000, '綺': 0.0173, '綾': 0.1933, '綿': 0.7879, '緋': 0.0942,
+	'総': 0.2463, '緑': 0.2216, '緒': 0.0709, '編': 0.5000, '緩': 0.1111, '緯': 0.0435, '練': 0.5102,
+	'縁': 0.5806, '縄': 0.9278, '縣': 0.9655, '縫': 0.3922, '績': 0.3462, '繁': 0.4067, '織': 0.2309,
+	'繩': 1.0000, '繪': 0.5357, '繭': 0.0351, '繰': 0.2553, '置': 0.9067, '羅': 0.2105, '羊': 0.0597,
+	'美': 0.0706, '群': 0.5581, '義': 0.1393, '羽': 0.4505, '翁': 0.3689, '翔': 0.0509, '翠': 0.0689,
+	'翼': 0.0800, '耀': 0.0288, '老': 0.9006, '考': 0.1129, '者': 0.9348, '而': 0.0323, '耒': 0.9459,
+	'耕': 0.1095, '耳': 0.5455, '耶': 0.0278, '耿': 0.1111, '聖': 0.0526, '聞': 0.5588, '聡': 0.0081,
+	'聰': 0.0476, '聴': 0.1200, '肇': 0.0000, '肖': 0.1071, '股': 1.0000, '肥': 0.9357, '育': 0.0329,
+	'背': 0.8696, '胡': 0.4100, '胤': 0.1020, '能': 0.6012, '脇': 0.9843, '脩': 0.0000, '腰': 0.9927,
+	'膳': 0.9130, '臣': 0.1346, '臥': 0.4783, '臨': 0.2692, '自': 0.2381, '至': 0.0769, '致': 0.0769,
+	'臺': 0.9706, '臼': 0.9583, '與': 0.7213, '興': 0.3634, '舎': 0.8661, '舗': 0.9091, '舘': 0.9966,
+	'舛': 0.9862, '舜': 0.0278, '舞': 0.0966, '舟': 0.5872, '舩': 1.0000, '航': 0.0278, '船': 0.9704,
+	'良': 0.3034, '色': 0.5071, '艶': 0.1220, '艸': 0.6500, '芋': 0.7838, '芙': 0.0234, '芝': 0.8346,
+	'芥': 0.5366, '芦': 0.8481, '芭': 0.1667, '花': 0.1949, '芳': 0.2335, '芸': 0.1636, '芹': 0.3723,
+	'芽': 0.0453, '苅': 1.0000, '苑': 0.2212, '苔': 0.5000, '苗': 0.3194, '若': 0.7249, '苧': 0.8966,
+	'苫': 0.9804, '英': 0.0301, '苺': 0.0408, '茂': 0.4269, '茄': 0.0938, '茅': 0.4651, '茉': 0.0011,
+	'茗': 0.7407, '茜': 0.1023, '茨': 0.8667, '茶': 0.5986, '草': 0.5751, '荏': 0.6818, '荒': 0.9344,
+	'荘': 0.5112, '荷': 0.9067, '荻': 0.9120, '莉': 0.0000, '莞': 0.1026, '莱': 0.2286, '菅': 0.9487,
+	'菊': 0.5447, '菓': 0.3750, '菖': 0.3617, '菜': 0.0173, '菫': 0.0625, '華': 0.0514, '菰': 0.8571,
+	'菱': 0.8904, '萌': 0.0053, '萠': 0.1724, '萩': 0.7452, '萬': 0.8080, '萱': 0.9412, '落': 0.9341,
+	'葉': 0.2870, '葛': 0.9013, '董': 0.1364, '葦': 0.6981, '葭': 0.8308, '葵': 0.0253, '蒔': 0.5062,
+	'蒜': 0.9048, '蒲': 0.9118, '蒼': 0.0697, '蓉': 0.0625, '蓑': 0.8529, '蓬': 0.8182, '蓮': 0.3504,
+	'蓼': 0.5200, '蔦': 0.7013, '蔭': 0.7864, '蔵': 0.4332, '蕗': 0.1500, '蕪': 0.8182, '薄': 0.9512,
+	'薇': 0.0400, '薔': 0.0204, '薗': 0.9747, '薙': 0.6286, '薩': 0.8293, '薫': 0.0361, '薬': 0.9184,
+	'薮': 1.0000, '藁': 1.0000, '藍': 0.2093, '藏': 0.9191, '藤': 0.8851, '藪': 0.9915, '藻': 0.4667,
+	'蘆': 0.7222, '蘇': 0.6351, '蘓': 1.0000, '蘭': 0.0878, '虎': 0.3415, '虚': 0.1034, '虫': 0.7105,
+	'虹': 0.0188, '蛇': 0.9239, '蛍': 0.0256, '蛭': 0.9455, '蛯': 0.9655, '蜂': 0.8000, '蜜': 0.4444,
+	'蝶': 0.2234, '融': 0.0682, '螺': 0.4091, '蟹': 0.8378, '蟻': 0.9405, '衆': 0.1905, '行': 0.3488,
+	'街': 0.6923, '衛': 0.1074, '衡': 0.1935, '衣': 0.0430, '表': 0.9577, '衿': 0.0690, '袈': 0.0800,
+	'袋': 0.9778, '袖': 0.8980, '袴': 0.9583, '裏': 0.9529, '裕': 0.0187, '補': 0.4783, '裟': 0.0494,
+	'裸': 0.1071, '襄': 0.0000, '西': 0.9615, '要': 0.3411, '覇': 0.5690, '見': 0.6445, '規': 0.0471,
+	'視': 0.0191, '覚': 0.3476, '覧': 0.5185, '親': 0.2412, '観': 0.1882, '角': 0.9165, '解': 0.6857,
+	'言': 0.1346, '計': 0.3490, '訓': 0.0571, '記': 0.1168, '訪': 0.8409, '設': 0.8000, '許': 0.8060,
+	'証': 0.1429, '詔': 0.0000, '詞': 0.0769, '詠': 0.0333, '詩': 0.0137, '詮': 0.0303, '詰': 0.9785,
+	'話': 0.0000, '誉': 0.0750, '誌': 0.0000, '誓': 0.0597, '語': 0.4688, '誠': 0.0226, '説': 0.1935,
+	'調': 0.4082, '諄': 0.0000, '談': 0.5185, '請': 0.9394, '諌': 0.7143, '諏': 0.9464, '諒': 0.0000,
+	'論': 0.2381, '諦': 0.0435, '諭': 0.0500, '諸': 0.9251, '謙': 0.0592, '講': 0.6333, '謝': 0.9815,
+	'謹': 0.0000, '識': 0.2703, '譜': 0.5714, '譲': 0.1970, '護': 0.5169, '讃': 0.7500, '谷': 0.9771,
+	'豆': 0.8500, '豊': 0.4321, '象': 0.1636, '豪': 0.0849, '貝': 0.9509, '貞': 0.3125, '財': 0.9500,
+	'貢': 0.0571, '貫': 0.6623, '貴': 0.1421, '賀': 0.7236, '資': 0.0606, '賛': 0.1071, '賢': 0.0477,
+	'赤': 0.8860, '赦': 0.0037, '赫': 0.2500, '走': 0.7692, '起': 0.1145, '超': 0.1304, '越': 0.9207,
+	'足': 0.8500, '跡': 0.8333, '路': 0.5161, '踏': 0.4762, '身': 0.2946, '躬': 0.0625, '車': 0.8532,
+	'軌': 0.0286, '軍': 0.4200, '軒': 0.5462, '軽': 0.8226, '輔': 0.0113, '輝': 0.0444, '輪': 0.6510,
+	'輿': 0.9750, '辛': 0.8966, '辰': 0.3650, '農': 0.7651, '辺': 0.9569, '辻': 0.9820, '込': 0.9899,
+	'迅': 0.0645, '迎': 0.9787, '近': 0.8085, '返': 0.8571, '迦': 0.7436, '迪': 0.0149, '迫': 0.9923,
+	'追': 0.9589, '透': 0.0849, '途': 0.3438, '通': 0.2854, '速': 0.6508, '造': 0.1638, '逢': 0.4444,
+	'連': 0.6111, '進': 0.1948, '逸': 0.0881, '遊': 0.2411, '運': 0.2644, '道': 0.5679, '達': 0.3944,
+	'遙': 0.0294, '遠': 0.7107, '遥': 0.0299, '遵': 0.0000, '遼': 0.0185, '邉': 1.0000, '邊': 1.0000,
+	'邑': 0.7551, '那': 0.1431, '邦': 0.0793, '邨': 0.8065, '郁': 0.0297, '郎': 0.0122, '郡': 0.9276,
+	'部': 0.9779, '郭': 0.3824, '郷': 0.6889, '都': 0.2159, '酉': 0.3462, '酒': 0.9409, '酔': 0.3000,
+	'醇': 0.0000, '釆': 0.8800, '采': 0.1946, '釈': 0.8627, '釋': 1.0000, '里': 0.1709, '重': 0.4383,
+	'野': 0.8409, '量': 0.1414, '金': 0.8096, '釘': 0.9459, '釜': 0.9839, '針': 0.9362, '釣': 0.8481,
+	'釼': 0.9167, '鈴': 0.1756, '鉄': 0.4027, '鉢': 0.9259, '鉦': 0.2069, '鉱': 0.1786, '鉾': 0.9070,
+	'銀': 0.3514, '銅': 0.9394, '銘': 0.6792, '銭': 0.9296, '鋤': 0.8108, '鋪': 0.9429, '鋭': 0.0000,
+	'鋳': 0.6538, '鋼': 0.1333, '錠': 0.2553, '錦': 0.5909, '錫': 0.3636, '錬': 0.0741, '録': 0.4231,
+	'鍋': 0.9677, '鍛': 0.9630, '鍜': 1.0000, '鍬': 0.8659, '鍵': 0.8434, '鎌': 0.8917, '鎗': 0.9000,
+	'鎮': 0.2019, '鏡': 0.4000, '鐘': 0.4435, '鐵': 0.8529, '鑑': 0.2241, '鑓': 1.0000, '長': 0.7032,
+	'門': 0.5506, '開': 0.7525, '閑': 0.6159, '間': 0.9814, '関': 0.9221, '關': 1.0000, '阪': 0.9926,
+	'防': 0.9302, '阿': 0.3341, '陀': 0.7917, '附': 0.9810, '降': 0.8723, '院': 0.9720, '陣': 0.7864,
+	'除': 1.0000, '陰': 0.8000, '陳': 0.7500, '陵': 0.3256, '陶': 0.3875, '陸': 0.4500, '陽': 0.0719,
+	'隅': 0.9408, '隆': 0.0672, '隈': 0.9688, '階': 0.9474, '随': 0.6410, '際': 0.9737, '隠': 0.8182,
+	'隣': 0.4138, '隼': 0.1379, '雀': 0.4493, '雁': 0.7143, '雄': 0.0555, '雅': 0.0346, '集': 0.5844,
+	'雉': 0.7143, '雍': 0.0000, '雑': 0.9706, '雛': 0.2195, '難': 0.8621, '雨': 0.3583, '雪': 0.1603,
+	'雫': 0.2609, '雲': 0.4883, '零': 0.0000, '雷': 0.2468, '霊': 0.5397, '霜': 0.8462, '霞': 0.1073,
+	'霧': 0.3370, '露': 0.3163, '青': 0.4051, '靖': 0.0219, '静': 0.1088, '靜': 0.2683, '面': 0.9565,
+	'鞆': 0.6098, '鞍': 0.8028, '鞠': 0.1739, '音': 0.0783, '韶': 0.0000, '響': 0.1056, '頂': 0.6190,
+	'順': 0.0654, '須': 0.6611, '頌': 0.0484, '頓': 0.9429, '領': 0.8043, '頭': 0.9735, '頴': 0.3478,
+	'頼': 0.3169, '額': 0.9143, '顔': 0.5185, '顕': 0.0496, '願': 0.7600, '類': 0.6944, '風': 0.2442,
+	'颯': 0.0613, '飛': 0.4940, '食': 1.0000, '飯': 0.9755, '飴': 0.8148, '飼': 0.9512, '飽': 1.0000,
+	'餅': 0.9630, '養': 0.5285, '餘': 1.0000, '館': 0.9741, '饒': 0.8485, '饗': 0.9048, '首': 0.9683,
+	'香': 0.0644, '馨': 0.0066, '馬': 0.7552, '駄': 0.9412, '駒': 0.7619, '駿': 0.2143, '騎': 0.1143,
+	'骨': 0.1379, '高': 0.7596, '鬼': 0.7339, '魁': 0.2917, '魅': 0.0000, '魔': 0.1304, '魚': 0.5000,
+	'魯': 0.2667, '鮎': 0.3333, '鮫': 0.9259, '鯉': 0.2970, '鯛': 0.6923, '鯨': 0.8214, '鱒': 0.7941,
+	'鳥': 0.7920, '鳩': 0.6176, '鳳': 0.2042, '鳴': 0.5316, '鴇': 0.8966, '鴨': 0.9126, '鴫': 0.9667,
+	'鴬': 0.5000, '鴻': 0.5137, '鵜': 0.8012, '鵬': 0.4242, '鶏': 0.4516, '鶴': 0.4600, '鷲': 0.9103,
+	'鷹': 0.7265, '鷺': 0.7000, '鹿': 0.8182, '麒': 0.1667, '麗': 0.0317, '麟': 0.0926, '麦': 0.4757,
+	'麻': 0.1486, '麿': 0.0602, '黄': 0.4954, '黎': 0.2687, '黒': 0.9533, '黙': 0.0385, '鼎': 0.0741,
+	'鼓': 0.1507, '鼻': 0.9789, '齊': 0.9481, '齋': 0.9577, '龍': 0.4541, '龝': 0.9730
+}
+
+# vim:set ts=4 sw=4 fenc=utf8:
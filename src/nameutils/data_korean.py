@@ -0,0 +1,223 @@
+# nameutils - Identify given/family names and capitalize correctly
+# https://raf.org/nameutils
+# https://github.com/rafmod/nameutils
+# https://codeberg.org/rafmod/nameutils
+#
+# Copyright (C) 2023-2025 raf <raf@raf.org>
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+# 20250708 raf <raf@raf.org>
+
+# Korean family names (Hangul, and the corresponding Hanja, which aren't used)
+# that appear first (see NameUtils.family_names_hangul_load()). This is only
+# imported when first needed (i.e., for names containing Hangul).
+
+family_names_korean = \
+[
+	'가', '價', '賈',
+	'간', '簡', '間',
+	'갈', '葛',
+	'감', '甘',
+	'강', '姜', '康', '強', '剛', '江', '㝩',
+	'견', '堅', '甄',
+	'경', '京', '慶', '景', '耿',
+	'계', '季', '桂',
+	'고', '顧', '高',
+	'곡', '曲', '谷',
+	'공', '公', '孔',
+	'곽', '廓', '槨', '郭',
+	'관', '管', '關',
+	'교', '喬', '橋',
+	'구', '丘', '仇', '具', '邱',
+	'국', '國', '菊', '鞠', '鞫', '麴',
+	'궁', '宮', '弓',
+	'궉', '鴌',
+	'권', '權', '勸', '㩲', '券',
+	'근', '斤',
+	'금', '琴', '禁', '芩', '金',
+	'기', '奇', '寄', '箕', '紀',
+	'길', '吉',
+	'김', '金',
+	'나', '라', '羅', '蘿', '邏', '那',
+	'난', '란', '欒',
+	'남', '南', '男',
+	'남궁', '南宫', '南宮',
+	'낭', '랑', '浪',
+	'내', '乃', '奈',
+	'노', '로', '努', '卢', '盧', '蘆', '虜', '路', '魯',
+	'뇌', '뢰', '雷',
+	'다', '多',
+	'단', '單', '段', '端',
+	'담', '譚',
+	'당', '唐',
+	'대', '代', '大', '戴',
+	'도', '到', '度', '桃', '覩', '道', '都', '陶',
+	'독고', '獨孤',
+	'돈', '頓',
+	'동', '東', '童', '董', '蕫', '薫',
+	'동방', '東方',
+	'두', '杜',
+	'등', '滕', '鄧',
+	'등정', '藤井',
+	'라', '羅', '蘿', '邏',
+	'란', '欒',
+	'랑', '浪',
+	'려', '呂',
+	'로', '盧', '路', '魯',
+	'뢰', '雷',
+	'류유', '㧕', '劉', '柳',
+	'리', '李',
+	'림', '林',
+	'마', '馬', '麻',
+	'만',
+	'망절', '網切',
+	'매', '梅',
+	'맹', '孟',
+	'명', '明',
+	'모', '慕', '毛', '牟',
+	'목', '睦', '穆',
+	'묘', '苗',
+	'무', '武',
+	'무본', '武本',
+	'묵', '墨',
+	'문', '文', '門',
+	'미', '米',
+	'민', '悶', '敏', '旻', '民', '珉', '閔',
+	'박', '博', '朴',
+	'반', '潘', '班',
+	'방', '房', '方', '旁', '芳', '邦', '防', '龐',
+	'배', '培', '背', '裵', '輩', '配',
+	'백', '伯', '柏', '白', '百',
+	'번', '樊',
+	'범', '範', '范',
+	'변', '卞', '變', '邊',
+	'보', '保', '寶', '甫',
+	'복', '卜',
+	'복호', '卜扈',
+	'봉', '奉', '鳳',
+	'부', '付', '傅', '夫', '富',
+	'비', '丕',
+	'빈', '彬', '濱', '貧', '賓', '賔',
+	'빙', '氷',
+	'부여', '夫餘',
+	'사', '史', '司', '沙', '舍', '謝',
+	'사공', '司公', '司空',
+	'산', '山',
+	'삼', '杉', '森',
+	'상', '商', '尙', '尚', '常',
+	'서', '俆', '徐', '書', '緖', '西',
+	'서문', '西問', '西門',
+	'석', '席', '昔', '石', '釋',
+	'선', '善', '宣', '鮮',
+	'선우', '蘚于', '鮮于', '鮮宇', '鮮牛',
+	'설', '偰', '卨', '楔', '薛', '辥', '雪',
+	'섭', '葉',
+	'성', '城', '宬', '成', '星', '盛',
+	'소', '卲', '小', '所', '昭', '簫', '肖', '蕭', '蘇', '邵',
+	'손', '孫', '損', '蓀', '遜',
+	'송', '宋', '松', '送',
+	'수', '水', '洙', '隋',
+	'순', '淳', '筍', '舜', '荀', '順', '旬',
+	'승', '承', '昇',
+	'시', '施', '時', '柴',
+	'신', '伸', '信', '愼', '新', '申', '莘', '辛',
+	'심', '心', '沁', '沈', '深',
+	'아', '阿',
+	'안', '安', '案', '顔',
+	'애', '艾',
+	'야', '夜',
+	'양', '량', '揚', '梁', '楊', '樑', '樣', '洋', '粱', '陽',
+	'어', '漁', '魚',
+	'어금', '魚金',
+	'엄', '㘙', '儼', '嚴',
+	'여', '려', '余', '呂', '黎', '予',
+	'연', '련', '延', '涎', '燕', '連',
+	'염', '렴', '廉', '簾', '閻',
+	'엽', '葉',
+	'영', '影', '榮',
+	'예', '倪', '禮', '芮', '藝',
+	'오', '五', '伍', '吳', '吾', '晤',
+	'옥', '玉',
+	'온', '溫',
+	'옹', '邕', '雍',
+	'완', '阮',
+	'왕', '汪王',
+	'요', '姚',
+	'용', '룡', '龍',
+	'우', '于', '偶', '宇', '寓', '尤', '愚', '牛', '禹', '遇',
+	'운', '芸', '雲',
+	'원', '元', '原', '圓', '苑', '袁', '阮', '院',
+	'위', '偉', '衛', '韋', '魏',
+	'유', '류', '兪', '劉', '庾', '有', '杻', '枊', '柳', '楡', '由', '裕',
+	'육', '륙', '陸',
+	'윤', '尹', '允', '潤',
+	'은', '殷', '恩', '隱', '銀', '誾',
+	'음', '陰',
+	'이', '리', '李', '㛅', '伊', '利', '怡', '異',
+	'인', '印',
+	'임', '림', '任', '壬', '恁', '林',
+	'자', '慈',
+	'장', '張', '場', '壯', '將', '庄', '漿', '章', '臧', '莊', '葬', '蔣', '藏', '裝', '長',
+	'전', '全', '戰', '田', '錢',
+	'점', '佔',
+	'정', '鄭', '丁', '定', '情', '政', '桯', '正', '程',
+	'제', '諸', '齊',
+	'제갈', '諸葛', '諸曷', '諸渴',
+	'조', '趙', '刁', '曺', '朝', '調', '造', '曹',
+	'종', '宗', '鍾',
+	'좌', '佐', '左',
+	'주', '主', '周', '朱', '株', '珠',
+	'증', '增', '曾',
+	'지', '地', '智', '池', '遲',
+	'진', '䄅', '晋', '珍', '眞', '秦', '蔯', '進', '陣', '陳',
+	'차', '車', '次',
+	'창', '倉', '昌',
+	'채', '菜', '蔡', '采',
+	'천', '千', '天', '川',
+	'초', '初', '楚',
+	'최', '催', '寉', '崔', '最',
+	'추', '秋', '鄒',
+	'탁', '卓',
+	'탄', '彈',
+	'태', '太', '泰',
+	'판', '判',
+	'팽', '彭',
+	'편', '片',
+	'평', '平',
+	'포', '包',
+	'표', '俵', '表',
+	'풍', '馮',
+	'피', '皮',
+	'필', '弼', '畢',
+	'하', '何', '夏', '河',
+	'학', '郝',
+	'한', '恨', '汗', '漢', '韓',
+	'함', '咸',
+	'해', '海', '解',
+	'허', '許',
+	'현', '玄', '賢',
+	'형', '刑', '形', '邢',
+	'호', '扈', '湖', '胡', '虎', '鎬',
+	'홍', '㤨', '䜤', '哄', '弘', '洪', '烘', '紅',
+	'화', '化',
+	'황', '晃', '潢', '煌', '皇', '簧', '荒', '黃',
+	'황목', '荒木',
+	'황보', '皇甫', '黃甫',
+	'후', '侯', '候', '后',
+	'료',
+	'웅'
+]
+
+# vim:set ts=4 sw=4 fenc=utf8:
@@ -0,0 +1,369 @@
+# nameutils - Identify given/family names and capitalize correctly
+# https://raf.org/nameutils
+# https://github.com/rafmod/nameutils
+# https://codeberg.org/rafmod/nameutils
+#
+# Copyright (C) 2023-2025 raf <raf@raf.org>
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+# 20250708 raf <raf@raf.org>
+
+# Romanized Chinese, Korean, and Vietnamese family names, which can appear
+# first or last (see NameUtils.namesplit_load()). This is only imported when
+# first needed (by namesplit()).
+
+family_names_chinese_roman = \
+[
+	'Wáng', 'Wang', 'Wong', 'Vang', 'Ông', 'Bong', 'Heng', 'Vòng', 'Uōng', 'Waon', 'Whang', 'Vương', 'Ong', 'Ō',
+	'Lǐ', 'Li', 'Lei', 'Lee', 'Ly', 'Lí', 'Lî', 'Lý', 'Ri', 'Yi', 'Rhee', 'Dy', 'Dee', 'Sy',
+	'Zhāng', 'Chang', 'Zoeng', 'Cheung', 'Cheong', 'Chong', 'Tiuⁿ', 'Tioⁿ', 'Teo', 'Teoh', 'Tio', 'Chông', 'Tong', 'Thong', 'Tsan', 'Tzan', 'Zan', 'Trương', 'Jang', 'Chō', 'Tiu', 'Tiong', 'Sutiono', 'Tjong',
+	'Liú', 'Liu', 'Lau', 'Lao', 'Lou', 'Lưu', 'Lâu', 'Low', 'Liù', 'Liew', 'Lew', 'Lieu', 'Lio', 'Yu', 'Yoo', 'Ryū',
+	'Chén', "Ch'en", 'Can', 'Chan', 'Chun', 'Chean', 'Chin', 'Tân', 'Tan', 'Tang', 'Ting', 'Chhìn', 'Thín', 'Thin', 'Zen', 'Tchen', 'Trần', 'Jin', 'Tantoco', 'Tanteksi',
+	'Yáng', 'Yang', 'Joeng', 'Yeung', 'Yeong', 'Ieong', 'Young', 'Iûⁿ', 'Iôⁿ', 'Yeoh', 'Yeo', 'Yo', 'Nyo', 'Yòng', 'Yong', 'Iōng', 'Yan', 'Ian', 'Dương', 'Yu', 'Yung', 'Yana', 'Yongco', 'Yuchengco', 'Yō',
+	'Huáng', 'Huang', 'Wong', 'Wang', 'Vong', 'N̂g', 'Ûiⁿ', 'Ng', 'Ung', 'Ooi', 'Uy', 'Wee', 'Vòng', 'Bong', 'Uōng', 'Fong', 'Waon', 'Whang', 'Hoàng', 'Huỳnh', 'Hwang', 'Kō',
+	'Zhào', 'Chao', 'Ziu', 'Chiu', 'Chu', 'Chio', 'Jiu', 'Tiō', 'Tiǒ', 'Teo', 'Teoh', 'Chhau', 'Chau', 'Thèu', 'Cheu', 'Chew', 'Zau', 'Zo', 'Triệu', 'Jo', 'Tio', 'Chō',
+	'Wú', 'Wu', 'Ng', 'Ung', 'Eng', 'Gô͘', 'Ngô͘', 'Goh', 'Ǹg', 'Woo', 'Ngô', 'Oh', 'Go', 'Kure', 'Ngo', 'Gozon', 'Gozum', 'Cinco', 'Gochian', 'Gokongwei', 'Gosiengfiao',
+	'Zhōu', 'Chou', 'Zau', 'Chow', 'Chau', 'Jao', 'Chao', 'Chiu', 'Chew', 'Jew', 'Chiû', 'Chiew', 'Tiu', 'Cheu', 'Tseu', 'Tzo', 'Chu', 'Châu', 'Ju', 'Shū', 'Joe',
+	'Xú', 'Hsü', 'Ceoi', 'Tsui', 'Choi', 'Chui', 'Tsua', 'Chhî', 'Sîr', 'Chee', 'Cher', 'Cheu', 'Swee', 'Ji', 'Jee', 'Chhì', 'Chi', 'Chhié', 'Zhi', 'Zee', 'Zi', 'Từ', 'Seo', 'Sho', 'Dharmadjie', 'Christiadjie',
+	'Sūn', 'Sun', 'Syun', 'Suen', 'Sng', 'Suiⁿ', 'Soon', 'Sûn', 'Sen', 'Tôn', 'Son', 'Suan',
+	'Mǎ', 'Ma', 'Maa', 'Mah', 'Mar', 'Má', 'Bé', 'Bey', 'Beh', 'Baey', 'Mâ', 'Mo', 'Mu', 'Mã', 'Mapua', 'Ba',
+	'Zhū', 'Chu', 'Zyu', 'Chue', 'Choo', 'Chû', 'Tu', 'Tsy', 'Tsyu', 'Tzu', 'Châu', 'Ju', 'Shu', 'Gee',
+	'Hú', 'Hu', 'Wu', 'Woo', 'Vu', 'Ô͘', 'Oh', 'Ow', 'Aw', 'Fù', 'Foo', 'Ū', 'Hồ', 'Ho', 'Ko',
+	'Guō', 'Kuo', 'Gwok', 'Kwok', 'Kuok', 'Koeh', 'Keh', 'Kerh', 'Kueh', 'Koay', 'Quay', 'Kwek', 'Quek', 'Kwik', 'Kok', 'Koh', 'Goh', 'Koq', 'Quách', 'Gwak', 'Kaku', 'Que', 'Cue', 'Quezon', 'Quison', 'Ker', 'Kho', 'Kue',
+	'Hé', 'Hê', 'Ho', 'Hoe', 'Hô', 'Hor', 'Hou', 'Hò', 'Hó', 'Wu', 'Woo', 'Hà', 'Ha', 'Ka',
+	'Lín', 'Lin', 'Lam', 'Lum', 'Lîm', 'Lim', 'Lìm', 'Līm', 'Ling', 'Lâm', 'Im', 'Rim', 'Rin', 'Hayashi',
+	'Gāo', 'Kao', 'Gou', 'Ko', 'Kou', 'Go', 'Ko͘', 'Kor', 'Kô', 'Kau', 'Koo', 'Gau', 'Cao', 'Kō', 'Caw', 'Co', 'Gao',
+	'Luó', 'Lo', 'Law', 'Loh', 'Lowe', 'Lor', 'Lô', 'Lò', 'Lō', 'Lu', 'Loo', 'La', 'Na', 'Ra',
+	'Zhèng', 'Cheng', 'Zeng', 'Cheang', 'Chiang', 'Tēⁿ', 'Tīⁿ', 'Tìⁿ', 'Tēeⁿ', 'Tay', 'Teh', 'Chhang', 'Chang', 'Thàng', 'Zen', 'Zung', 'Trịnh', 'Jeong', 'Tei', 'Ty', 'Tee',
+	'Liáng', 'Liang', 'Loeng', 'Leung', 'Leong', 'Lang', 'Leng', 'Niû', 'Niô͘', 'Neo', 'Liòng', 'Liōng', 'Lian', 'Lương', 'Yang', 'Ryang', 'Liong', 'Niu', 'Ryō',
+	'Xiè', 'Hsieh', 'Ze', 'Tse', 'Che', 'Chiā', 'Siā', 'Sià', 'Chia', 'Cheah', 'Seah', 'Tshia', 'Chhià', 'Zhia', 'Zia', 'Tạ', 'Sa', 'Sha', 'Tsia', 'Sia', 'Saa', 'Sese', 'Shie',
+	'Sòng', 'Sung', 'Sàng', 'Song', 'Soong', 'Sūng', 'Son', 'Tống', 'Sō', 'Songco',
+	'Táng', "T'ang", 'Tong', 'Tn̂g', 'Tông', 'Tng', 'Tang', 'Thòng', 'Thong', 'Thóng', 'Daon', 'Daan', 'Đường', 'Dang', 'Teng', 'Tō',
+	'Xǔ', 'Hsü', 'Heoi', 'Hui', 'Hoi', 'Khó͘', 'Koh', 'Khoh', 'Ko', 'Hí', 'Hee', 'Hé', 'Siu', 'Syu', 'Shiu', 'Hái', 'Hứa', 'Heo', 'Kyo', 'Kho', 'Co', 'Kaw', 'Cojuangco',
+	'Dèng', 'Teng', 'Dang', 'Tang', 'Theng', 'Tēng', 'Tèng', 'Then', 'Ten', 'Thèn', 'Den', 'Đặng', 'Deung', 'Tō', 'Deang', 'Tengco', 'Tangco',
+	'Hán', 'Han', 'Hon', 'Hân', 'Hang', 'Hòn', 'Hón', 'Ghoe', 'Reu', 'Hàn', 'Kan',
+	'Féng', 'Feng', 'Fung', 'Fong', 'Pâng', 'Pang', 'Fùng', 'Phùng', 'Foong', 'Fūng', 'Von', 'Vong', 'Pung', 'Hō', 'Pangco',
+	'Cáo', "Ts'ao", 'Cou', 'Cho', 'Tso', 'Chaw', 'Chô', 'Chô͘', 'Chow', 'Tshò', 'Tshàu', 'Chhóu', 'Zau', 'Zo', 'Tào', 'Jo', 'Sō',
+	'Péng', "P'eng", 'Pang', 'Banh', 'Phêⁿ', 'Phîⁿ', 'Phêeⁿ', 'Peh', 'Phe', 'Phàng', 'Phang', 'Pháng', 'Ban', 'Bành', 'Paeng', 'Hō', 'Beng', 'Pangco', 'Pay',
+	'Zēng', 'Tseng', 'Zang', 'Tsang', 'Chang', 'Dong', 'Chan', 'Tsên', 'Chen', 'Tsen', 'Tzen', 'Tsung', 'Tăng', 'Jeung', 'Sō', 'Tjan', 'Tzeng',
+	'Xiāo', 'Hsiao', 'Siu', 'Shiu', 'Sio', 'Siau', 'Seow', 'Siow', 'Siâu', 'Siew', 'Siaw', 'Sieu', 'Shio', 'Tiêu', 'So', 'Siao', 'Syaw', 'Shau', 'Shao', 'Shaw', 'Shō',
+	'Tián', "T'ien", 'Tin', 'Chan', 'Tiân', 'Chang', 'Thièn', 'Thien', 'Then', 'Thién', 'Di', 'Dee', 'Điền', 'Jeon', 'Tian', 'Tien', 'Ten',
+	'Dǒng', 'Tung', 'Dung', 'Tong', 'Táng', 'Tóng', 'Túng', 'Tûng', 'Ton', 'Toong', 'Đổng', 'Dong', 'Tō',
+	'Pān', "P'an", 'Pun', 'Poon', 'Phoaⁿ', 'Phua', 'Phân', 'Pan', 'Phan', 'Phon', 'Phoe', 'Poe', 'Ban', 'Han', 'Pua',
+	'Yuán', 'Yüan', 'Jyun', 'Yuen', 'Wan', 'Oân', 'Wang', 'Yèn', 'Yen', 'Iōn', 'Yoe', 'Yoo', 'Yeu', 'Viên', 'Won', 'En', 'Yan',
+	'Cài', "Ts'ai", 'Coi', 'Choi', 'Choy', 'Tsoi', 'Toy', 'Chhoà', 'Chua', 'Chhai', 'Chai', 'Chhói', 'Tsa', 'Thái', 'Sái', 'Chae', 'Sai', 'Chuah', 'Cua', 'Choa', 'Tsai', 'Tsay',
+	'Jiǎng', 'Chiang', 'Zoeng', 'Tseung', 'Cheung', 'Chiúⁿ', 'Chióⁿ', 'Cheoh', 'Chioh', 'Tsiòng', 'Cheong', 'Chiông', 'Cian', 'Jian', 'Tưởng', 'Jang', 'Shō', 'Chio', 'Chiu', 'Chung',
+	'Yú', 'Yü', 'Jyu', 'Yu', 'Yue', 'U', 'Yee', 'Î', 'Û', 'Îr', 'Ee', 'Eu', 'Yì', 'Uī', 'Dư', 'Yeo', 'Yo', 'Ie', 'Iman', 'Oe',
+	'Sū', 'Su', 'Sou', 'So', 'So͘', 'Soh', 'Sû', 'Soo', 'Tô', 'Solon',
+	'Lǚ', 'Lü', 'Leoi', 'Lui', 'Loi', 'Lū', 'Lī', 'Lǐr', 'Lee', 'Leu', 'Ler', 'Loo', 'Lî', 'Liê', 'Li', 'Lữ', 'Lã', 'Yeo', 'Ryeo', 'Ryo', 'Lu', 'Luy',
+	'Dīng', 'Ting', 'Ding', 'Teng', 'Tén', 'Ten', 'Tiang', 'Tin', 'Đinh', 'Jeong', 'Tei',
+	'Rén', 'Jen', 'Jam', 'Yam', 'Iam', 'Yum', 'Jîm', 'Lîm', 'Līm', 'Jim', 'Ngim', 'Yim', 'Nìm', 'Nin', 'Nying', 'Nhiệm', 'Nhậm', 'Im', 'Jin',
+	'Lú', 'Lu', 'Lou', 'Lo', 'Lô͘', 'Loh', 'Lù', 'Loo', 'Lū', 'Lư', 'Lô', 'No', 'Ro',
+	'Yáo', 'Yao', 'Jiu', 'Yiu', 'Yeow', 'Io', 'Iu', 'Iâu', 'Yeo', 'Yào', 'Yow', 'Iēu', 'Yau', 'Diêu', 'Yo', 'Yō',
+	'Shěn', 'Shen', 'Sam', 'Shum', 'Sum', 'Sham', 'Sím', 'Sim', 'Shím', 'Sen', 'Sung', 'Thẩm', 'Trầm', 'Shim', 'Shin',
+	'Zhōng', 'Chung', 'Zung', 'Chong', 'Chiong', 'Cheng', 'Chûng', 'Tsung', 'Tung', 'Tson', 'Tzon', 'Jong', 'Shō',
+	'Jiāng', 'Chiang', 'Goeng', 'Keung', 'Geung', 'Keong', 'Khiang', 'Khiong', 'Khiuⁿ', 'Kiang', 'Kiông', 'Kiong', 'Cian', 'Jian', 'Khương', 'Kang', 'Kyō',
+	'Cuī', "Ts'ui", 'Ceoi', 'Chui', 'Choi', 'Chhui', 'Chwee', 'Tshûi', 'Chooi', 'Chhoi', 'Tsoe', 'Tseu', 'Thôi', 'Sai', 'Tseui',
+	'Tán', "T'an", 'Taam', 'Tam', 'Tom', 'Ham', 'Hom', 'Thâm', 'Tham', 'Thàm', 'Thóm', 'De', 'Dae', 'Đàm', 'Dam', 'Tan',
+	'Lù', 'Lu', 'Luk', 'Lok', 'Lio̍k', 'Loke', 'Lek', 'Liu̍k', 'Liuk', 'Loh', 'Loq', 'Lục', 'Yuk', 'Ryuk', 'Riku', 'Diokno',
+	'Fàn', 'Fan', 'Faan', 'Hoān', 'Hoǎn', 'Hwan', 'Huang', 'Hoan', 'Fam', 'Ve', 'Vae', 'Phạm', 'Beom', 'Han', 'Juan',
+	'Wāng', 'Wang', 'Wong', 'Ong', 'Óng', 'Vong', 'Uong', 'Waon', 'Whang', 'Uông', 'Ō', 'Ang',
+	'Liào', 'Liao', 'Liu', 'Lew', 'Leow', 'Liew', 'Lio', 'Liāu', 'Liàu', 'Liau', 'Liow', 'Lièu', 'Liêu', 'Liệu', 'Ryo', 'Ryō',
+	'Shí', 'Shih', 'Sek', 'Shek', 'Seac', 'Seak', 'Chio̍h', 'Chioh', 'Cheoh', 'Sha̍k', 'Sak', 'Shak', 'Zah', 'Zaq', 'Thạch', 'Seok', 'Seki',
+	'Jīn', 'Chin', 'Gam', 'Kam', 'Gum', 'Kim', 'Kîm', 'Cin', 'Jin', 'Kin',
+	'Wéi', 'Wei', 'Wai', 'Vai', 'Ûi', 'Úi', 'Wee', 'Vúi', 'Vì', 'Wooi', 'Uī', 'We', 'Vi', 'Wi', 'I', 'Uy',
+	'Jiǎ', 'Chia', 'Gaa', 'Ka', 'Ga', 'Ká', 'Kée', 'Kia', 'Kâ', 'Cia', 'Jia', 'Giả', 'Go',
+	'Xià', 'Hsia', 'Haa', 'Ha', 'Hē', 'Hā', 'Hà', 'Hēe', 'Hah', 'Hay', 'Gho', 'Ya', 'Wo', 'Hạ', 'Ka',
+	'Fù', 'Fu', 'Foo', 'Pò͘', 'Poh', 'Phó', 'Bu', 'Po',
+	'Fāng', 'Fang', 'Fong', 'Hong', 'Png', 'Puiⁿ', 'Pung', 'Fông', 'Faon', 'Faan', 'Phương', 'Bang', 'Hō',
+	'Zōu', 'Tsou', 'Zau', 'Chau', 'Chow', 'Jao', 'Cho͘', 'Cho', 'Che', 'Chou', 'Choh', 'Tsêu', 'Chew', 'Chiew', 'Chiu', 'Tseu', 'Tzeu', 'Châu', 'Chu', 'Shū',
+	'Xióng', 'Hsiung', 'Hung', 'Hong', 'Hîm', 'Him', 'Yùng', 'Yoong', 'Hiūng', 'Yon', 'Hùng', 'Ung', 'Yū',
+	'Bái', 'Pai', 'Baak', 'Pak', 'Bahk', 'Pe̍h', 'Pe̍k', 'Peh', 'Pha̍k', 'Phak', 'Bah', 'Baq', 'Bạch', 'Baek', 'Haku', 'Bo',
+	'Mèng', 'Meng', 'Maang', 'Mang', 'Bēng', 'Bèng', 'Men', 'Màng', 'Man', 'Mạnh', 'Maeng', 'Mō',
+	'Qín', "Ch'in", 'Ceon', 'Chun', 'Tseun', 'Tseon', 'Chon', 'Chîn', 'Ching', 'Tshìn', 'Chin', 'Chhín', 'Zhin', 'Zin', 'Tần', 'Jin', 'Shin',
+	'Qiū', "Ch'iu", 'Jau', 'Yau', 'Iao', 'Iau', 'Khu', 'Khoo', 'Kho', 'Khiû', 'Hiû', 'Hew', 'Khew', 'Khiu', 'Chieu', 'Khâu', 'Gu', 'Kyū', 'Hiew', 'Chiew', 'Coo', 'Chiou',
+	'Hóu', 'Hou', 'Hau', 'Hao', 'Hô͘', 'Hâu', 'Kâu', 'Hoh', 'Hèu', 'Hew', 'Héu', 'Gheu', 'Roe', 'Hầu', 'Hu', 'Kō', 'Caw', 'Ho',
+	'Jiāng', 'Chiang', 'Gong', 'Kong', 'Kang', 'Kông', 'Kaon', 'Giang', 'Gang', 'Kō', 'Kiang',
+	'Yǐn', 'Yin', 'Wan', 'Ún', 'Ín', 'Un', 'Eun', 'Eung', 'Yún', 'Yoon', 'Doãn', 'Yun', 'In', 'Unson',
+	'Xuē', 'Hsüeh', 'Sit', 'Sih', 'Siet', 'Set', 'Siot', 'Shih', 'Siq', 'Tiết', 'Seol', 'Setsu',
+	'Yán', 'Yen', 'Jim', 'Yim', 'Im', 'Giâm', 'Ngiam', 'Ngiàm', 'Yam', 'Iēm', 'Ni', 'Gni', 'Nyi', 'Diêm', 'Yeom', 'En',
+	'Duàn', 'Tuan', 'Dyun', 'Tuen', 'Tun', 'Toān', 'Toàn', 'Tng', 'Teung', 'Thon', 'Ton', 'Thòn', 'Doe', 'Deu', 'Đoàn', 'Dan',
+	'Léi', 'Lei', 'Leoi', 'Lui', 'Loi', 'Lûi', 'Lùi', 'Looi', 'Lōi', 'Le', 'Lae', 'Lôi', 'Roe', 'Noe', 'Rai', 'Luy', 'Hoisan',
+	'Lóng', 'Lung', 'Loong', 'Long', 'Lêng', 'Liông', 'Leng', 'Liong', 'Liùng', 'Liūng', 'Lon', 'Yong', 'Ryong', 'Ryō', 'Leong', 'Wee',
+	'Lí', 'Li', 'Lai', 'Lê', 'Loy', 'Loi', 'Lì', 'Lài', 'Lee', 'Lī', 'Yeo', 'Ryeo', 'Rei',
+	'Shǐ', 'Shih', 'Si', 'Sze', 'Sú', 'Sái', 'Sír', 'Ser', 'Seu', 'Sṳ́', 'Soo', 'Sî', 'Sy', 'Sử', 'Sa', 'Shi',
+	'Táo', "T'ao", 'Tou', 'To', 'Tao', 'Tow', 'Tô', 'Tô͘', 'Thô', 'Thàu', 'Thò', 'Thóu', 'Dau', 'Do', 'Đào', 'Tō',
+	'Hè', 'Hê', 'Ho', 'Hō', 'Hò', 'Hor', 'Fo', 'Wu', 'Woo', 'Hạ', 'Ha', 'Ka',
+	'Máo', 'Mao', 'Mou', 'Mo', 'Mô͘', 'Mor', 'Mô', 'Mâu', 'Mōu', 'Mau', 'Bō',
+	'Hǎo', 'Hao', 'Kok', 'Hok', 'Hak', 'Khok', 'Heh', 'Heq', 'Hác', 'Kaku',
+	'Gù', 'Ku', 'Gu', 'Goo', 'Khoo', 'Kò͘', 'Koh', 'Koo', 'Kū', 'Cố', 'Go', 'Ko', 'Coo',
+	'Gōng', 'Kung', 'Gung', 'Kwong', 'Kéng', 'Kiong', 'Kiûng', 'Kong', 'Kiung', 'Cion', 'Jiong', 'Jun', 'Cung', 'Gong', 'Kyō',
+	'Shào', 'Shao', 'Siu', 'Shiu', 'Shaw', 'Sio', 'Siō', 'Siāu', 'Siàu', 'Seow', 'Sioh', 'Shau', 'Sau', 'Sèu', 'Zau', 'Zo', 'Thiệu', 'So', 'Shō', 'Siao', 'Syaw',
+	'Wàn', 'Wan', 'Maan', 'Man', 'Meng', 'Bān', 'Bàn', 'Buang', 'Van', 'Màn', 'Vae', 'Mae', 'Ve', 'Me', 'Vạn', 'Ban',
+	'Tán', 'Qín', "T'an", 'Taam', 'Tam', 'Thâm', 'Thàm', 'Thóm', 'Dae', 'De', 'Dam', 'Tan',
+	'Wǔ', 'Wu', 'Mou', 'Mo', 'Bú', 'Boo', 'Vú', 'Moo', 'Woo', 'Mú', 'Ghu', 'Vũ', 'Võ', 'Mu', 'Bu',
+	'Qián', "Ch'ien", 'Cin', 'Chin', 'Chee', 'Chîⁿ', 'Tshièn', 'Chen', 'Chhién', 'Zhi', 'Zee', 'Tiền', 'Jeon', 'Sen', 'Chi',
+	'Dài', 'Tai', 'Daai', 'Tè', 'Tèr', 'Thài', 'Ta', 'Da', 'Đái', 'Đới', 'Dae', 'Te',
+	'Yán', 'Yen', 'Jim', 'Yim', 'Im', 'Giâm', 'Ngiam', 'Ngiàm', 'Yam', 'Ngiēm', 'Ni', 'Gni', 'Nyi', 'Nghiêm', 'Eom', 'Gen', 'Gan',
+	'Ōu', 'Ou', 'Au', 'Eu', 'Ō',
+	'Mò', 'Mo', 'Mok', 'Bo̍h', 'Bo̍k', 'Mo̍k', 'Moh', 'Moq', 'Mạc', 'Baku',
+	'Kǒng', "K'ung", 'Hung', 'Khóng', 'Kong', 'Khong', 'Khúng', 'Koong', 'Khoong', 'Khon', 'Kung', 'Khổng', 'Kyō', 'Consunji',
+	'Xiàng', 'Hsiang', 'Hoeng', 'Heung', 'Hiòng', 'Hiàng', 'Hiang', 'Hióng', 'Shian', 'Hian', 'Hưởng', 'Hyang', '향', 'Kyō',
+	'Cháng', "Ch'ang", 'Soeng', 'Sheung', 'Siông', 'Siâng', 'Sioh', 'Seoh', 'Sòng', 'Song', 'Sōng', 'Zan', 'Thường', 'Sang', 'Shō', 'Thōng',
+	'Tāng', "T'ang", 'Tong', 'Thng', 'Tng', 'Teung', 'Thông', 'Thong', 'Thaon', 'Thaan', 'Thang', 'Tō', 'Tang',
+	'Kāng', 'Kang', 'Hong', 'Khng', 'Khang', 'Không', 'Khong', 'Kong', 'Khaon', 'Khaan', 'Gang', 'Kō',
+	'Yì', 'Yi', 'Yik', 'E̍k', 'Ia̍k', 'Ek', 'Yit', 'Iak', 'I', 'Yih', 'Yiq', 'Dịch', 'Yee', 'Eki',
+	'Qiáo', "Ch'iao", 'Kiu', 'Kiâu', 'Keow', 'Kiao', 'Khiàu', 'Kiew', 'Khiew', 'Khiéu', 'Jiau', 'Djio', 'Jioh', 'Kiều', 'Kyo', 'Kyō',
+	'Kē', 'kʻo', 'O', 'Ngo', 'Koa', 'Kho', 'Ko', 'Ker', 'Quah', 'Kwa', 'Khô', 'Ko´', 'Khu', 'Koo', 'Kha', 'Ga', 'Ka', 'Cua', 'Kua', 'Co', 'Coson',
+	'Lài', 'Lai', 'Laai', 'Lay', 'Lōa', 'Lòa', 'Nai', 'La', 'Le', 'Lae', 'Lại', 'Roe', '뢰', 'Noe', 'Rai',
+	'Wén', 'Wen', 'Man', 'Bûn', 'Boon', 'Vùn', 'Voon', 'Mūn', 'Ven', 'Vung', 'Văn', 'Moon', 'Bun',
+	'Shī', 'Shih', 'Si', 'Xi', 'Soa', 'Sy', 'Sua', 'Sṳ̂', 'Sii´', 'Thí', 'Shi', 'I', 'See', 'Sze',
+	'Hóng', 'Hung', 'Huhng', 'Âng', 'Hông', 'Ang', 'Hong', 'Fùng', 'Fung', 'Ghon', 'Won', 'Ung', 'Hồng', 'Hòng', 'Kō',
+	'Xīn', 'Hsin', 'San', 'Sen', 'Sîn', 'Sin', 'Xin´', 'Sîng', 'Shin', 'Tân', 'Sing', 'Singson',
+	'Zhuāng', 'Chuang', 'Zong', 'Tsong', 'Chong', 'Jong', 'Chng', 'Cheng', 'Chông', 'Zong´', 'Tsaon', 'Tsaan', 'Tzaon', 'Trang', 'Đồ', 'Dưa', 'Chan', 'Chang', 'Jang', 'Shō', 'Sō', 'Ching', 'Chung',
+
+	'An', 'Ang', 'Ao', 'Au', 'Au_Yeung', 'Ba', 'Bai', 'Ban', 'Bao', 'Bau', 'Bi', 'Bo', 'Bu', 'Cai', 'Cao', 'Cha', 'Chai', 'Cham', 'Chan', 'Chang', 'Chao', 'Chau', 'Che',
+	'Cheah', 'Chee', 'Chen', 'Cheng', 'Cheong', 'Chern', 'Cheung', 'Chew', 'Chi', 'Chia', 'Chiang', 'Chiao', 'Chien', 'Chim', 'Chin', 'Ching', 'Chiong',
+	'Chiou', 'Chiu', 'Cho', 'Choi', 'Chong', 'Choo', 'Chou', 'Chow', 'Choy', 'Chu', 'Chua', 'Chuang', 'Chui', 'Chun', 'Chung', 'Cong', 'Cui', 'Dai', 'Dang',
+	'Dea', 'Deng', 'Ding', 'Do', 'Dong', 'Doo', 'Du', 'Duan', 'Dung', 'Eng', 'Fan', 'Fang', 'Fei', 'Feng', 'Fok', 'Fong', 'Foo', 'Fu', 'Fung', 'Gan', 'Gang', 'Gao',
+	'Gau', 'Ge', 'Geng', 'Go', 'Goh', 'Gong', 'Gu', 'Guan', 'Guo', 'Ha', 'Hai', 'Han', 'Hang', 'Hao', 'Hau', 'He', 'Ho', 'Hoh', 'Hom', 'Hon', 'Hong', 'Hoo', 'Hou', 'Hsi',
+	'Hsia', 'Hsiao', 'Hsieh', 'Hsiung', 'Hsu', 'Hsueh', 'Hu', 'Hua', 'Huang', 'Hui', 'Huie', 'Hum', 'Hung', 'Huo', 'Hwang', 'Hy', 'Ing', 'Ip', 'Jan', 'Jang',
+	'Jen', 'Jeng', 'Jeung', 'Jew', 'Jia', 'Jian', 'Jiang', 'Jiao', 'Jim', 'Jin', 'Jing', 'Jo', 'Joe', 'Jong', 'Joo', 'Jou', 'Jow', 'Ju', 'Jue', 'Jung', 'Kam', 'Kan',
+	'Kang', 'Kao', 'Kau', 'Ke', 'Keng', 'Kho', 'Khoo', 'Kiang', 'King', 'Ko', 'Koh', 'Kong', 'Koo', 'Kook', 'Kou', 'Ku', 'Kuan', 'Kuang', 'Kuk', 'Kung', 'Kuo', 'Kwan',
+	'Kwock', 'Kwok', 'Kwon', 'Kwong', 'Lai', 'Lam', 'Lan', 'Lang', 'Lao', 'Lau', 'Lee', 'Lei', 'Leng', 'Leong', 'Leung', 'Lew', 'Li', 'Lian', 'Liang', 'Liao', 'Liaw',
+	'Lien', 'Liew', 'Lim', 'Lin', 'Ling', 'Liou', 'Liu', 'Lo', 'Loh', 'Lok', 'Long', 'Loo', 'Lu', 'Lua', 'Lui', 'Luk', 'Lum', 'Lung', 'Luo', 'Ma', 'Mah', 'Mai', 'Mak', 'Man',
+	'Mao', 'Mar', 'Mau', 'Mei', 'Meng', 'Miao', 'Min', 'Ming', 'Miu', 'Mo', 'Mok', 'Mon', 'Mou', 'Moy', 'Mu', 'Mui', 'Na', 'Ng', 'Ngai', 'Ngan', 'Ngo', 'Ni', 'Nie', 'Ning', 'Niu',
+	'On', 'Ong', 'Ou', 'Ou_Yang', 'Ow', 'Owyang', 'Pan', 'Pang', 'Pao', 'Pau', 'Pei', 'Peng', 'Pi', 'Ping', 'Po', 'Pon', 'Pong', 'Poon', 'Pu', 'Pun', 'Qi', 'Qian', 'Qiao',
+	'Qin', 'Qiu', 'Qu', 'Quan', 'Que', 'Rao', 'Ren', 'Rong', 'Ruan', 'San', 'Sang', 'Seto', 'Sha', 'Sham', 'Shan', 'Shang', 'Shao', 'Shaw', 'Shek', 'Shen', 'Sheng',
+	'Sheu', 'Shi', 'Shiau', 'Shieh', 'Shih', 'Shing', 'Shiu', 'Shu', 'Shum', 'Shy', 'Shyu', 'Si', 'Sieh', 'Sin', 'Sing', 'Sit', 'Situ', 'Siu', 'So', 'Soh', 'Song',
+	'Soo', 'Soo_Hoo', 'Soon', 'Soong', 'Su', 'Suen', 'Sui', 'Sum', 'Sun', 'Sung', 'Sze', 'Szeto', 'Tai', 'Tam', 'Tan', 'Tang', 'Tao', 'Tay', 'Te', 'Teh', 'Teng', 'Teo',
+	'Tian', 'Tien', 'Tin', 'Ting', 'Tiu', 'To', 'Toh', 'Tong', 'Tsai', 'Tsang', 'Tsao', 'Tsay', 'Tse', 'Tseng', 'Tso', 'Tsoi', 'Tsou', 'Tsu', 'Tsui', 'Tu', 'Tuan',
+	'Tung', 'Tzeng', 'U', 'Un', 'Ung', 'Wah', 'Wai', 'Wan', 'Wang', 'Wee', 'Wei', 'Wen', 'Weng', 'Wing', 'Wong', 'Woo', 'Woon', 'Wu', 'Xi', 'Xia', 'Xiang', 'Xiao', 'Xie',
+	'Xin', 'Xing', 'Xiong', 'Xu', 'Xue', 'Yam', 'Yan', 'Yang', 'Yao', 'Yap', 'Yau', 'Yaw', 'Ye', 'Yee', 'Yeh', 'Yen', 'Yep', 'Yeung', 'Yi', 'Yim', 'Yin', 'Ying', 'Yip', 'Yiu',
+	'Yong', 'Yoon', 'You', 'Young', 'Yu', 'Yuan', 'Yue', 'Yuen', 'Yun', 'Yung', 'Zang', 'Zeng', 'Zha', 'Zhan', 'Zhang', 'Zhao', 'Zhen', 'Zheng', 'Zhong', 'Zhou', 'Zhu',
+	'Zhuang', 'Zhuo', 'Zong', 'Zou'
+]
+
+family_names_korean_roman = \
+[
+	'Ga', 'Ka', 'Kar', 'Gar', 'Kah', 'Gah', 'Ca', 'Cah', 'Car',
+	'Gan', 'Kan', 'Gahn', 'Kahn',
+	'Gal', 'Kal', 'Karl', 'Garl', 'Gahl', 'Kahl', 'Cahl', 'Carl', 'Cal',
+	'Gam', 'Kam', 'Kahm', 'Gahm', 'Cam',
+	'Gang', 'Kang', 'Kahng', 'Khang',
+	'Gyeon', 'Kyŏn', 'Kyun', 'Kyeon', 'Kyoun', 'Kyon',
+	'Gyeong', 'Kyŏng', 'Kyung', 'Kyoung', 'Kyeong', 'Kyong',
+	'Gye', 'Kye', 'Kyeh', 'Kay', 'Kie', 'Kae', 'Gae',
+	'Go', 'Ko', 'Koh', 'Goh', 'Kho', 'Gho', 'Kor', 'Co',
+	'Gok', 'Kok', 'Kog', 'Gog', 'Cock', 'Gogh', 'Cough',
+	'Gong', 'Kong', 'Kohng', 'Koung', 'Goung', 'Khong', 'Cong',
+	'Gwak', 'Kwak', 'Kwag', 'Kwack', 'Gwag', 'Koak', 'Kuark', 'Quack', 'Quark',
+	'Gwan', 'Kwan', 'Quan', 'Kuan', 'Guan',
+	'Gyo', 'Kyo', 'Kyoh', 'Gyoh',
+	'Gu', 'Ku', 'Koo', 'Goo', 'Kou', 'Kuh', 'Khoo', 'Khu',
+	'Guk', 'Kuk', 'Kook', 'Gook', 'Kug', 'Gug', 'Cook',
+	'Gung', 'Kung', 'Koong', 'Kwoong',
+	'Gwok', 'Kwŏk', 'Kwog', 'Gwog', 'Quock',
+	'Gwon', 'Kwŏn', 'Kwon', 'Kweon', 'Kwun',
+	'Geun', 'Kŭn', 'Keun', 'Kuen', 'Guen',
+	'Geum', 'Kŭm', 'Keum', 'Kum', 'Gum', 'Guem', 'Kuem',
+	'Gi', 'Ki', 'Kee', 'Key', 'Gee', 'Ky', 'Khee', 'Kie',
+	'Gil', 'Kil', 'Gill', 'Khil', 'Keel', 'Kihl', 'Kiehl', 'Kill',
+	'Gim', 'Kim', 'Ghim', 'Kym', 'Keem', 'Gym',
+	'Na', 'Ra', 'Nah', 'La', 'Rha', 'Rah', 'Law',
+	'Nan', 'Ran', 'Nahn', 'Rahn', 'Nhan', 'Rhan', 'Lan', 'Lahn',
+	'Nam', 'Nahm', 'Nham', 'Narm',
+	'Namgung', 'Namkung', 'Namgoong', 'Namkoong', 'Namkuhng', 'Namguhng',
+	'Nang', 'Rang', 'Nahng', 'Lang',
+	'Nae', 'Nai', 'Nay', 'Nea',
+	'No', 'Ro', 'Noh', 'Roh', 'Nau', 'Rau',
+	'Noe', 'Roe', 'Roi', 'Noi',
+	'Da', 'Ta',
+	'Dan', 'Tan', 'Dahn', 'Than',
+	'Dam', 'Tam', 'Tham', 'Dham', 'Dahm', 'Tahm',
+	'Dang', 'Tang', 'Dhang', 'Thang',
+	'Dae', 'Tae', 'Dai', 'Dea', 'Day', 'Tai', 'Tay', 'Tea',
+	'Do', 'To', 'Dho', 'Doh', 'Toe', 'Doe', 'Toh',
+	'Dokgo', 'Tokko', 'Dokko', 'Toko', 'Doko', 'Dockko', 'Dogko', 'Togko', 'Tokgo',
+	'Don', 'Ton', 'Dohn', 'Tohn',
+	'Dong', 'Tong', 'Dhong', 'Thong',
+	'Dongbang', 'Tongbang', 'Tongpang', 'Dongpang',
+	'Du', 'Tu', 'Doo', 'Do', 'Dou', 'Tou', 'To', 'Too',
+	'Deung',
+	'Deungjeong',
+	'Ra', 'Rah',
+	'Ran', 'Rahn',
+	'Rang',
+	'Ryeo', 'Ryuh',
+	'Roh',
+	'Roe', 'Roi',
+	'Ryu', 'Ryou', 'Rou', 'Ryoo', 'Yu', 'Yoo', 'You', 'Yuh',
+	'Ree',
+	'Rim', 'Leem',
+	'Ma', 'Mah', 'Mar',
+	'Man', 'Mann', 'Mahn',
+	'Mangjeol', 'Mangjŏl', 'Mangjul', 'Mangjuhl', 'Mangjoul',
+	'Mae', 'May', 'Mea', 'Mai',
+	'Maeng', 'Maing', 'Meang',
+	'Myeong', 'Myŏng', 'Myung', 'Myoung', 'Myong',
+	'Mo', 'Moh', 'Moe',
+	'Mok', 'Mock', 'Mog', 'Mork',
+	'Myo', 'Myoh', 'Mio',
+	'Mu', 'Moo',
+	'Mubon',
+	'Muk', 'Mook',
+	'Mun', 'Moon', 'Muhn',
+	'Mi', 'Mee', 'Mih', 'Meeh', 'Me',
+	'Min', 'Minn', 'Mihn', 'Mean',
+	'Bak', 'Pak', 'Park', 'Back', 'Bahk', 'Pahk',
+	'Ban', 'Pan', 'Bahn', 'Pahn', 'Bhan', 'Van',
+	'Bang', 'Pang', 'Bhang', 'Bahng', 'Pahng', 'Phang',
+	'Bae', 'Pae', 'Bai', 'Bea', 'Pai', 'Bay', 'Pay',
+	'Baek', 'Paek', 'Baik', 'Back', 'Paik', 'Pack', 'Beak',
+	'Beon', 'Bun', 'Burn',
+	'Beom', 'Pŏm', 'Bum', 'Bom', 'Peom', 'Pum', 'Puhm', 'Buhm',
+	'Byeon', 'Pyŏn', 'Byun', 'Byon', 'Pyun', 'Byoun', 'Pyon', 'Pyoun', 'Pyeon',
+	'Bo', 'Po', 'Boh', 'Poh',
+	'Bok', 'Pok', 'Pock', 'Bog', 'Pog', 'Bock',
+	'Bokho', 'Pokho', 'Pockhoh', 'Boghoh', 'Poghoh', 'Bockhoh',
+	'Bong', 'Pong', 'Bhong', 'Bohng', 'Pohng', 'Vong',
+	'Bu', 'Pu', 'Boo', 'Bou', 'Poo', 'Booh', 'Buh', 'Pou', 'Pooh',
+	'Bi', 'Pi', 'Bee', 'Pee', 'Bih', 'Bhi', 'Pih', 'Phi',
+	'Bin', 'Pin', 'Been', 'Pihn', 'Phin', 'Bean', 'Bihn', 'Pean',
+	'Bing', 'Ping',
+	'Buyeo', 'Puyŏ',
+	'Sa', 'Sah', 'Sar',
+	'Sagong', 'Sakong', 'Sagoung', 'Sakoung',
+	'San', 'Sahn', 'Sarn',
+	'Sam', 'Sahm', 'Sarm',
+	'Sang', 'Sahng',
+	'Seo', 'Sŏ', 'Suh', 'Surh', 'Su', 'Sur', 'So', 'Seoh',
+	'Seomun', 'Sŏmun', 'Suhmun', 'Suhmoon', 'Seomoon', 'Somoon',
+	'Seok', 'Sŏk', 'Suk', 'Sok', 'Suck', 'Sek', 'Such',
+	'Seon', 'Sŏn', 'Sun', 'Son', 'Suhn', 'Sen',
+	'Seonu', 'Sŏnu', 'Sunwoo', 'Seonwoo', 'Sonu', 'Sunoo', 'Sunwou', 'Seonwu', 'Sonwu',
+	'Seol', 'Sŏl', 'Sul', 'Seul', 'Sol', 'Sull',
+	'Seob', 'Sub', 'Subb', 'Sup', 'Seop',
+	'Seong', 'Sŏng', 'Sung', 'Soung', 'Song', 'Shèng',
+	'So', 'Soh', 'Sou', 'Sow',
+	'Son', 'Sohn', 'Soun',
+	'Song', 'Soung',
+	'Su', 'Soo', 'Sooh',
+	'Sun', 'Soon',
+	'Seung', 'Sŭng', 'Sung',
+	'Si', 'Shi', 'Shie', 'Shee', 'Sie', 'Sea', 'See',
+	'Sin', 'Shin', 'Shinn', 'Sheen', 'Seen', 'Sinn', 'Cynn',
+	'Sim', 'Shim', 'Seem', 'Sheem', 'Sihm',
+	'A', 'Ah', 'Ar',
+	'An', 'Ahn', 'Arn', 'Aan',
+	'Ae', 'Ay', 'Ai', 'Ea',
+	'Ya', 'Yah', 'Yar',
+	'Yang', 'Ryang', 'Lyang',
+	'Eo', 'Ŏ', 'Uh', 'Urh', 'Eoh',
+	'Eogeum', 'Ŏgŭm', 'Eokeum', 'Okeum', 'Okum', 'Ukeum', 'Ugeum', 'Ukum', 'Uhgeum', 'Uhkuem',
+	'Eom', 'Ŏm', 'Um', 'Uhm', 'Oum', 'Ohm',
+	'Yeo', 'Ryeo', 'Yŏ', 'Ryŏ', 'Yu', 'Yo', 'Yeu', 'Yuh', 'Yoh',
+	'Yeon', 'Ryeon', 'Yŏn', 'Ryŏn', 'Youn', 'Yun', 'Yon', 'Yeun', 'Yeoun', 'Yuhn',
+	'Yeom', 'Ryeom', 'Yŏm', 'Ryŏm', 'Yum', 'Youm', 'Yeum', 'Yom', 'Yeoum',
+	'Yeop', 'Yŏp', 'Yeob', 'Youb', 'Yub', 'Yup', 'Yob',
+	'Yeong', 'Yŏng', 'Young', 'Yung',
+	'Ye', 'Yeh',
+	'O', 'Oh', 'Oe', 'Au', 'Ou', 'Awh',
+	'Ok', 'Ock', 'Ohk', 'Oak', 'Og', 'Ohg', 'Oag', 'Ogh',
+	'On', 'Ohn', 'Ohnn',
+	'Ong', 'Ohng', 'Oung',
+	'Wan', 'Warn',
+	'Wang',
+	'Yo', 'You',
+	'Yong', 'Ryong', 'Lyong',
+	'U', 'Woo', 'Wu', 'Ou', 'Wo', 'Uh',
+	'Un', 'Woon', 'Wun', 'Whun', 'Wuhn',
+	'Won', 'Wŏn', 'Weon', 'Woen', 'Wone', 'Wun', 'One', 'Worn', 'Warn',
+	'Wi', 'Wee', 'We', 'Wie',
+	'Yu', 'Ryu', 'Yoo', 'You',
+	'Yuk', 'Ryuk', 'Yook', 'Youk', 'Yug', 'Yuck',
+	'Yun', 'Yoon', 'Youn', 'Yune', 'Yeun',
+	'Eun', 'Ŭn', 'Ehn', 'Enn', 'Unn', 'En', 'Un',
+	'Eum', 'Ŭm', 'Um', 'Em', 'Yeum', 'Uem',
+	'I', 'Ri', 'Yi', 'Lee', 'Rhee', 'Ree', 'Reeh', 'Ee', 'Rie', 'Rhie',
+	'In', 'Ihn', 'Yin', 'Inn', 'Lin', 'Ean',
+	'Im', 'Rim', 'Lim', 'Yim', 'Leem', 'Rhim', 'Eam',
+	'Ja', 'Cha', 'Jar',
+	'Jang', 'Chang', 'Jahng', 'Jhang', 'Zang',
+	'Jeon', 'Chŏn', 'Jun', 'Chun', 'Chon', 'Cheon',
+	'Jeom', 'Chŏm', 'Jum',
+	'Jeong', 'Chŏng', 'Chung', 'Jung', 'Joung', 'Chong', 'Cheong', 'Choung',
+	'Je', 'Che', 'Jae', 'Jea', 'Jei', 'Jhe',
+	'Jegal', 'Chegal', 'Jaegal', 'Jekal', 'Jeagal', 'Jikal', 'Chekal',
+	'Jo', 'Cho', 'Joe', 'Joh', 'Jou',
+	'Jong', 'Chong',
+	'Jwa', 'Chwa', 'Joa', 'Choa',
+	'Ju', 'Chu', 'Joo', 'Choo', 'Chow', 'Jou', 'Zoo', 'Jew', 'Zu',
+	'Jeung', 'Chŭng', 'Jung', 'Cheung', 'Chung',
+	'Ji', 'Chi', 'Jee', 'Gi', 'Chee', 'Gee', 'Jhi',
+	'Jin', 'Chin', 'Jeen', 'Gin',
+	'Cha', "Ch'a", 'Char', 'Chah',
+	'Chang', "Ch'ang", 'Chahng',
+	'Chae', "Ch'ae", 'Chai', 'Che', 'Chea', 'Chay',
+	'Cheon', "Ch'ŏn", 'Chun', 'Chon', 'Choun',
+	'Cho', "Ch'o", 'Chu', 'Chou', 'Choh',
+	'Choe', "Ch'oe", 'Choi', 'Che', 'Choy', 'Chwe', 'Chey',
+	'Chu', "Ch'u", 'Choo', 'Chou', 'Chyu',
+	'Tak', "T'ak", 'Tark', 'Tag', 'Tack', 'Tahk',
+	'Tan', "T'an", 'Tahn', 'Tann',
+	'Tae', "T'ae", 'Tai', 'Tay', 'Tea', 'Thae',
+	'Pan', "P'an", 'Pahn', 'Phan', 'Parn', 'Pann',
+	'Paeng', "P'aeng", 'Pang', 'Paing', 'Peng', 'Peang',
+	'Pyeon', "P'yŏn", 'Pyun', 'Pyon', 'Pyoun', 'Pyen',
+	'Pyeong', "P'yŏng", 'Pyung', 'Pyong', 'Pyoung', 'Pyeng',
+	'Po', "P'o", 'Pho', 'Poh', 'Paul', 'For', 'Four',
+	'Pyo', "P'yo", 'Phyo', 'Pio', 'Peo', 'Pyoh', 'Pyou',
+	'Pung', "P'ung", 'Poong', 'Puhng', 'Poohng',
+	'Pi', "P'i", 'Pee', 'Phee', 'Phi', 'Phy', 'Pih', 'Fee',
+	'Pil', "P'il", 'Phil', 'Peel', 'Fill', 'Feel',
+	'Ha', 'Hah', 'Har',
+	'Hak', 'Hag', 'Hahk', 'Hahg', 'Hack',
+	'Han', 'Hahn', 'Hann', 'Hanh',
+	'Ham', 'Hahm', 'Hamm', 'Haam', 'Harm',
+	'Hae', 'Hay', 'Hai', 'Hea',
+	'Heo', 'Hŏ', 'Hur', 'Huh', 'Her', 'Hu', 'Ho', 'Hoh', 'Heoh',
+	'Hyeon', 'Hyŏn', 'Hyun', 'Hyon', 'Hyoun',
+	'Hyeong', 'Hyŏng', 'Hyung', 'Hyoung', 'Hyong', 'Hyeung',
+	'Ho', 'Hoh',
+	'Hong', 'Houng', 'Hoong', 'Hung',
+	'Hwa', 'Howa', 'Hoa', 'Wha', 'Hua',
+	'Hwang', 'Whang', 'Whong',
+	'Hwangmok', 'Whangmock', 'Wangmok',
+	'Hwangbo', 'Hwangpo', 'Whangpoh',
+	'Hu', 'Hoo', 'Hooh', 'Huh'
+]
+
+family_names_vietnamese = \
+[
+	'Nguyễn', 'Nguyen', 'Trần', 'Tran', 'Lê', 'Le', 'Phạm', 'Hoàng', 'Hoang', 'Huỳnh', 'Huynh', 'Vũ', 'Võ', 'Vu', 'Vo', 'Phan', 'Trương', 'Truong',
+	'Bùi', 'Bui', 'Đặng', 'Dang', 'Đỗ', 'Do', 'Ngô', 'Ngo', 'Hồ', 'Dương', 'Duong', 'Đinh', 'Dinh', 'Ái', 'An', 'Ân', 'Bạch', 'Bành', 'Bao', 'Biên', 'Biện',
+	'Cam', 'Cảnh', 'Cảnh', 'Cao', 'Cái', 'Cát', 'Chân', 'Châu', 'Chiêm', 'Chu', 'Chung', 'Chử', 'Cổ', 'Cù', 'Cung', 'Cung', 'Củng', 'Cừu', 'Dịch', 'Diệp',
+	'Doãn', 'Dũ', 'Dung', 'Dư', 'Dữu', 'Đái', 'Đàm', 'Đào', 'Đậu', 'Điền', 'Đoàn', 'Đồ', 'Đồng', 'Đổng', 'Đường', 'Giả', 'Giải', 'Gia_Cát', 'Giản', 'Giang',
+	'Giáp', 'Hà', 'Hạ', 'Hậ', 'Hác', 'Hàn', 'Hầu', 'Hình', 'Hoa', 'Hoắc', 'Hoạn', 'Hồng', 'Hứa', 'Hướng', 'Hy', 'Kha', 'Khâu', 'Khổng', 'Khuất', 'Kiều', 'Kim',
+	'Kỳ', 'Kỷ', 'La', 'Lạc', 'Lại', 'Lam', 'Lăng', 'Lãnh', 'Lâm', 'Lận', 'Lệ', 'Liên', 'Liêu', 'Liễu', 'Long', 'Lôi', 'Lục', 'Lư', 'Lữ', 'Lương', 'Lưu', 'Mã', 'Mạc',
+	'Mạch', 'Mai', 'Mạnh', 'Mao', 'Mẫn', 'Miêu', 'Minh', 'Mông', 'Ngân', 'Nghê', 'Nghiêm', 'Ngư', 'Ngưu', 'Nhạc', 'Nhan', 'Nhâm', 'Nhiếp', 'Nhiều',
+	'Nhung', 'Ninh', 'Nông', 'Ôn', 'Ổn', 'Ông', 'Phí', 'Phó', 'Phong', 'Phòng', 'Phù', 'Phùng', 'Phương', 'Quách', 'Quan', 'Quản', 'Quang', 'Quảng',
+	'Quế', 'Quyền', 'Sài', 'Sầm', 'Sử', 'Tạ', 'Tào', 'Tăng', 'Tân', 'Tần', 'Tất', 'Tề', 'Thạch', 'Thai', 'Thái', 'Thang', 'Thành', 'Thảo', 'Thân', 'Thi', 'Thích',
+	'Thiện', 'Thiệu', 'Thôi', 'Thủy', 'Thư', 'Thường', 'Tiền', 'Tiết', 'Tiêu', 'Tiêu', 'Tô', 'Tôn', 'Tôn_Thất', 'Tông', 'Tống', 'Trác', 'Trạch', 'Trại',
+	'Trang', 'Trầm', 'Trâu', 'Trì', 'Triệu', 'Trịnh', 'Từ', 'Tư_Mã', 'Tưởng', 'Úc', 'Ứng', 'Vạn', 'Văn', 'Vân', 'Vi', 'Vĩnh', 'Vũ_Văn', 'Vương', 'Vưu', 'Xà',
+	'Xầm', 'Xế', 'Yên', 'Yến'
+]
+
+# vim:set ts=4 sw=4 fenc=utf8:
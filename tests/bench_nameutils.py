@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+
+# nameutils - Identify given/family names and capitalize correctly
+# https://raf.org/nameutils
+# https://github.com/rafmod/nameutils
+# https://codeberg.org/rafmod/nameutils
+#
+# Copyright (C) 2023-2025 raf <raf@raf.org>
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+# 20250708 raf <raf@raf.org>
+
+# Benchmark nameutils (usage: tests/bench_nameutils.py [count])
+
+import sys
+sys.path.insert(0, 'src')
+
+# Lower-case versions of built-in constants
+
+true = True
+false = False
+none = None
+
+from nameutils import *
+import time
+
+# Names to benchmark with (all combinations, in various cases)
+
+given_names = \
+[
+	'John', 'Mary Ann', 'Pierre', 'Hans', 'Giacomo', 'Micheal', 'Sean', 'David',
+	'Fatima', 'Sanne', 'Maredudd', 'Lorenzo', 'Min Jun', 'Kim', 'Jinping', 'Willem'
+]
+
+family_names = \
+[
+	'Smith', 'MacDonald', 'McAdam', "O'Brien", 'de la Pierre', 'von und zu Pappenhim',
+	"dall'Agnese", 'van der Haag', "'sGravesande", 'O hAodha', 'ben Joseph', 'al-Nassar',
+	'Smith-Jones', 'FitzPatrick', 'Nguyen', 'Xi', 'DeVito', 'ap Dafydd', 'Bryant Smith', 'Kim'
+]
+
+def corpus(count):
+	names = []
+	while len(names) < count:
+		for f in family_names:
+			for g in given_names:
+				names.append(g + ' ' + f)
+				names.append(uc(f + ', ' + g))
+				names.append(lc(g + '  ' + f + ' '))
+	return names[:count]
+
+def uc(s):
+	return s.upper()
+
+def lc(s):
+	return s.lower()
+
+# Return the number of seconds that func takes to process the names
+
+def bench(func, names):
+	start = time.time()
+	for name in names:
+		func(name)
+	return time.time() - start
+
+def report(label, seconds, baseline=none):
+	speedup = '' if baseline is none else '  (%.2fx)' % (baseline / seconds)
+	print('%-40s %8.3fs%s' % (label, seconds, speedup))
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+names = corpus(count)
+
+# Warm up (load data, compile regexes)
+
+for name in names[:100]:
+	namesplit(name)
+
+# ASCII fast path
+
+print('ASCII corpus: %d names' % count)
+
+for (label, func) in [('namecase', namecase), ('namesplit', namesplit), ('nametrim', nametrim)]:
+	nameutils_ascii_fast_path(false)
+	general = bench(func, names)
+	nameutils_ascii_fast_path(true)
+	fast = bench(func, names)
+	report(label + ' (general path)', general)
+	report(label + ' (ASCII fast path)', fast, general)
+
+# Table of cased words (most words' case doesn't depend on the words around them)
+
+for (label, func) in [('namecase', namecase), ('fnamecase', fnamecase), ('namesplit', namesplit)]:
+	nameutils_word_cache(false)
+	general = bench(func, names)
+	nameutils_word_cache(true)
+	report(label + ' (no word cache)', general)
+	report(label + ' (word cache)', bench(func, names), general)
+
+# Batch functions (the corpus is very repetitive)
+
+for (label, func, func_many) in [('namecase', namecase, namecase_many), ('namesplit', namesplit, namesplit_many), ('nameparts', nameparts, nameparts_many)]:
+	single = bench(func, names)
+	start = time.time()
+	func_many(names)
+	many = time.time() - start
+	report(label + ' (each)', single)
+	report(label + '_many', many, single)
+
+# Result cache (the corpus is very repetitive)
+
+for (label, func) in [('namecase', 'namecase'), ('namesplit', 'namesplit'), ('nameparts', 'nameparts')]:
+	engine = NameUtils()
+	uncached = bench(getattr(engine, func), names)
+	engine.result_cache()
+	report(label + ' (no result cache)', uncached)
+	report(label + ' (result cache)', bench(getattr(engine, func), names), uncached)
+
+# Result cache after adding an exception (only the affected results are removed)
+
+engine = NameUtils()
+engine.result_cache(count)
+cold = bench(engine.namesplit, names)
+engine.namecase_exception('MacBench')
+report('namesplit (cold result cache)', cold)
+report('namesplit (after namecase_exception)', bench(engine.namesplit, names), cold)
+
+# Process pool (distinct names, so that there's work to share)
+
+distinct_names = [ name + ' ' + str(i) for (i, name) in enumerate(names) ]
+start = time.time()
+namesplit_many(distinct_names)
+serial = time.time() - start
+report('namesplit_many (distinct names)', serial)
+namesplit_many(distinct_names[:1], processes=0) # Start the pool
+start = time.time()
+namesplit_many(distinct_names, processes=0)
+report('namesplit_many (processes=0)', time.time() - start, serial)
+
+# Result cache file (results from a previous run)
+
+import os
+import tempfile
+
+path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+engine = NameUtils()
+engine.result_cache(count, path)
+engine.namesplit_many(distinct_names)
+engine = NameUtils()
+engine.result_cache(count, path)
+start = time.time()
+engine.namesplit_many(distinct_names)
+report('namesplit_many (result cache file)', time.time() - start, serial)
+del engine
+for suffix in ['', '-wal', '-shm']:
+	if os.path.exists(path + suffix):
+		os.remove(path + suffix)
+os.rmdir(os.path.dirname(path))
+
+# Warming up a new engine with the results of a previous run (see result_cache_save())
+
+path = os.path.join(tempfile.mkdtemp(), 'bench.tsv')
+engine = NameUtils()
+engine.result_cache(count)
+engine.namesplit_many(distinct_names)
+engine.result_cache_save(path)
+start = time.time()
+engine = NameUtils()
+engine.result_cache(count)
+engine.namesplit_many(distinct_names)
+cold = time.time() - start
+report('namesplit_many (distinct, new engine)', cold)
+start = time.time()
+engine = NameUtils()
+engine.warmup(path)
+report('warmup (results file)', time.time() - start)
+start = time.time()
+engine.namesplit_many(distinct_names)
+report('namesplit_many (distinct, after warmup)', time.time() - start, cold)
+os.remove(path)
+os.rmdir(os.path.dirname(path))
+
+# Thread pool (only quicker when free-threaded, as names are too short to match without the GIL)
+
+for threads in [1, 2, 4, 8]:
+	start = time.time()
+	namesplit_many(distinct_names, threads=threads)
+	report('namesplit_many (threads=%d)' % threads, time.time() - start, serial)
+
+# Engines (each loads and compiles its own data) and overlays (sharing a base engine's data)
+
+base = NameUtils()
+base.namesplit('习近平')
+
+for (label, new_engine) in [('20 new engines', NameUtils), ('20 overlays', base.overlay)]:
+	start = time.time()
+	for i in range(20):
+		engine = new_engine()
+		engine.namecase_exception('MacTenant' + str(i))
+		engine.namesplit('习近平')
+	report(label + ' (first namesplit)', time.time() - start)
+
+# Building the data from scratch and loading it from a snapshot
+
+path = os.path.join(tempfile.mkdtemp(), 'bench.snapshot')
+base.snapshot_save(path)
+start = time.time()
+for i in range(20):
+	NameUtils().data_snapshot()
+built = time.time() - start
+report('20 new engines (build data)', built)
+start = time.time()
+for i in range(20):
+	NameUtils().snapshot_load(path)
+report('20 new engines (snapshot_load)', time.time() - start, built)
+os.remove(path)
+os.rmdir(os.path.dirname(path))
+
+# Adding exceptions one at a time and all at once
+
+exceptions = [ 'MacBench%d' % i for i in range(count) ] + [ 'Bench%d, Jo' % i for i in range(count) ]
+start = time.time()
+engine = NameUtils()
+for name in exceptions:
+	engine.namecase_exception(name)
+	engine.namesplit_exception(name)
+single = time.time() - start
+report('namecase/namesplit_exception (each)', single)
+start = time.time()
+engine = NameUtils()
+engine.namecase_exception_many(exceptions)
+engine.namesplit_exception_many(exceptions)
+report('namecase/namesplit_exception_many', time.time() - start, single)
+
+# Individual exceptions in memory and in a store (most names aren't exceptions)
+
+individual = [ _ for _ in exceptions if _.find(',') != -1 ]
+engine = NameUtils()
+engine.namecase_exception_many(individual)
+memory = bench(engine.namecase, names)
+report('namecase (individual exceptions)', memory)
+path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+engine = NameUtils()
+engine.exception_store(path)
+engine.namecase_exception_many(individual)
+report('namecase (individual exceptions stored)', bench(engine.namecase, names), memory)
+del engine
+os.remove(path)
+os.rmdir(os.path.dirname(path))
+
+# Exception lookup keys (non-ASCII)
+
+keys = [ _ + '’–é' for _ in names ]
+start = time.time()
+kc_many(keys)
+report('kc_many (non-ASCII)', time.time() - start)
+
+# Importing the module (in new processes, after importing regex), with the
+# data that each first call imports (the generated data, see make derived,
+# and the Japanese table for Japanese names)
+
+import subprocess
+
+for (label, code) in [('import', ''), ('import + namecase', "namecase('john smith')"), ('import + namesplit', "namesplit('john smith')"), ('import + namesplit (Hangul)', "namesplit('김철수')"), ('import + namesplit (Japanese)', "namesplit('山田太郎')")]:
+	script = 'import time, regex\nstart = time.time()\nfrom nameutils import *\n%s\nprint(time.time() - start)' % code
+	runs = [ float(subprocess.run([sys.executable, '-c', script], env=dict(os.environ, PYTHONPATH='src'), capture_output=true, text=true).stdout) for i in range(5) ]
+	report(label, min(runs))
+
+# Private memory of a forked worker after a collection and its first names
+# (Linux only), without and with warmup() in the parent
+
+if hasattr(os, 'fork') and os.path.exists('/proc/self/smaps_rollup'):
+	script = "import sys, os, gc\nfrom nameutils import *\n%s\ndef private():\n\twith open('/proc/self/smaps_rollup') as file:\n\t\treturn sum([ int(_.split()[1]) for _ in file if _.startswith(('Private_Clean:', 'Private_Dirty:')) ])\npid = os.fork()\nif pid == 0:\n\tbefore = private()\n\tgc.collect()\n\tnamesplit_many(['xi jinping', '习近平', '김철수', '山田太郎', 'nguyen van an', 'ann de la pierre'])\n\tprint(private() - before)\n\tsys.stdout.flush()\n\tos._exit(0)\nos.waitpid(pid, 0)\n"
+	for (label, code) in [('forked worker', "namecase('john smith')"), ('forked worker (warmup)', 'warmup()'), ('forked worker (warmup, freeze)', 'warmup(freeze=True)')]:
+		kb = subprocess.run([sys.executable, '-c', script % code], env=dict(os.environ, PYTHONPATH='src'), capture_output=true, text=true).stdout
+		print('%-40s %8dkB private' % (label, int(kb)))
+
+# vim:set ts=4 sw=4 fenc=utf8:
@@ -85,6 +85,7 @@ test_cases = \
 	"de' Medici, Lorenzo",
 	"de Groot, John",
 	"de la Pierre, Pierre",
+	"de Lamar, Pierre",
 	"del Mar, Maria",
 	"dela Mar, Maria",
 	"dels Àngels, Maria",
@@ -113,6 +114,7 @@ test_cases = \
 	"von der Trave, Thomas",
 	"zu Pappenhim, Hans",
 	"von und zu Pappenhim, Hans",
+	"von Und, Hans",
 
 	"van Haag, Bram",
 	"der Haag, Jeroen",
@@ -122,6 +124,7 @@ test_cases = \
 	"van der Haag, Eva",
 	"van den Haag, Willem",
 	"van het Horst, Mees",
+	"van Hettema, Mees",
 	"van Voorst tot Voorst, Henrik",
 	"'sGravesande, Willem",
 	"van 'sHertogenbosch, Gemeente",
@@ -271,7 +274,16 @@ nametrim_cases = \
 	["    Smith   ,John     ", "Smith, John"],
 	[" 		   Smith 	  , 	 John  	   ", "Smith, John"],
 	["  Peter Smith - Jones  ", "Peter Smith-Jones"],
-	[" Smith - Jones ,Peter ", "Smith-Jones, Peter"]
+	[" Smith - Jones ,Peter ", "Smith-Jones, Peter"],
+	["\u00a0Smith\u2003–\u3000Jones\u00a0,Péter\u2028", "Smith–Jones, Péter"],
+	["Zoë  ,  Brontë", "Zoë, Brontë"],
+	["Smith ‐ , Jöhn", "Smith‐, Jöhn"],
+	["Smith,,John", "Smith, , John"],
+	["Smith , ,John", "Smith, , John"],
+	["Smith,", "Smith, "],
+	[", John", ", John"],
+	["Smith,-John", "Smith, -John"],
+	["Smith - - Jones", "Smith--Jones"]
 ]
 
 # Test cases for namecase_exception() are strings containing
@@ -290,7 +302,21 @@ case_exception_cases = \
 	"MacOther, Bruce",
 	"mArrier D'uNiEnViLlE, aLiX",
 	"MacDhòmhnaill",
-	"NicDhonnchaidh"
+	"NicDhonnchaidh",
+	"DeLa Cruz",
+	"DeLa Cruz-Smith",
+	"D'Artagnan"
+]
+
+# Test cases for non-individual namecase_exception() with non-ASCII
+# apostrophe-like and hyphen-like characters. Each case is an arrayref.
+# The first item is the exception. The remaining items are family names
+# that must be replaced by the exception.
+
+case_exception_punctuation_cases = \
+[
+	["D'Artagnan", "d’artagnan", "D’ARTAGNAN", "dʼArtagnan"],
+	["DeLa Cruz-Smith", "dela cruz‐smith", "DELA CRUZ–SMITH"]
 ]
 
 # Test cases for namesplit_exceptions() are strings containing
@@ -382,7 +408,10 @@ chinese_split_cases = \
 	["Tʼang Jinping", "Tʼang, Jinping"],
 	["Jinping Tʼang", "Tʼang, Jinping"],
 	["Tʻang Jinping", "Tʻang, Jinping"],
-	["Jinping Tʻang", "Tʻang, Jinping"]
+	["Jinping Tʻang", "Tʻang, Jinping"],
+
+	["Ts’ai Ing-wen", "Ts’ai, Ing-Wen"],
+	["Ing-wen Ts’ai", "Ts’ai, Ing-Wen"]
 ]
 
 # Korean test cases for namesplit
@@ -539,11 +568,78 @@ post_reset_case_exception_cases = \
 	["Macdonald", "MacAlister"]
 ]
 
+# Test cases for regex caching. Each case is a name that is passed to
+# namecase() and namesplit() twice. The second time, no regexes should be
+# compiled.
+
+re_stats_cases = \
+[
+	"John Peter Smith",
+	"Rhys ap Dafydd",
+	"Micheal O hAodha",
+	"David ben Joseph v'Rachel",
+	"Nguyen Kim",
+	"Kim Min Jun",
+	"习近平"
+]
+
+# Test cases for the ASCII fast path are ASCII names (in addition to the
+# ASCII names in test_cases and nametrim_cases) that must get the same
+# results with the ASCII fast path as without it.
+
+ascii_cases = \
+[
+	" \v Smith\f-\tJones ,,Peter\r\n",
+	"\x1cSmith\x1f Jones", # Not spaces (but they are for str.isspace())
+	"o'brien-smith,  mary'  - ann",
+	"O HAODHA, MICHEAL",
+	"de la  cruz , 'sgravesande - van het horst",
+	"DAVID BEN JOSEPH HA-LEVI",
+	"d'iapico v'rachel",
+	"Kim Min Jun",
+	"Nguyen Kim"
+]
+
+# Test cases for kc_many() contain a name and its exception lookup key
+
+kc_cases = \
+[
+	["Smith", "smith"],
+	["O'Brien-Smith", "o'brien-smith"],
+	["O’Brien‐Smith", "o'brien-smith"], # U+2019 Right Single Quotation Mark, U+2010 Hyphen
+	["OʼBrien‑Smith", "o'brien-smith"], # U+02BC Modifier Letter Apostrophe, U+2011 Non-Breaking Hyphen
+	["OʻBrien–Smith", "o'brien-smith"], # U+02BB Modifier Letter Turned Comma, U+2013 En Dash
+	["O'Brien—Smith", "o'brien-smith"], # U+2014 Em Dash
+	["O'Brien⸺Smith", "o'brien-smith"], # U+2E3A Two-Em Dash
+	["Straße", "strasse"],
+	["ŉ", "'n"], # U+0149 Latin Small Letter N Preceded By Apostrophe
+	["O‘Brien", "o‘brien"] # U+2018 Left Single Quotation Mark (not apostrophe-like)
+]
+
+# Test cases for the batch functions are names (in addition to the names
+# in test_cases and the CJK split cases) that must get the same results
+# from namecase_many(), namesplit_many(), and nameparts_many() as from
+# namecase(), namesplit(), and nameparts(). Each is tested as supplied,
+# and uppercased, and lowercased, and with extra spaces, twice.
+
+many_cases = \
+[
+	none,
+	"",
+	"   ",
+	"王 Wei Ming", # Case isn't changed after a Chinese family name
+	"王 WEI MING",
+	"O’Brien, Mary",
+	"O'Brien, Mary",
+	"İbrahim Yılmaz"
+]
+
 # Disable test suites temporarily
 
 #test_cases = []
 #nametrim_cases = []
 #case_exception_cases = []
+#case_exception_punctuation_cases = []
 #split_exception_cases = []
 #nonascii_punctuation_cases = []
 #normalization_cases = []
@@ -555,6 +651,10 @@ post_reset_case_exception_cases = \
 #cjk_split_exception_cases = []
 #namejoin_cases = []
 #post_reset_case_exception_cases = []
+#re_stats_cases = []
+#ascii_cases = []
+#kc_cases = []
+#many_cases = []
 
 # Define some helper functions
 
@@ -810,6 +910,7 @@ class Test(unittest.TestCase):
 		for case in nametrim_cases:
 			(input, output) = case
 			self.eq(nametrim(input), output) # "nametrim '@{[$in // 'undef']}'"
+			self.eq(nametrim(output), output) # "nametrim '@{[$out // 'undef']}' again"
 
 		# Test case_exception
 
@@ -910,6 +1011,16 @@ class Test(unittest.TestCase):
 				self.eq(new_family, family) # "namecase_exception(lc $case): family ($new_family) should be ($family)"
 				self.eq(new_full, new_full_expected) # "namecase_exception(lc $case): other ($new_full) should be ($new_full_expected)"
 
+		# Test non-individual case exceptions with non-ASCII punctuation
+
+		for case in case_exception_punctuation_cases:
+
+			namecase_exception(case[0])
+
+			for next in case[1:]:
+				self.eq(namecase(next, 'family'), case[0]) # "namecase_exception($case[0]): $next"
+				self.eq(namecase(next + ', Anybody'), case[0] + ', Anybody') # "namecase_exception($case[0]): $next, Anybody"
+
 		# Test split_exception
 
 		#self.eq(namesplit_exception(), 0) # "namesplit_exception: noargs"
@@ -1120,6 +1231,768 @@ class Test(unittest.TestCase):
 			self.eq(namecase(uc(followup)), followup) # "post-reset namecase_exception follow-up: " . uc $followup;
 			self.eq(namecase(lc(followup)), followup) # "post-reset namecase_exception follow-up: " . lc $followup;
 
-unittest.main()
+		# Test that regexes are compiled once and then reused
+
+		for case in re_stats_cases:
+			namecase(case)
+			namesplit(case)
+
+		stats = nameutils_re_stats()
+
+		for case in re_stats_cases:
+			namecase(case)
+			namesplit(case)
+
+		self.eq(nameutils_re_stats()['compiles'], stats['compiles']) # "regex compiles after warm-up"
+		self.eq(nameutils_re_stats()['hits'] > stats['hits'], true) # "regex cache hits after warm-up"
+
+		# Test that new case exceptions don't cause recompilation, but normalization does
+
+		namecase_exception('MacRe')
+		self.eq(namecase('macre, john'), 'MacRe, John') # "no regex rebuilt after namecase_exception"
+		self.eq(nameutils_re_stats()['compiles'], stats['compiles']) # "no regex compiles after namecase_exception"
+
+		normalize(NFC)
+		self.eq(nameutils_re_stats()['cached'], 0) # "regex cache cleared by normalize"
+		self.eq(namecase('macre, john'), 'MacRe, John') # "regex rebuilt after normalize"
+
+		# Test that ASCII names get the same results with and without the ASCII fast path
+
+		ascii_names = list(ascii_cases)
+		for case in test_cases + nametrim_cases:
+			name = case['name'] if type(case) == dict else case[0] if type(case) == list else case
+			if name is not none and r(r'[^\x00-\x7f]').search(name) is none:
+				ascii_names.append(name)
+
+		for name in ascii_names:
+			for name in [name, uc(name), lc(name)]:
+				results = []
+				for enabled in [true, false]:
+					nameutils_ascii_fast_path(enabled)
+					results.append([namecase(name), gnamecase(name), fnamecase(name), fnamecase(name, 'John'), namesplit(name), nameparts(name), nametrim(name), namejoin(name, name)])
+				self.eq(results[0], results[1]) # "ASCII fast path: " . $name
+
+		nameutils_ascii_fast_path(true)
+
+		# Test that names get the same results with and without the table of cased words
+
+		word_names = []
+		for case in test_cases + nametrim_cases:
+			name = case['name'] if type(case) == dict else case[0] if type(case) == list else case
+			if name is not none:
+				word_names.append(name)
+
+		for name in word_names:
+			for name in [name, uc(name), lc(name)]:
+				results = []
+				for enabled in [true, false]:
+					nameutils_word_cache(enabled)
+					results.append([namecase(name), gnamecase(name), fnamecase(name), fnamecase(name, 'John'), namesplit(name), nameparts(name)])
+				self.eq(results[0], results[1]) # "word cache: " . $name
+
+		nameutils_word_cache(true)
+
+		# Test namecase_many, namesplit_many, and nameparts_many
+
+		many_names = []
+		for case in many_cases + test_cases + chinese_split_cases + korean_split_cases + vietnamese_split_cases + japanese_split_cases:
+			name = case['name'] if type(case) == dict else case[0] if type(case) == list else case
+			many_names += [name] if name is none or name.strip() == '' else [name, uc(name), lc(name), ' ' + name + '  ']
+		many_names += many_names
+
+		self.eq(namecase_many(many_names), [namecase(_) for _ in many_names]) # "namecase_many"
+		self.eq(namecase_many(iter(many_names), 'given'), [gnamecase(_) for _ in many_names]) # "namecase_many given"
+		self.eq(namecase_many(many_names, 'family'), [fnamecase(_) for _ in many_names]) # "namecase_many family"
+		self.eq(namesplit_many(iter(many_names)), [namesplit(_) for _ in many_names]) # "namesplit_many"
+		self.eq(nameparts_many(iter(many_names)), [nameparts(_) for _ in many_names]) # "nameparts_many"
+		self.eq(namecase_many([]), []) # "namecase_many empty"
+
+		namecase_exception("MacMany, Jo")
+		family_names = ['macmany', 'MACMANY', 'MacMany', 'macmany', 'Macmany']
+		given_names = ['jo', 'Jo', 'JO', 'Joe', none]
+		self.eq(namecase_many(family_names, 'family', given_names), [fnamecase(f, g) for (f, g) in zip(family_names, given_names)]) # "namecase_many family with given names"
+		self.eq(namecase_many(family_names, 'family', given_names), ['MacMany', 'MacMany', 'MacMany', 'Macmany', 'Macmany']) # "namecase_many individual exceptions"
+
+		parts = nameparts_many(['Smith, John', 'Smith, John'])
+		parts[0].append('Changed')
+		self.eq(parts[1], ['Smith', 'John']) # "nameparts_many lists aren't shared"
+
+		# Test the batch functions with a pool of processes (and that it gets new exceptions)
+
+		self.eq(namecase_many(many_names, processes=2), [namecase(_) for _ in many_names]) # "namecase_many processes"
+		self.eq(namecase_many(family_names, 'family', given_names, processes=2), [fnamecase(f, g) for (f, g) in zip(family_names, given_names)]) # "namecase_many family processes"
+		self.eq(namesplit_many(iter(many_names), processes=2), [namesplit(_) for _ in many_names]) # "namesplit_many processes"
+		self.eq(nameparts_many(many_names, processes=2), [nameparts(_) for _ in many_names]) # "nameparts_many processes"
+
+		namecase_exception("MacPool")
+		namesplit_exception("Pool Smith, Jo")
+		self.eq(namecase_many(['macpool, jo', 'MACPOOL, JO'], processes=2), ['MacPool, Jo', 'MacPool, Jo']) # "namecase_many processes new exception"
+		self.eq(namesplit_many(['jo pool smith'], processes=2), ['Pool Smith, Jo']) # "namesplit_many processes new exception"
+		self.eq(namesplit_many([], processes=0), []) # "namesplit_many processes empty"
+
+		# Test the batch functions with a pool of threads
+
+		self.eq(namecase_many(many_names, threads=3), [namecase(_) for _ in many_names]) # "namecase_many threads"
+		self.eq(namecase_many(family_names, 'family', given_names, threads=2), [fnamecase(f, g) for (f, g) in zip(family_names, given_names)]) # "namecase_many family threads"
+		self.eq(namesplit_many(iter(many_names), threads=0), [namesplit(_) for _ in many_names]) # "namesplit_many threads"
+		self.eq(nameparts_many(many_names, threads=2), [nameparts(_) for _ in many_names]) # "nameparts_many threads"
+
+		# Test that the data loaded when first needed is loaded safely by many threads at once
+
+		import threading
+
+		nameutils_reset_data()
+		expected = [namesplit(_) for _ in many_names]
+		nameutils_reset_data()
+		threaded_results = {}
+		def namesplit_thread(i):
+			threaded_results[i] = [namesplit(_) for _ in many_names]
+		threads = [ threading.Thread(target=namesplit_thread, args=(i,)) for i in range(8) ]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		for i in range(8):
+			self.eq(threaded_results[i], expected) # "namesplit in threads during data loading"
+
+		# Test that threads using process pools of different sizes at the same time
+		# don't terminate each other's pools
+
+		engine = NameUtils()
+		expected = [ engine.namecase(_) for _ in many_names ]
+		pool_errors = []
+		def pool_thread(processes):
+			try:
+				for i in range(3):
+					if engine.namecase_many(many_names, processes=processes) != expected:
+						pool_errors.append('results')
+			except Exception as e:
+				pool_errors.append(repr(e))
+		threads = [ threading.Thread(target=pool_thread, args=(_,), daemon=true) for _ in [2, 3] ]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join(60)
+		self.eq([ _.is_alive() for _ in threads ] + pool_errors, [false, false]) # "process pools in threads"
+		self.eq(list(engine.pool_users.values()), [0]) # "process pools in threads replaced pools terminated"
+		del engine
+
+		# Test kc_many (and again after normalize)
+
+		self.eq(kc_many([case[0] for case in kc_cases]), [case[1] for case in kc_cases]) # "kc_many"
+		self.eq(kc_many([]), []) # "kc_many empty"
+		normalize(NFC)
+		self.eq(kc_many(case[0] for case in kc_cases), [case[1] for case in kc_cases]) # "kc_many after normalize"
+
+		# Test engines (each with its own exceptions and normalization)
+
+		nameutils_reset_data()
+		engine = NameUtils()
+		other = NameUtils()
+		self.eq([engine.namecase(_) for _ in many_names], [namecase(_) for _ in many_names]) # "engine namecase"
+		for (input, output) in chinese_split_cases + korean_split_cases + japanese_split_cases:
+			self.eq(engine.namesplit(input), output) # "engine namesplit($in)"
+		self.eq(engine.nameparts_many(['Jinping Xi', 'Xi Jinping']), [['Xi', 'Jinping'], ['Xi', 'Jinping']]) # "engine nameparts_many"
+
+		engine.namecase_exception("MacTenant")
+		engine.namecase_exception("MacTenant, Jo Ann")
+		engine.namesplit_exception("Tenant Smith, Ann")
+		self.eq(engine.namecase('mactenant, jo'), 'MacTenant, Jo') # "engine namecase_exception"
+		self.eq(engine.fnamecase('MACTENANT', 'Jo Ann'), 'MacTenant') # "engine individual namecase_exception"
+		self.eq(engine.namesplit('ann tenant smith'), 'Tenant Smith, Ann') # "engine namesplit_exception"
+		self.eq(other.namecase('mactenant, jo'), 'Mactenant, Jo') # "other engine namecase_exception"
+		self.eq(other.namesplit('ann tenant smith'), 'Smith, Ann Tenant') # "other engine namesplit_exception"
+		self.eq(namecase('mactenant, jo'), 'Mactenant, Jo') # "default engine namecase_exception"
+		self.eq(namesplit('ann tenant smith'), 'Smith, Ann Tenant') # "default engine namesplit_exception"
+
+		self.eq(engine.namecase_many(['mactenant, jo', 'MACTENANT, JO'], processes=2), ['MacTenant, Jo', 'MacTenant, Jo']) # "engine namecase_many processes"
+		self.eq(engine.namesplit_many(['ann tenant smith'], threads=2), ['Tenant Smith, Ann']) # "engine namesplit_many threads"
+		self.eq(namesplit_many(['ann tenant smith'], processes=2), ['Smith, Ann Tenant']) # "default engine namesplit_many processes"
+
+		nfd_engine = NameUtils(NFD)
+		for case in normalization_cases:
+			nfd_engine.namecase_exception(NFD(case))
+			nfd_engine.namesplit_exception(NFD(case))
+			self.eq(nfd_engine.namecase(NFD(uc(case))), NFD(case)) # "NFD engine namecase(NFD $case)"
+			self.eq(nfd_engine.namesplit(NFD(lc(case))), NFD(case)) # "NFD engine namesplit(NFD $case)"
+			self.eq(namecase(NFC(uc(case))), namecase(NFC(lc(case)))) # "default engine not normalized"
+			self.eq(namecase(NFC(uc(case))) != NFC(case), true) # "default engine without exception"
+
+		# Test overlay engines (with their own exceptions on top of a base engine's shared data)
+
+		base = NameUtils()
+		base.namecase_exception("MacBase")
+		tenant = base.overlay()
+		other = base.overlay()
+		tenant.namecase_exception("MacTenant")
+		tenant.namecase_exception("MacTenant, Jo Ann")
+		tenant.namesplit_exception("Tenant Smith, Ann")
+		self.eq(tenant.family_names_ck_first_rec is base.family_names_ck_first_rec, true) # "overlay shares compiled data"
+		self.eq(len(dict.keys(tenant.exceptions.namecase_exceptions)), 1) # "overlay only stores its own exceptions"
+		self.eq(tenant.namecase('mactenant macbase, macdonald'), 'MacTenant MacBase, MacDonald') # "overlay namecase_exception"
+		self.eq(tenant.fnamecase('MACTENANT', 'Jo Ann'), 'MacTenant') # "overlay individual namecase_exception"
+		self.eq(tenant.namesplit('ann tenant smith'), 'Tenant Smith, Ann') # "overlay namesplit_exception"
+		self.eq(other.namecase('mactenant macbase'), 'Mactenant MacBase') # "other overlay namecase_exception"
+		self.eq(other.namesplit('ann tenant smith'), 'Smith, Ann Tenant') # "other overlay namesplit_exception"
+		self.eq(base.namecase('mactenant macbase'), 'Mactenant MacBase') # "base namecase_exception"
+		for (input, output) in chinese_split_cases + korean_split_cases + japanese_split_cases:
+			self.eq(tenant.namesplit(input), output) # "overlay namesplit($in)"
+
+		base.namecase_exception("MacLater")
+		base.namesplit_exception("Later Smith, Ann")
+		self.eq(tenant.namecase('maclater'), 'MacLater') # "overlay gets later base namecase_exception"
+		self.eq(tenant.namesplit('ann later smith'), 'Later Smith, Ann') # "overlay gets later base namesplit_exception"
+		tenant.namecase_exception("Maclater")
+		self.eq(tenant.namecase('maclater'), 'Maclater') # "overlay overrides base namecase_exception"
+		self.eq(base.namecase('maclater'), 'MacLater') # "base not overridden by overlay"
+
+		nested = tenant.overlay()
+		nested.namecase_exception("MacNested")
+		self.eq(nested.namecase('macnested mactenant macbase'), 'MacNested MacTenant MacBase') # "nested overlay"
+		self.eq(tenant.namecase('macnested'), 'Macnested') # "nested overlay exception not in base"
+		self.eq(nested.namecase_many(['macnested mactenant', 'MACLATER'], processes=2), ['MacNested MacTenant', 'Maclater']) # "overlay namecase_many processes"
+		self.eq(nested.namesplit_many(['ann tenant smith'], threads=2), ['Tenant Smith, Ann']) # "overlay namesplit_many threads"
+
+		nested.normalize(NFD)
+		self.eq(nested.namecase(NFD('macnested mactenant')), 'MacNested MacTenant') # "normalized overlay"
+		self.eq(tenant.namecase('macnested'), 'Macnested') # "normalized overlay doesn't affect base"
+
+		# Test that an overlay's multi-word exception doesn't hide its base engine's
+		# longer multi-word exceptions that start with the same word
+
+		multi_base = NameUtils()
+		multi_tenant = multi_base.overlay()
+		multi_tenant.namecase_exception('DeLa Cruz')
+		multi_base.namecase_exception('DeLa Cruz-SmithJones')
+		self.eq(multi_base.namecase('ann dela cruz-smithjones'), 'Ann DeLa Cruz-SmithJones') # "multi-word exception in base"
+		self.eq(multi_tenant.namecase('ann dela cruz-smithjones'), 'Ann DeLa Cruz-SmithJones') # "overlay multi-word exception with longer one in base"
+		self.eq(multi_tenant.namecase('ann dela cruz'), 'Ann DeLa Cruz') # "overlay multi-word exception with longer one in base still applies"
+		del multi_tenant
+		del multi_base
+
+		# Test adding exceptions while other threads are using them (with enough
+		# exceptions for the large exceptions dicts to be layered and merged)
+
+		base = NameUtils()
+		tenant = base.overlay()
+		torn = []
+		def namecase_thread(engine):
+			for i in range(0, 2000, 7):
+				for (name, *results) in [('mactorn%d' % i, 'Mactorn%d' % i, 'MacTorn%d' % i), ('ann mactorn%d' % i, 'Ann Mactorn%d' % i, 'Ann MacTorn%d' % i, 'MacTorn%d, Ann' % i)]:
+					if engine.namecase(name) not in results:
+						torn.append(name)
+		threads = [ threading.Thread(target=namecase_thread, args=(_,)) for _ in [base, tenant, base, tenant] ]
+		for thread in threads:
+			thread.start()
+		for i in range(2000):
+			base.namecase_exception('MacTorn%d' % i)
+			base.namecase_exception('MacTorn%d, Ann' % i)
+		for thread in threads:
+			thread.join()
+		self.eq(torn, []) # "namecase while adding exceptions"
+		self.eq(tenant.namecase_many(['mactorn0', 'ann mactorn1999']), ['MacTorn0', 'MacTorn1999, Ann']) # "overlay after adding base exceptions"
+		self.eq(base.namecase('jo mactorn1000 smith'), 'Jo MacTorn1000 Smith') # "namecase after layered exceptions"
+
+		# Test that namesplit() uses one set of exceptions throughout, even if
+		# exceptions are added while it's working out the split
+
+		engine = NameUtils()
+		namesplit_load = engine.namesplit_load
+		def namesplit_load_adding():
+			if engine.namesplit_load is namesplit_load_adding:
+				del engine.namesplit_load
+				engine.namecase_exception('MacSnap')
+			return namesplit_load()
+		engine.namesplit_load = namesplit_load_adding
+		self.eq(engine.namesplit('ann macsnap'), 'Macsnap, Ann') # "namesplit exceptions snapshot"
+		self.eq(engine.namesplit('ann macsnap'), 'MacSnap, Ann') # "namesplit exceptions after snapshot"
+
+		# Test adding many exceptions at once (from iterables and files)
+
+		import os
+		import time
+		import tempfile
+
+		engine = NameUtils()
+		self.eq(engine.namecase_exception_many(['MacBulk', 'van der MacBulk', 'MacBulk, Jo Ann', '', none, 'A, B, C', 'Smith,']), [(4, ''), (5, none), (6, 'A, B, C'), (7, 'Smith,')]) # "namecase_exception_many rejected"
+		self.eq(engine.namecase('macbulk van der macbulk'), 'MacBulk van der MacBulk') # "namecase_exception_many family-wide"
+		self.eq(engine.fnamecase('MACBULK', 'Jo Ann'), 'MacBulk') # "namecase_exception_many individual"
+		self.eq(engine.namesplit_exception_many(['Bulk Smith, Ann', 'Bulk Smith', '习, 近平']), [(2, 'Bulk Smith')]) # "namesplit_exception_many rejected"
+		self.eq(engine.namesplit('ann bulk smith'), 'Bulk Smith, Ann') # "namesplit_exception_many"
+		self.eq(engine.namesplit('习近平'), '习, 近平') # "namesplit_exception_many CJK"
+
+		directory = tempfile.mkdtemp()
+		for (filename, content, family_line, bad_line) in [('case.txt', '# Case\nMacFile\n\nMacFile, Jo\nA, B, C\n', 2, 5), ('case.csv', '# Case\nMacFile,\n"MacFile",Jo\nA,B,C\n', 2, 4), ('case.tsv', 'MacFile\nMacFile\tJo\n\n\nA\tB\tC\n', 1, 5)]:
+			path = os.path.join(directory, filename)
+			with open(path, 'w', encoding='utf-8') as file:
+				file.write(content)
+			engine = NameUtils()
+			self.eq(engine.namecase_exception_many(path), [(bad_line, 'A, B, C')]) # "namecase_exception_many($filename) rejected"
+			self.eq(engine.namecase('jo macfile'), 'MacFile, Jo') # "namecase_exception_many($filename) individual"
+			self.eq(engine.namecase('ann macfile'), 'Ann MacFile') # "namecase_exception_many($filename) family-wide"
+			self.eq(engine.namesplit_exception_many(path), [(family_line, 'MacFile'), (bad_line, 'A, B, C')]) # "namesplit_exception_many($filename) rejected"
+			os.remove(path)
+		os.rmdir(directory)
+
+		tenant = base.overlay()
+		self.eq(tenant.namecase_exception_many(['MacTenantBulk']), []) # "overlay namecase_exception_many"
+		self.eq(tenant.namecase('mactenantbulk mactorn5'), 'MacTenantBulk MacTorn5') # "overlay namecase_exception_many with base exceptions"
+		self.eq(base.namecase('mactenantbulk'), 'Mactenantbulk') # "overlay namecase_exception_many not in base"
+
+		# Test keeping individual and split exceptions in a store
+
+		directory = tempfile.mkdtemp()
+		path = os.path.join(directory, 'exceptions.db')
+		engine = NameUtils()
+		engine.namecase_exception('MacStore, Jo')
+		engine.namesplit_exception('Store Smith, Ann')
+		self.eq(engine.exception_store(path), 1) # "exception_store"
+		self.eq(engine.namecase('jo macstore'), 'MacStore, Jo') # "exception_store keeps individual exceptions"
+		self.eq(engine.namesplit('ann store smith'), 'Store Smith, Ann') # "exception_store keeps split exceptions"
+		self.eq(engine.namecase_exception_many([ 'MacStore%d, Jo' % i for i in range(1000) ] + ['MacStoreFamily']), []) # "exception_store namecase_exception_many"
+		self.eq(engine.namecase('jo macstore999'), 'MacStore999, Jo') # "exception_store after growing"
+		self.eq(engine.fnamecase('MACSTORE5', 'Jo'), 'MacStore5') # "exception_store fnamecase"
+		self.eq(engine.namecase('ann macstore5'), 'Ann Macstore5') # "exception_store miss"
+		self.eq(engine.namecase('ann macstorefamily'), 'Ann MacStoreFamily') # "exception_store family-wide"
+		self.eq(engine.namecase_many(['jo macstore7', 'ann macstore7'], threads=2), ['MacStore7, Jo', 'Ann Macstore7']) # "exception_store threads"
+		self.eq(engine.namesplit_many(['ann store smith', 'ann smith'], processes=2), ['Store Smith, Ann', 'Smith, Ann']) # "exception_store processes"
+
+		tenant = engine.overlay()
+		self.eq(tenant.exception_store(path), 0) # "overlay exception_store"
+		tenant.namecase_exception('MacStore9, Ann')
+		self.eq(tenant.namecase_many(['ann macstore9', 'jo macstore9']), ['MacStore9, Ann', 'MacStore9, Jo']) # "overlay with store"
+		self.eq(engine.namecase('ann macstore9'), 'Ann Macstore9') # "overlay with store not in base"
+
+		engine = NameUtils()
+		engine.exception_store(path)
+		self.eq([engine.namecase('jo macstore3'), engine.namesplit('ann store smith')], ['MacStore3, Jo', 'Store Smith, Ann']) # "exception_store reopened"
+		self.eq(engine.namecase('ann macstorefamily'), 'Ann Macstorefamily') # "exception_store reopened without family-wide"
+		del engine
+		del tenant
+
+		# Test that a set of exceptions with a store never changes, and that the
+		# entries written by other engines (like other processes) are only seen
+		# after a refresh (by a reloader), even when the Bloom filter lets them by
+
+		engine = NameUtils()
+		engine.exception_store(path)
+		engine.result_cache(100)
+		snapshot = engine.namecase_exceptions_load()
+		engine.namecase_exception('MacLater, Jo')
+		self.eq([engine.namecase_trimmed('jo maclater', exceptions=snapshot), engine.namecase('jo maclater')], ['Jo Maclater', 'MacLater, Jo']) # "exception_store snapshot"
+		other = NameUtils()
+		other.exception_store(path)
+		other.namecase_exception('MacOther, Jo')
+		import nameutils.nameutils
+		for name in nameutils.nameutils.store_names:
+			file = getattr(engine.exceptions, name).file
+			file.bloom = (bytearray(b'\xff' * len(file.bloom[0])), file.bloom[1])
+		self.eq(engine.namecase('jo macother'), 'Jo Macother') # "exception_store other engine not seen"
+		reloader = engine.exception_reloader([], interval=none)
+		self.eq(engine.namecase('jo macother'), 'MacOther, Jo') # "exception_store other engine seen after refresh"
+		self.eq(engine.namecase('jo maclater'), 'MacLater, Jo') # "exception_store own entries after refresh"
+		engine.namecase_exception('MacAfter, Jo')
+		self.eq(other.namecase('jo macafter'), 'Jo Macafter') # "exception_store other engine not refreshed"
+		other.exception_reloader([], interval=none)
+		self.eq(other.namecase('jo macafter'), 'MacAfter, Jo') # "exception_store other engine refreshed"
+
+		# Test that a thread's connection to a store is closed when it exits
+
+		import gc
+		import weakref
+		connections = []
+		def store_thread():
+			engine.namecase_trimmed('jo macother')
+			connections.append(weakref.ref(engine.exceptions.namecase_exceptions_full.file.local.connection))
+		thread = threading.Thread(target=store_thread)
+		thread.start()
+		thread.join()
+		del thread
+		gc.collect()
+		self.eq([ _() for _ in connections ], [none]) # "exception_store connection closed when thread exits"
+		reloader.stop()
+		del reloader
+		del engine
+		del other
+
+		# Test reloading exceptions from files when they change
+
+		case_path = os.path.join(directory, 'case.txt')
+		split_path = os.path.join(directory, 'split.txt')
+		with open(case_path, 'w', encoding='utf-8') as file:
+			file.write('MacReload\nMacReload, Jo\nA, B, C\n')
+		with open(split_path, 'w', encoding='utf-8') as file:
+			file.write('Reload Smith, Ann\n')
+		engine = NameUtils()
+		engine.namecase_exception('MacKept')
+		reloader = engine.exception_reloader([case_path], [split_path], interval=none)
+		stats = reloader.stats()
+		self.eq([stats['loads'], stats['counts'], stats['rejected'], stats['error']], [1, { case_path: 2, split_path: 1 }, { case_path: [(3, 'A, B, C')], split_path: [] }, none]) # "exception_reloader stats"
+		self.eq(engine.namecase_many(['ann macreload', 'jo macreload', 'ann mackept']), ['Ann MacReload', 'MacReload, Jo', 'Ann MacKept']) # "exception_reloader case"
+		self.eq(engine.namesplit('ann reload smith'), 'Reload Smith, Ann') # "exception_reloader split"
+		self.eq(reloader.check(), 0) # "exception_reloader unchanged"
+		with open(case_path, 'w', encoding='utf-8') as file:
+			file.write('MacReloaded\n')
+		self.eq(reloader.check(), 1) # "exception_reloader changed"
+		self.eq(engine.namecase_many(['ann macreload', 'jo macreload', 'ann macreloaded', 'ann mackept']), ['Ann Macreload', 'Jo Macreload', 'Ann MacReloaded', 'Ann MacKept']) # "exception_reloader replaced"
+		self.eq(engine.namesplit('ann reload smith'), 'Reload Smith, Ann') # "exception_reloader split after reload"
+		os.remove(split_path)
+		self.eq(reloader.check(), 0) # "exception_reloader missing file"
+		self.eq(reloader.stats()['error'] is not none, true) # "exception_reloader error"
+		self.eq(engine.namesplit('ann reload smith'), 'Reload Smith, Ann') # "exception_reloader kept after error"
+
+		tenant = engine.overlay()
+		reloader = tenant.exception_reloader([case_path], interval=0.01)
+		self.eq(tenant.namecase('ann macreloaded mackept'), 'Ann MacReloaded MacKept') # "overlay exception_reloader"
+		engine.namecase_exception('MacBase')
+		with open(case_path, 'w', encoding='utf-8') as file:
+			file.write('MacReloadedAgain\n')
+		for i in range(500):
+			if reloader.stats()['loads'] == 2:
+				break
+			time.sleep(0.01)
+		reloader.stop()
+		self.eq(reloader.stats()['loads'], 2) # "exception_reloader thread"
+		self.eq(tenant.namecase('ann macreloadedagain macbase'), 'Ann MacReloadedAgain MacBase') # "overlay exception_reloader after reload"
+		self.eq(engine.namecase('ann macreloadedagain'), 'Ann Macreloadedagain') # "overlay exception_reloader not in base"
+
+		# Test that reloading keeps exceptions added in other ways, puts back the
+		# ones that the files replaced, and evicts the results that changed
+
+		engine = NameUtils()
+		engine.result_cache(100)
+		engine.namecase_exception('DeKept')
+		with open(case_path, 'w', encoding='utf-8') as file:
+			file.write('MacFirst\nDekept\nMacFirst, Jo\n')
+		reloader = engine.exception_reloader([case_path], interval=none)
+		engine.namecase_exception('DeBar')
+		self.eq([engine.namecase('debar'), engine.namecase('dekept'), engine.namecase('macfirst'), engine.namecase('jo macfirst')], ['DeBar', 'Dekept', 'MacFirst', 'MacFirst, Jo']) # "exception_reloader before reload"
+		with open(case_path, 'w', encoding='utf-8') as file:
+			file.write('MacSecond\n')
+		self.eq(reloader.check(), 1) # "exception_reloader reloaded"
+		names = ['debar', 'dekept', 'macfirst', 'jo macfirst', 'macsecond']
+		self.eq([ engine.namecase(_) for _ in names ], ['DeBar', 'DeKept', 'Macfirst', 'Jo Macfirst', 'MacSecond']) # "exception_reloader keeps other exceptions"
+		self.eq([ engine.namecase_trimmed(_) for _ in names ], [ engine.namecase(_) for _ in names ]) # "exception_reloader result cache"
+		reloader = engine.exception_reloader([], interval=none)
+		self.eq(engine.namecase('macsecond'), 'Macsecond') # "exception_reloader replaced reloader"
+
+		# Test that reloading removes exceptions from a store
+
+		store_path = os.path.join(directory, 'reload.db')
+		engine = NameUtils()
+		engine.exception_store(store_path)
+		with open(case_path, 'w', encoding='utf-8') as file:
+			file.write('MacStored, Jo\n')
+		reloader = engine.exception_reloader([case_path], interval=none)
+		self.eq(engine.namecase('jo macstored'), 'MacStored, Jo') # "exception_reloader store"
+		with open(case_path, 'w', encoding='utf-8') as file:
+			file.write('# None\n')
+		reloader.check()
+		self.eq(engine.namecase('jo macstored'), 'Jo Macstored') # "exception_reloader store removed"
+		other = NameUtils()
+		other.exception_store(store_path)
+		self.eq(other.namecase('jo macstored'), 'Jo Macstored') # "exception_reloader store removed from file"
+		del other
+		os.remove(case_path)
+		del engine
+		del tenant
+		del reloader
+
+		# Test saving and loading snapshots of the data and exceptions
+
+		snapshot_path = os.path.join(directory, 'nameutils.snapshot')
+		engine = NameUtils()
+		self.eq(engine.snapshot_load(snapshot_path), 0) # "snapshot_load missing"
+		engine.namecase_exception('MacSnap')
+		engine.namesplit_exception('Snap Smith, Ann')
+		self.eq(engine.snapshot_save(snapshot_path), 1) # "snapshot_save"
+		engine = NameUtils()
+		tenant = engine.overlay()
+		self.eq(engine.snapshot_load(snapshot_path), 1) # "snapshot_load"
+		self.eq(engine.family_names_v_roman is not none, true) # "snapshot_load data"
+		self.eq(engine.namesplit_many(['ann macsnap', 'ann snap smith', '习近平', 'jo 김']), ['MacSnap, Ann', 'Snap Smith, Ann', '习, 近平', 'Jo, 김']) # "snapshot_load results"
+		self.eq(tenant.namecase('ann macsnap'), 'Ann MacSnap') # "snapshot_load overlays"
+		self.eq(NameUtils(lambda s: unicodedata.normalize('NFD', s)).snapshot_load(snapshot_path), 0) # "snapshot_load other normalization"
+		import subprocess
+		script = "import sys\nsys.path.insert(0, 'src')\nfrom nameutils import *\nprint(NameUtils().snapshot_load(%r), sorted([ _[10:] for _ in sys.modules if _.startswith('nameutils.data_') ]))\n" % snapshot_path
+		self.eq(subprocess.run([sys.executable, '-c', script], capture_output=true, text=true).stdout, "1 ['data_derived_nfc']\n") # "snapshot_load doesn't import the tables"
+		with open(snapshot_path, 'r+b') as file:
+			file.seek(-1, os.SEEK_END)
+			last = file.read(1)
+			file.seek(-1, os.SEEK_END)
+			file.write(bytes([last[0] ^ 1]))
+		self.eq(NameUtils().snapshot_load(snapshot_path), 0) # "snapshot_load damaged"
+		open(snapshot_path, 'w').close()
+		self.eq(NameUtils().snapshot_load(snapshot_path), 0) # "snapshot_load empty"
+		os.remove(snapshot_path)
+		del engine
+		del tenant
+
+		# Test that the big tables are only imported when first needed
+
+		import subprocess
+		script = "import sys\nsys.path.insert(0, 'src')\nfrom nameutils import *\nloaded = lambda: sorted([ _[10:] for _ in sys.modules if _.startswith('nameutils.data_') ])\n"
+		script += "a = loaded()\nnamecase('jo smith')\nb = loaded()\nnamesplit('jo smith')\nc = loaded()\nnamesplit('김철수')\nd = loaded()\nnamesplit('山田太郎')\ne = loaded()\nprint([a, b, c, d, e])\n"
+		self.eq(subprocess.run([sys.executable, '-c', script], capture_output=true, text=true).stdout, "[[], [], ['data_derived_nfc'], ['data_derived_nfc', 'data_derived_nfc_korean'], ['data_derived_nfc', 'data_derived_nfc_chinese', 'data_derived_nfc_korean', 'data_japanese']]\n") # "tables imported when first needed"
+		import nameutils.nameutils
+		self.eq(len(nameutils.nameutils.family_names_vietnamese) > 100, true) # "tables as module attributes"
+
+		# Test the result cache
+
+		engine = NameUtils()
+		self.eq(engine.result_cache_stats(), none) # "result_cache_stats without a cache"
+		engine.result_cache(3)
+		self.eq(engine.namecase('JOHN MACFOO'), 'John Macfoo') # "result_cache namecase"
+		self.eq(engine.namecase(' john  macfoo'), 'John Macfoo') # "result_cache namecase case and spacing"
+		self.eq(engine.result_cache_stats(), { 'hits': 1, 'misses': 1, 'evictions': 0, 'invalidations': 0, 'cached': 1, 'size': 3 }) # "result_cache_stats"
+		self.eq(engine.gnamecase('john macfoo'), 'John Macfoo') # "result_cache gnamecase"
+		self.eq(engine.namesplit('ANN DE LA PIERRE'), 'de la Pierre, Ann') # "result_cache namesplit"
+		self.eq(engine.result_cache_stats()['misses'], 3) # "result_cache mode"
+		self.eq(engine.nameparts('ann de la pierre'), ['de la Pierre', 'Ann']) # "result_cache nameparts"
+		self.eq(engine.namesplit('ann van der haag'), 'van der Haag, Ann') # "result_cache namesplit again"
+		self.eq(engine.result_cache_stats()['evictions'], 1) # "result_cache evictions"
+		self.eq(engine.namesplit_many(['김 John', '김 JOHN']), ['김,  John', '김,  JOHN']) # "result_cache Hangul case"
+		engine.result_cache(10)
+		self.eq(engine.namecase('john macfoo'), 'John Macfoo') # "result_cache replaced"
+		engine.gnamecase('john macfoo')
+		engine.namesplit('ann de la pierre')
+		engine.namecase_exception('MacFoo')
+		self.eq(engine.result_cache_stats()['invalidations'], 2) # "result_cache namecase_exception invalidations"
+		self.eq(engine.namecase('john macfoo'), 'John MacFoo') # "result_cache namecase_exception"
+		self.eq(engine.namesplit('ann de la pierre'), 'de la Pierre, Ann') # "result_cache namecase_exception other names"
+		self.eq(engine.result_cache_stats()['hits'], 1) # "result_cache namecase_exception other names kept"
+		engine.namecase_exception('MacSmyth, Ann')
+		self.eq(engine.fnamecase('MACSMYTH', 'Ann'), 'MacSmyth') # "result_cache fnamecase"
+		self.eq(engine.fnamecase('MACSMYTH', 'Bob'), 'Macsmyth') # "result_cache fnamecase other given names"
+		engine.namecase_exception('MacSmyth, Bob')
+		self.eq(engine.fnamecase('MACSMYTH', 'Bob'), 'MacSmyth') # "result_cache fnamecase individual exception"
+		self.eq(engine.fnamecase('MACSMYTH', 'Ann'), 'MacSmyth') # "result_cache fnamecase individual exception kept"
+		engine.namesplit_exception('Pierre, Ann de la')
+		self.eq(engine.namesplit('ann de la pierre'), 'Pierre, Ann de La') # "result_cache namesplit_exception"
+		self.eq(engine.namesplit('习近平'), '习, 近平') # "result_cache CJK"
+		engine.namesplit_exception('习近, 平')
+		self.eq(engine.namesplit('习近平'), '习近, 平') # "result_cache CJK namesplit_exception"
+		engine.namesplit_exception_many(['Haag, Ann van der'])
+		self.eq(engine.namesplit('ann van der haag'), 'Haag, Ann van Der') # "result_cache namesplit_exception_many"
+		engine.namecase_exception_many(['van der MacHaag'])
+		self.eq(engine.namecase('ann van der machaag'), 'Ann van der MacHaag') # "result_cache namecase_exception_many"
+		engine.normalize('NFD')
+		self.eq(engine.namesplit('ann de la pierre'), 'Pierre, Ann de La') # "result_cache normalize"
+		self.eq(engine.result_cache_stats()['cached'], 1) # "result_cache emptied by normalize"
+		engine.reset_data()
+		self.eq(engine.namesplit('ann de la pierre'), 'Pierre, Ann de La') # "result_cache reset_data"
+		tenant = engine.overlay()
+		tenant.result_cache()
+		self.eq(tenant.namecase('ann macbar'), 'Ann Macbar') # "result_cache overlay"
+		self.eq(tenant.namecase('ann smith'), 'Ann Smith') # "result_cache overlay other names"
+		engine.namecase_exception('MacBar')
+		self.eq(tenant.namecase('ann macbar'), 'Ann MacBar') # "result_cache overlay base exception"
+		self.eq(tenant.result_cache_stats()['invalidations'], 1) # "result_cache overlay invalidations"
+		engine.result_cache(0)
+		self.eq(engine.result_cache_stats(), none) # "result_cache removed"
+
+		# Test invalidation listeners
+
+		invalidated = []
+		engine.invalidation_listen(invalidated.append)
+		engine.namecase_exception('MacListen')
+		engine.namecase_exception('MacListen, Jo')
+		engine.namesplit_exception('Listen Smith, Jo')
+		self.eq(invalidated, [set(['maclisten']), set(['maclisten, jo', 'jo maclisten']), set(['listen smith, jo', 'jo listen smith'])]) # "invalidation_listen"
+		self.eq(engine.invalidation_keys('jo listen smith').issuperset(invalidated[2]), false) # "invalidation_keys natural"
+		self.eq('jo listen smith' in engine.invalidation_keys('Jo Listen Smith'), true) # "invalidation_keys name"
+		self.eq('listen smith, jo' in engine.invalidation_keys('jo listen smith', 'Listen Smith, Jo'), true) # "invalidation_keys result"
+		self.eq(engine.invalidation_keys('Ann Maclisten', given_names='Jo') >= set(['maclisten', 'ann maclisten, jo']), true) # "invalidation_keys words and given names"
+		tenant.invalidation_listen(invalidated.append)
+		engine.namecase_exception('MacTenantListen')
+		self.eq(invalidated[-2:], [set(['mactenantlisten'])] * 2) # "invalidation_listen overlay"
+		engine.normalize('NFC')
+		self.eq(invalidated[-1], none) # "invalidation_listen normalize"
+		count = len(invalidated)
+		engine.invalidation_unlisten(invalidated.append)
+		engine.namecase_exception('MacUnlisten')
+		self.eq(len(invalidated), count) # "invalidation_unlisten"
+		del tenant
+
+		# Test the result cache file
+
+		cache_path = os.path.join(directory, 'results.db')
+		results_path = os.path.join(directory, 'results.tsv')
+		engine = NameUtils()
+		engine.result_cache(100, cache_path)
+		self.eq(engine.namesplit_many(['ann de la pierre', 'ann macfile']), ['de la Pierre, Ann', 'Macfile, Ann']) # "result_cache file"
+		self.eq(engine.result_cache_stats()['stored'], 2) # "result_cache file stored"
+		engine.namecase('ann macfile')
+		self.eq(engine.result_cache_stats()['pending'], 1) # "result_cache file pending"
+		engine.result_cache(100, cache_path)
+		self.eq(engine.namesplit('Ann De La Pierre'), 'de la Pierre, Ann') # "result_cache file results"
+		self.eq(engine.namecase('ann macfile'), 'Ann Macfile') # "result_cache file flushed when replaced"
+		self.eq(engine.result_cache_stats()['file_hits'], 2) # "result_cache file_hits"
+		engine.namecase_exception('MacFile')
+		self.eq(engine.namecase_many(['ann macfile']), ['Ann MacFile']) # "result_cache file namecase_exception"
+		other = NameUtils()
+		other.result_cache(100, cache_path)
+		self.eq(other.namecase('ann macfile'), 'Ann Macfile') # "result_cache file other exceptions"
+		other.namecase_exception('MacFile')
+		self.eq(other.namecase('ann macfile'), 'Ann MacFile') # "result_cache file same exceptions"
+		self.eq(other.result_cache_stats()['file_hits'], 2) # "result_cache file shared"
+		other = NameUtils(lambda s: unicodedata.normalize('NFD', s))
+		other.result_cache(100, cache_path)
+		other.namesplit('ann de la pierre')
+		self.eq(other.result_cache_stats()['file_hits'], 0) # "result_cache file other normalization"
+		engine.namesplit_many(['ann de la pierre', 'ann macfile'])
+		script = "import sys\nsys.path.insert(0, 'src')\nfrom nameutils import *\nresult_cache(100, %r)\nnamecase_exception('MacFile')\nprint(namesplit_many(['ann macfile', 'ann de la pierre', 'bo smith']), result_cache_stats()['file_hits'])\n" % cache_path
+		self.eq(subprocess.run([sys.executable, '-c', script], capture_output=true, text=true).stdout, "['MacFile, Ann', 'de la Pierre, Ann', 'Bo, Smith'] 2\n") # "result_cache file other processes"
+
+		# Test that readers and a writer of a result cache file don't deadlock (with
+		# a delay before the digest is worked out, when a reader could otherwise be
+		# holding the cache's lock while the writer holds the data lock)
+
+		engine = NameUtils()
+		result_key = engine.result_key
+		engine.result_key = lambda: time.sleep(0.01) or result_key()
+		engine.result_cache(100, cache_path)
+
+		def reader_thread():
+			for i in range(20):
+				engine.namecase('ann mac%d' % (i % 3))
+
+		def writer_thread():
+			for i in range(20):
+				engine.namecase_exception('MacLock%d' % i)
+
+		threads = [ threading.Thread(target=_, daemon=true) for _ in [reader_thread, reader_thread, writer_thread] ]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join(30)
+		self.eq([ _.is_alive() for _ in threads ], [false] * 3) # "result_cache file no deadlock"
+
+		# Test that the digest of the exceptions is worked out from the changes, and
+		# that only the results for the newest digests are kept in the file
+
+		engine = NameUtils()
+		other = NameUtils()
+		for _ in [engine, other]:
+			_.namecase_exception('MacDigest')
+			_.namesplit_exception('Digest Smith, Jo')
+		self.eq(engine.exceptions.digest is not none and engine.result_key()[1] == other.result_key()[1], true) # "result_key from changes"
+		other.namecase_exception('MacOther')
+		self.eq(engine.result_key()[1] != other.result_key()[1], true) # "result_key other exceptions"
+		tenant = engine.overlay()
+		engine.namecase_exception('MacBaseDigest')
+		self.eq(tenant.exceptions.digest is not none and tenant.result_key()[1] != engine.result_key()[1], true) # "result_key overlay"
+		engine.result_cache(100, cache_path)
+		for i in range(nameutils.nameutils.result_cache_digests + 4):
+			engine.namecase_exception('MacPrune%d' % i)
+			engine.namecase_many(['ann macprune%d' % i])
+		import sqlite3
+		db = sqlite3.connect(cache_path)
+		self.eq(db.execute('select count(*) from result_keys').fetchone()[0], nameutils.nameutils.result_cache_digests) # "result_cache file pruned"
+		self.eq(db.execute('select count(*) from results where data not in (select id from result_keys)').fetchone()[0], 0) # "result_cache file pruned results"
+		db.close()
+
+		# Test that an engine with a store doesn't share results in the file with an
+		# engine that has different exceptions, and does with one that has the same
+
+		digest_path = os.path.join(directory, 'digest.db')
+		writer = NameUtils()
+		writer.namecase_exception('MacStore, Jo')
+		writer.exception_store(digest_path)
+		del writer
+		other = NameUtils()
+		other.result_cache(100, cache_path)
+		self.eq(other.namecase('jo macstore'), 'Jo Macstore') # "result_cache file without store"
+		other.result_cache(100, cache_path)
+		engine = NameUtils()
+		engine.exception_store(digest_path)
+		engine.result_cache(100, cache_path)
+		self.eq(engine.namecase('jo macstore'), 'MacStore, Jo') # "result_cache file with store"
+		self.eq(engine.result_cache_stats()['file_hits'], 0) # "result_cache file with store not shared"
+		engine.result_cache(100, cache_path)
+		other = NameUtils()
+		other.exception_store(digest_path)
+		other.result_cache(100, cache_path)
+		self.eq(other.namecase('jo macstore'), 'MacStore, Jo') # "result_cache file with same store"
+		self.eq(other.result_cache_stats()['file_hits'], 1) # "result_cache file with same store shared"
+		del tenant
+		del engine
+		del other
+
+		# Test that the generated data matches the data built at runtime (see make derived)
+
+		for form in ['NFC', 'NFD']:
+			engine = NameUtils(form)
+			self.eq(engine.normalization_form, form) # "normalization_form"
+			engine.data_load()
+			built = NameUtils(form)
+			built.normalization_form = none
+			built.data_load()
+			for names in nameutils.nameutils.derived_names.values():
+				for name in names:
+					self.eq(getattr(engine, name), getattr(built, name)) # "generated data matches built data"
+			self.eq(nameutils.nameutils.derived_load(form).kc_table, nameutils.nameutils.kc_table_scan(engine.apostrophe, engine.hyphen)) # "generated kc table matches scanned table"
+			self.eq(engine.snapshot_key(), built.snapshot_key()) # "generated snapshot key matches built key"
+			self.eq(engine.namesplit_many(['ann de la pierre', 'xi jinping', 'nguyen van an', '习近平', '김철수']), built.namesplit_many(['ann de la pierre', 'xi jinping', 'nguyen van an', '习近平', '김철수'])) # "generated data results"
+		self.eq(NameUtils(lambda s: unicodedata.normalize('NFD', s)).normalization_form, none) # "normalization_form with a function"
+		engine = NameUtils(lambda s: unicodedata.normalize('NFD', s))
+		engine.normalize('NFC')
+		self.eq(engine.normalization_form, none) # "normalization_form after a function"
+		engine = NameUtils('NFD')
+		engine.normalize('NFC')
+		self.eq(engine.normalization_form, 'NFC') # "normalization_form after renormalizing"
+		self.eq(NameUtils('NFKC').normalization_form, none) # "normalization_form without generated data"
+
+		# Test warmup() and result_cache_save()
+
+		engine = NameUtils()
+		self.eq(engine.warmup(), 0) # "warmup"
+		self.eq(engine.family_names_ck_roman_re is not none and engine.family_names_ck_first_rec is not none and engine.exceptions.namecase_exceptions_rec is not none, true) # "warmup data"
+		self.eq(engine.result_cache_save(results_path), 0) # "result_cache_save without a result cache"
+		engine.result_cache(100)
+		engine.namecase_many(['ann de la pierre', 'bo "smith"'])
+		engine.namesplit_many(['ann de la pierre', '习近平'])
+		engine.fnamecase('macdonald', 'John')
+		self.eq(engine.result_cache_save(results_path), 5) # "result_cache_save"
+		other = NameUtils()
+		self.eq(other.warmup(results_path), 5) # "warmup results"
+		self.eq([other.namecase('Ann de la Pierre'), other.namecase('BO "SMITH"'), other.namesplit('ann de la pierre'), other.namesplit('习近平'), other.fnamecase('macdonald', 'John')], ['Ann de la Pierre', 'Bo "Smith"', 'de la Pierre, Ann', '习, 近平', 'MacDonald']) # "warmup results used"
+		self.eq(other.result_cache_stats()['hits'], 5) # "warmup results cached"
+		other = NameUtils()
+		other.namecase_exception('MacDonalD')
+		self.eq(other.warmup(results_path), 5) # "warmup stale results"
+		self.eq(other.fnamecase('macdonald', 'John'), 'MacDonalD') # "warmup stale results worked out again"
+		self.eq(other.result_cache_stats()['hits'], 1) # "warmup stale results cached"
+		with open(results_path, 'w', encoding='utf-8') as file:
+			file.write('# Names\nann smith\nbo jones\n')
+		other = NameUtils()
+		self.eq(other.warmup(results_path, 0), 0) # "warmup seconds"
+		self.eq(other.warmup(results_path), 4) # "warmup names"
+		self.eq(other.result_cache_stats()['cached'], 4) # "warmup names cached"
+
+		# Test that warmup(freeze=True) leaves little for a forked process to build
+		# or copy (by measuring the private memory of a worker after a collection
+		# and its first names, with and without warmup)
+
+		if hasattr(os, 'fork') and os.path.exists('/proc/self/smaps_rollup') and sys.version_info >= (3, 7):
+			script = "import sys, os, gc\nsys.path.insert(0, 'src')\nfrom nameutils import *\n%s\ndef private():\n\twith open('/proc/self/smaps_rollup') as file:\n\t\treturn sum([ int(_.split()[1]) for _ in file if _.startswith(('Private_Clean:', 'Private_Dirty:')) ])\npid = os.fork()\nif pid == 0:\n\tbefore = private()\n\tgc.collect()\n\tnamesplit_many(['xi jinping', '习近平', '김철수', '山田太郎', 'nguyen van an', 'ann de la pierre'])\n\tprint(private() - before)\n\tsys.stdout.flush()\n\tos._exit(0)\nos.waitpid(pid, 0)\n"
+			(cold, warm) = [ int(subprocess.run([sys.executable, '-c', script % code], capture_output=true, text=true).stdout) for code in ["namecase('john smith')", 'warmup(freeze=True)'] ]
+			self.eq(warm < cold / 4, true) # "warmup freeze private memory per worker"
+		del engine
+		del other
+		del built
+		import gc
+		gc.collect()
+		os.remove(path)
+		os.remove(store_path)
+		os.remove(digest_path)
+		os.remove(results_path)
+		for suffix in ['', '-wal', '-shm']:
+			if os.path.exists(cache_path + suffix):
+				os.remove(cache_path + suffix)
+		os.rmdir(directory)
+
+if __name__ == '__main__': # Not when imported by the process pool (without fork)
+	unittest.main()
 
 # vim:set ts=4 sw=4 fenc=utf8: